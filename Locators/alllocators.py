@@ -1,8 +1,13 @@
 from selenium.webdriver.common.by import By
+
+BASE_URL="https://www.saucedemo.com/"
+
 class LoginPageLocators:
-    loginpageUrl="https://www.saucedemo.com/"
+    loginpageUrl=BASE_URL
     valid_username="standard_user"
     valid_password="secret_sauce"
+    # what the site keeps its login in; BasePage.deep_link seeds it directly
+    session_cookie="session-username"
 
 
     username_field = (By.ID,"user-name")
@@ -16,7 +21,7 @@ class LoginPageLocators:
     show_password_path=(By.XPATH,'//*[@id="password"]')
 
 class ProductPageLocators:
-    ProductPageUrl="https://www.saucedemo.com/inventory.html"
+    ProductPageUrl=BASE_URL+"inventory.html"
     title_path=(By.XPATH,'//*[@id="header_container"]/div[2]/span')
     inventory_count_path=(By.CLASS_NAME,'inventory_item')
     cart_count_path=(By.CLASS_NAME,'shopping_cart_badge')
@@ -73,8 +78,12 @@ class ProductPageLocators:
     inventory_price_class_path=(By.CLASS_NAME, 'inventory_item_price')
     inventory_add_to_cart_button=(By.ID, 'add-to-cart')
     inventory_add_to_remove_button=(By.ID, 'remove')
+    item_detail_url=BASE_URL+"inventory-item.html?id="
 
 class CartPageLocators:
+    cart_page_url=BASE_URL+"cart.html"
+    # localStorage entry holding the cart as a JSON list of item ids, e.g. [4, 5]
+    cart_storage_key="cart-contents"
     cart_page_title=(By.XPATH,'//*[@id="header_container"]/div[2]/span')
     continue_shopping_path=(By.ID,'continue-shopping')
     checkout_path=(By.ID,'checkout')
@@ -82,7 +91,7 @@ class CartPageLocators:
     second_item_path=(By.XPATH,'//*[@id="item_0_title_link"]/div')
 
 class CheckoutPageLocators:
-    checkout_page_url="https://www.saucedemo.com/checkout-step-one.html"
+    checkout_page_url=BASE_URL+"checkout-step-one.html"
     valid_first_name="Eric"
     valid_last_name="Rocks"
     valid_zip_code="44600"
@@ -96,10 +105,10 @@ class CheckoutPageLocators:
     error_cancel_button=(By.XPATH,'//*[@id="checkout_info_container"]/div/form/div[1]/div[4]/h3/button')
 
 class CheckoutOverviewPageLocators:
-    checkout_overview_url='https://www.saucedemo.com/checkout-step-two.html'
+    checkout_overview_url=BASE_URL+'checkout-step-two.html'
     checkout_overview_title=(By.XPATH,'//*[@id="header_container"]/div[2]/span')
 
-    payment_page_url = 'https://www.saucedemo.com/checkout-step-two.html'
+    payment_page_url = BASE_URL+'checkout-step-two.html'
     payment_info_path = (By.XPATH, '//*[@id="checkout_summary_container"]/div/div[2]/div[2]')
     shipping_info_path = (By.XPATH, '//*[@id="checkout_summary_container"]/div/div[2]/div[4]')
     payment_title = (By.XPATH, '//*[@id="header_container"]/div[1]/div[2]/div')
@@ -108,7 +117,7 @@ class CheckoutOverviewPageLocators:
 
 
 class FinishPageLocators:
-    finish_page_url='https://www.saucedemo.com/checkout-complete.html'
+    finish_page_url=BASE_URL+'checkout-complete.html'
     finish_page_title=(By.XPATH,'//*[@id="header_container"]/div[2]/span')
     back_home_button=(By.XPATH,'//*[@id="back-to-products"]')
     Thank_message=(By.CLASS_NAME,'complete-header')
@@ -130,4 +139,14 @@ class OtherPageLocators:
     copyright_path=(By.XPATH,'//*[@id="page_wrapper"]/footer/div')
 
 
-
+def set_base_url(base_url):
+    """Point every page url above at another deployment, e.g. the local stand-in"""
+    global BASE_URL
+    if not base_url.endswith("/"):
+        base_url += "/"
+    for locators in (LoginPageLocators, ProductPageLocators, CartPageLocators, CheckoutPageLocators,
+                     CheckoutOverviewPageLocators, FinishPageLocators, OtherPageLocators):
+        for name, value in list(vars(locators).items()):
+            if isinstance(value, str) and value.startswith(BASE_URL):
+                setattr(locators, name, base_url + value[len(BASE_URL):])
+    BASE_URL = base_url
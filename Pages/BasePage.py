@@ -1,53 +1,208 @@
-from selenium.common import TimeoutException
+import time
+
+from selenium.common import StaleElementReferenceException, TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+
+from Locators.alllocators import CartPageLocators, LoginPageLocators, ProductPageLocators
+from Utils.command_counter import charge_first_poll
+from Utils.step_timer import step_timer
+
+# Reads every container matching arguments[0] (or just arguments[2] when no selector is given) into a
+# plain record in one round-trip. arguments[1] maps record key -> [css selector inside the container
+# ('' for the container itself), 'text' for rendered text or a DOM property name such as 'src' or 'id'].
+RECORDS_SCRIPT = """
+var selector = arguments[0], fields = arguments[1], root = arguments[2] || document;
+var containers = selector ? root.querySelectorAll(selector) : [root];
+return Array.prototype.map.call(containers, function (container) {
+    var record = {};
+    Object.keys(fields).forEach(function (key) {
+        var element = fields[key][0] ? container.querySelector(fields[key][0]) : container;
+        var property = fields[key][1];
+        if (!element) {
+            record[key] = '';
+        } else if (property === 'text') {
+            record[key] = (element.innerText || element.textContent).trim();
+        } else {
+            record[key] = element[property] || '';
+        }
+    });
+    return record;
+});
+"""
+
+
+SEED_CART_SCRIPT = """
+if (arguments[1].length) {
+    window.localStorage.setItem(arguments[0], JSON.stringify(arguments[1]));
+} else {
+    window.localStorage.removeItem(arguments[0]);
+}
+"""
+
+# Records, instead of following, clicks on links that leave the site or open a window (target=_blank)
+# and window.open calls, so external links can be checked without loading third-party pages.
+# Installed once per document; a page load removes it.
+INTERCEPT_NAVIGATION_SCRIPT = """
+if (!window.__interceptedNavigations) {
+    window.__interceptedNavigations = [];
+    var record = function (url) { window.__interceptedNavigations.push(new URL(url, location.href).href); };
+    document.addEventListener('click', function (event) {
+        var link = event.target.closest && event.target.closest('a[href]');
+        if (link && (link.target === '_blank' || link.origin !== location.origin)) {
+            event.preventDefault();
+            record(link.href);
+        }
+    }, true);
+    window.open = function (url) { record(url || 'about:blank'); return null; };
+}
+"""
+
+TAKE_INTERCEPTED_SCRIPT = "return (window.__interceptedNavigations || []).splice(0);"
+
+
 class BasePage:
+    # --navigation deep-link: fixtures reach pages with open() instead of clicking through the app
+    deep_link_navigation = False
+    # --external-links intercept: follow_external_link records the target instead of loading it
+    intercept_external_links = True
+    # seconds wait_visible waits for an element to show up, and wait_absent for a visible one to go away
+    visible_timeout = 10
+    absent_timeout = 2
+    poll_frequency = 0.2
+    # --step-timings: (kind, locator or target, seconds, result) of every explicit wait, for the timing summary
+    record_wait_timings = False
+    wait_timings = []
+
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(self.driver, 10)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # page objects imported after --step-timings switched the timer on still get timed
+        if step_timer.enabled:
+            step_timer.instrument(cls)
+
     def find_element(self,locator):
         try:
-            return self.wait.until(EC.presence_of_element_located(locator))
+            return self._until("present",locator,EC.presence_of_element_located(locator))
         except TimeoutException:
             raise Exception(f"Timed Out. waiting for Element {locator} not found")
 
     def find_elements(self,locator):
         try:
-            return self.wait.until(EC.presence_of_all_elements_located(locator))
+            return self._until("present",locator,EC.presence_of_all_elements_located(locator))
         except TimeoutException:
             raise Exception(f"Timed Out waiting for Elements {locator} not found")
 
     def click_element(self,locator):
         try:
-            self.wait.until(EC.element_to_be_clickable(locator)).click()
+            self._until("clickable",locator,EC.element_to_be_clickable(locator)).click()
         except TimeoutException:
             raise Exception(f"Failed to click Element {locator} not found")
 
     def type_in_element(self,locator,text):
         try:
-            element=self.wait.until(EC.presence_of_element_located(locator))
+            element=self._until("present",locator,EC.presence_of_element_located(locator))
             element.clear()
             element.send_keys(text)
         except TimeoutException:
             raise Exception(f"Failed to type into element {locator} with text {text} not found")
 
     def get_text_from_element(self,locator):
+        element=self.wait_visible(locator)
+        if element is None:
+            raise Exception(f"Couldn't get text from element {locator}")
+        return element.text
+
+    def wait_visible(self,locator,timeout=None):
+        """Wait for the element to be visible and return it, or None after the timeout"""
+        start=time.perf_counter()
+        try:
+            element=WebDriverWait(self.driver,self.visible_timeout if timeout is None else timeout,
+                                  self.poll_frequency).until(
+                charge_first_poll(self.driver,EC.visibility_of_element_located(locator)))
+        except TimeoutException:
+            print(f"Timed Out. waiting for {locator} to be visible")
+            element=None
+        self._record_wait("visible",locator,start,element is not None)
+        return element
+
+    def wait_absent(self,locator,timeout=None):
+        """True once the element is gone or hidden; checks the DOM right away before waiting at all"""
+        start=time.perf_counter()
+        if not self._displayed_now(locator):
+            absent=True
+        else:
+            try:
+                absent=WebDriverWait(self.driver,self.absent_timeout if timeout is None else timeout,
+                                     self.poll_frequency).until(
+                    charge_first_poll(self.driver,EC.invisibility_of_element_located(locator))) is not False
+            except TimeoutException:
+                print(f"Timed Out. waiting for {locator} to go away")
+                absent=False
+        self._record_wait("absent",locator,start,absent)
+        return absent
+
+    def _displayed_now(self,locator):
+        for element in self.driver.find_elements(*locator):
+            try:
+                if element.is_displayed():
+                    return True
+            except StaleElementReferenceException:
+                # removed between find_elements and is_displayed (a menu closing, an error being cleared): gone
+                continue
+        return False
+
+    def is_present_now(self,locator):
+        """Whether the element is in the DOM at this moment, without waiting"""
+        return len(self.driver.find_elements(*locator))>0
+
+    def _record_wait(self,kind,locator,start,result):
+        if BasePage.record_wait_timings:
+            BasePage.wait_timings.append((kind,locator,time.perf_counter()-start,result))
+        if not result:
+            self.wait_failed()
+
+    def _until(self,kind,target,condition):
+        """self.wait.until(condition), recorded in wait_timings; a TimeoutException is left to the caller"""
+        start=time.perf_counter()
+        result=False
         try:
-            return self.wait.until(EC.visibility_of_element_located(locator)).text
+            result=self.wait.until(charge_first_poll(self.driver,condition))
+            return result
+        finally:
+            self._record_wait(kind,target,start,result is not False)
+
+    def get_records(self,container_selector,fields,root=None):
+        """Read all matching containers into a list of dicts with a single execute_script call.
+        root limits the search to one element; with no container_selector, root itself is the one record."""
+        try:
+            return self._until("records",container_selector or root,
+                               lambda driver: driver.execute_script(RECORDS_SCRIPT, container_selector, fields, root))
         except TimeoutException:
-            print(f"Couldn't get text from element {locator}")
-            return 0
+            raise Exception(f"Timed Out waiting for records {container_selector} not found")
+
+    def deep_link(self,url,ready_locator,cart=()):
+        """Go straight to url as the standard user with cart (item ids) in storage, then check one element"""
+        if not self.driver.current_url.startswith(LoginPageLocators.loginpageUrl):
+            self.driver.get(LoginPageLocators.loginpageUrl)
+        self.driver.add_cookie({"name": LoginPageLocators.session_cookie, "value": LoginPageLocators.valid_username,
+                                "path": "/"})
+        self.driver.execute_script(SEED_CART_SCRIPT, CartPageLocators.cart_storage_key, list(cart))
+        self.driver.get(url)
+        self.find_element(ready_locator)
+        self.page_changed()
+        return self
 
     def get_count(self,locator):
         return len(self.find_elements(locator))
 
     def is_displayed(self,locator):
-        try:
-            return self.wait.until(EC.visibility_of_element_located(locator)).is_displayed()
-        except TimeoutException:
-            print(f"'{locator} is not displayed'")
-            return False
+        # positive check: waits up to visible_timeout; assert absence with wait_absent instead of `not is_displayed`
+        element=self.wait_visible(locator)
+        return element is not None and element.is_displayed()
 
     def find_element_by_class_name(self,class_name):
         return self.driver.find_elements(class_name)
@@ -66,8 +221,94 @@ class BasePage:
         self.driver.refresh()
     def wait_for_page_load(self,text):
         try:
-            self.wait.until(EC.url_contains(text))
+            self._until("url_contains",text,EC.url_contains(text))
+            self.page_changed()
             return True
         except TimeoutException:
             print(f"Timed Out. waiting for {text} not found")
             return False
+
+    def page_changed(self):
+        """Tell a CheckpointRunner driving this browser that a page transition finished"""
+        checkpoints = getattr(self.driver, "checkpoints", None)
+        if checkpoints is not None:
+            checkpoints.page_changed()
+
+    def wait_failed(self):
+        """Tell a CheckpointRunner driving this browser that a wait gave up, even if the helper only returned False"""
+        checkpoints = getattr(self.driver, "checkpoints", None)
+        if checkpoints is not None:
+            checkpoints.wait_failed()
+
+    def wait_for_cart_badge(self,count):
+        """Wait until the cart badge shows count (0 means the badge is gone)"""
+        try:
+            self._until("cart_badge",count,lambda driver: self._cart_badge_text(driver) == (str(count) if count else ""))
+            return True
+        except TimeoutException:
+            print(f"Timed Out. waiting for cart badge to show {count}")
+            return False
+
+    def get_cart_badge_count(self):
+        """Number on the cart badge right now, 0 when there is no badge"""
+        text=self._cart_badge_text(self.driver)
+        return int(text) if text else 0
+
+    @staticmethod
+    def _cart_badge_text(driver):
+        badges = driver.find_elements(*ProductPageLocators.cart_count_path)
+        return badges[0].text if badges else ""
+
+    def wait_for_url_change(self,old_url):
+        try:
+            self._until("url_change",old_url,EC.url_changes(old_url))
+            self.page_changed()
+            return True
+        except TimeoutException:
+            print(f"Timed Out. waiting for url to change from {old_url}")
+            return False
+
+    def wait_for_staleness(self,element):
+        try:
+            self._until("stale",element.id,EC.staleness_of(element))
+            return True
+        except TimeoutException:
+            print(f"Timed Out. waiting for element {element} to go stale")
+            return False
+
+    def follow_external_link(self,click):
+        """URL that click() sends the browser to, in a new window or this one. With intercept_external_links
+        the navigation is captured in the page and never leaves the browser; otherwise it is really opened,
+        read and closed again."""
+        if self.intercept_external_links:
+            self.driver.execute_script(INTERCEPT_NAVIGATION_SCRIPT)
+            click()
+            urls = self.driver.execute_script(TAKE_INTERCEPTED_SCRIPT)
+            if not urls:
+                raise Exception(f"Click did not navigate away from {self.get_current_url()}")
+            return urls[-1]
+        main_window = self.driver.current_window_handle
+        old_url = self.driver.current_url
+        window_count = len(self.driver.window_handles)
+        click()
+        try:
+            self._until("navigation",old_url,
+                        lambda driver: len(driver.window_handles) > window_count or driver.current_url != old_url)
+        except TimeoutException:
+            raise Exception(f"Click did not navigate away from {old_url}")
+        if len(self.driver.window_handles) == window_count:
+            return self.driver.current_url
+        self.driver.switch_to.window(self.switch_to_new_window(main_window))
+        self.wait_for_url_change("about:blank")
+        url = self.driver.current_url
+        self.driver.close()
+        self.driver.switch_to.window(main_window)
+        return url
+
+    def wait_for_new_window(self,previous_count):
+        try:
+            self._until("new_window",previous_count,lambda driver: len(driver.window_handles) > previous_count)
+            return True
+        except TimeoutException:
+            print(f"Timed Out. waiting for a window beyond the {previous_count} already open")
+            return False
@@ -1,13 +1,28 @@
 from selenium.webdriver.common.by import By
 
-from Locators.alllocators import CartPageLocators, ProductPageLocators
+from Locators.alllocators import CartPageLocators
 from Pages.BasePage import BasePage
+from Utils.command_counter import command_budget
+from Utils.models import CartLine, Product, to_cents
 
 
 class CartPage(BasePage):
+    # one record per cart row, read by get_cart_items in a single round-trip
+    cart_fields = {
+        'name': ['.inventory_item_name', 'text'],
+        'description': ['.inventory_item_desc', 'text'],
+        'price': ['.inventory_item_price', 'text'],
+        'quantity': ['.cart_quantity', 'text'],
+        'button_id': ["button[id^='remove-']", 'id'],
+    }
+
     # def get_cart_page_url(self):
     #     return self.driver.current_url
 
+    def open(self,cart=()):
+        """Deep-link to the cart holding these item ids"""
+        return self.deep_link(CartPageLocators.cart_page_url,CartPageLocators.checkout_path,cart)
+
     def cart_title(self):
         return self.get_text_from_element(CartPageLocators.cart_page_title)
 
@@ -18,31 +33,21 @@ class CartPage(BasePage):
         self.click_element(CartPageLocators.checkout_path)
 
     def get_cart_count(self):
-        try:
-            return int(self.get_text_from_element(ProductPageLocators.cart_count_path))
-        except:
-            return 0
+        return self.get_cart_badge_count()
 
     def remove_item(self,locator):
         self.driver.find_element(locator).click()
 
     # NEW METHODS FOR CART ITEM MANAGEMENT
+    @command_budget(3)
     def get_cart_items(self):
-        """Get all items in cart with their details"""
-        cart_items = []
-        item_containers = self.find_elements((By.CLASS_NAME, 'cart_item'))
-
-        for container in item_containers:
-            item_details = {
-                'name': container.find_element(By.CLASS_NAME, 'inventory_item_name').text,
-                'description': container.find_element(By.CLASS_NAME, 'inventory_item_desc').text,
-                'price': container.find_element(By.CLASS_NAME, 'inventory_item_price').text,
-                'quantity': container.find_element(By.CLASS_NAME, 'cart_quantity').text,
-                'remove_button': container.find_element(By.XPATH, ".//button[starts-with(@id, 'remove-')]")
-            }
-            cart_items.append(item_details)
-
-        return cart_items
+        """Get all items in cart as CartLines"""
+        return [CartLine(Product(name=record['name'],
+                                 description=record['description'],
+                                 price_cents=to_cents(record['price']),
+                                 button_id=record['button_id']),
+                         int(record['quantity'] or 1))
+                for record in self.get_records('.cart_item', self.cart_fields)]
 
     def remove_item_by_name(self, item_name):
         """Remove specific item from cart by name"""
@@ -67,23 +72,17 @@ class CartPage(BasePage):
 
     def get_item_details_from_cart(self, item_name):
         """Get item details from cart for comparison"""
-        cart_item = self.find_element((By.XPATH,
-                                       f"//div[@class='inventory_item_name' and text()='{item_name}']/ancestor::div[@class='cart_item']"))
-
-        details = {
-            'name': cart_item.find_element(By.CLASS_NAME, 'inventory_item_name').text,
-            'description': cart_item.find_element(By.CLASS_NAME, 'inventory_item_desc').text,
-            'price': cart_item.find_element(By.CLASS_NAME, 'inventory_item_price').text,
-            'quantity': cart_item.find_element(By.CLASS_NAME, 'cart_quantity').text
-        }
-        return details
+        for item in self.get_cart_items():
+            if item.name == item_name:
+                return item
+        raise Exception(f"Item {item_name} not found in cart")
 
     def remove_all_items_from_cart(self):
         """Remove all items from cart"""
         cart_items = self.get_cart_items()
         for item in cart_items:
-            item['remove_button'].click()
-            print(f"Removed {item['name']} from cart")
+            self.click_element((By.ID, item.product.button_id))
+            print(f"Removed {item.name} from cart")
 
     def verify_cart_is_empty(self):
         """Verify that cart is empty"""
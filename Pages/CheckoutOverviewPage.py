@@ -1,8 +1,18 @@
-from Locators.alllocators import CheckoutOverviewPageLocators, ProductPageLocators
+from Locators.alllocators import CheckoutOverviewPageLocators
 from Pages.BasePage import BasePage
+from Utils.models import to_cents
 
 
 class CheckoutOverviewPage(BasePage):
+    overview_fields = {
+        'name': ['.inventory_item_name', 'text'],
+        'price': ['.inventory_item_price', 'text'],
+    }
+
+    def open(self,cart=()):
+        """Deep-link to checkout-step-two with these item ids in the cart"""
+        return self.deep_link(CheckoutOverviewPageLocators.checkout_overview_url,
+                              CheckoutOverviewPageLocators.finish_button_path,cart)
 
     def click_finish_button(self):
         self.click_element(CheckoutOverviewPageLocators.finish_button_path)
@@ -19,14 +29,13 @@ class CheckoutOverviewPage(BasePage):
         # Get item names from overview page
 
     def get_item_names(self):
-        elements = self.find_elements(ProductPageLocators.inventory_name_class_path)
-        return [e.text for e in elements]
+        return [record['name'] for record in self.get_records('.cart_item', self.overview_fields)]
 
         #  Get item prices from overview page
 
     def get_item_prices(self):
-        elements = self.find_elements(ProductPageLocators.inventory_price_class_path)
-        return [e.text for e in elements]
+        """Item prices in cents"""
+        return [to_cents(record['price']) for record in self.get_records('.cart_item', self.overview_fields)]
 
         #  Get payment info (static)
 
@@ -42,18 +51,18 @@ class CheckoutOverviewPage(BasePage):
 
     def get_item_total(self):
         item_text = self.get_text_from_element(("class name", "summary_subtotal_label"))
-        return float(item_text.split("$")[1])
+        return to_cents(item_text)
 
         #  Get tax
 
     def get_tax(self):
         tax_text = self.get_text_from_element(("class name", "summary_tax_label"))
-        return float(tax_text.split("$")[1])
+        return to_cents(tax_text)
 
         # Get total (item total + tax)
 
     def get_total(self):
         total_text = self.get_text_from_element(("class name", "summary_total_label"))
-        return float(total_text.split("$")[1])
+        return to_cents(total_text)
 
 
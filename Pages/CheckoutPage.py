@@ -3,6 +3,9 @@ from Pages.BasePage import BasePage
 
 
 class CheckoutPage(BasePage):
+    def open(self,cart=()):
+        """Deep-link to checkout-step-one with these item ids in the cart"""
+        return self.deep_link(CheckoutPageLocators.checkout_page_url,CheckoutPageLocators.first_name_path,cart)
     def checkout_title(self):
         return self.get_text_from_element(CheckoutPageLocators.checkout_title)
     def click_cart_icon(self):
@@ -1,8 +1,11 @@
-from Locators.alllocators import FinishPageLocators, ProductPageLocators
+from Locators.alllocators import FinishPageLocators
 from Pages.BasePage import BasePage
 
 
 class FinishPage(BasePage):
+    def open(self):
+        """Deep-link to checkout-complete with an empty cart"""
+        return self.deep_link(FinishPageLocators.finish_page_url,FinishPageLocators.back_home_button)
     def is_thank_you_displayed(self):
         return self.is_displayed(FinishPageLocators.Thank_message)
     def click_back_home(self):
@@ -10,6 +13,6 @@ class FinishPage(BasePage):
     def get_finish_title(self):
         return self.get_text_from_element(FinishPageLocators.finish_page_title)
     def get_final_cart_count(self):
-        return int(self.get_text_from_element(ProductPageLocators.cart_count_path))
+        return self.get_cart_badge_count()
     # def get_finish_url(self):
     #     return self.get_current_url()
\ No newline at end of file
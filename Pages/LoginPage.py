@@ -1,9 +1,14 @@
 
-from Locators.alllocators import LoginPageLocators
+from Locators.alllocators import LoginPageLocators, ProductPageLocators
 from Pages.BasePage import BasePage
 
 
 class LoginPage(BasePage):
+    # username -> cookies captured from one real UI login, replayed by fast_login for the rest of the session
+    auth_cookies = {}
+    # switched off by --ui-login to drive the real form everywhere
+    use_fast_login = True
+
     def login(self,username,password):
         self.type_in_element(LoginPageLocators.username_field,username)
         self.type_in_element(LoginPageLocators.password_field,password)
@@ -12,6 +17,32 @@ class LoginPage(BasePage):
     def login_with_valid_data(self):
         self.login(LoginPageLocators.valid_username,LoginPageLocators.valid_password)
 
+    def fast_login(self,username=LoginPageLocators.valid_username,password=LoginPageLocators.valid_password):
+        """Log in by replaying the session-username cookie and going straight to the product page"""
+        cookies = LoginPage.auth_cookies.get(username)
+        if not LoginPage.use_fast_login or cookies is None:
+            self.login(username,password)
+            if not self.is_login_successful():
+                raise Exception(f"Login through the form failed for user {username}")
+            if LoginPage.use_fast_login:
+                LoginPage.auth_cookies[username] = self.capture_auth_cookies()
+            self.page_changed()
+            return
+        for cookie in cookies:
+            self.driver.add_cookie(cookie)
+        self.driver.get(ProductPageLocators.ProductPageUrl)
+        self.page_changed()
+        print(f"Logged in as {username} with saved session cookie")
+
+    def capture_auth_cookies(self):
+        # saucedemo gives session-username a 10 minute expiry; drop it so the replayed cookie lives as long as the browser
+        cookies = []
+        for cookie in self.driver.get_cookies():
+            cookie = dict(cookie)
+            cookie.pop("expiry", None)
+            cookies.append(cookie)
+        return cookies
+
     def get_error_message(self):
         return self.get_text_from_element(LoginPageLocators.error_field_path)
     def is_error_displayed(self):
@@ -22,7 +53,7 @@ class LoginPage(BasePage):
     def click_show_password(self):
         self.click_element(LoginPageLocators.show_password_path)
     def dismiss_error_message(self):
-        if self.is_displayed(LoginPageLocators.error_cancel_path):
+        if self.is_present_now(LoginPageLocators.error_cancel_path):
             self.click_element(LoginPageLocators.error_cancel_path)
     def is_login_successful(self):
         return self.wait_for_page_load("inventory")
@@ -5,10 +5,16 @@ from Pages.BasePage import BasePage
 
 
 class OtherPage(BasePage):
+    # <li class="social_twitter"><a href=...> per network in the footer
+    social_fields = {
+        'network': ['', 'className'],
+        'href': ['a', 'href'],
+    }
+
     # def get_current_url(self):
     #     return self.driver.current_url
     def get_cart_count(self):
-        return int(self.get_text_from_element(ProductPageLocators.cart_count_path))
+        return self.get_cart_badge_count()
     def click_menu_button(self):
         self.click_element(OtherPageLocators.menu_button_path)
     def go_to_all_item(self):
@@ -39,6 +45,11 @@ class OtherPage(BasePage):
     def click_linkedin_logo(self):
         self.click_element(OtherPageLocators.linkedin_path)
 
+    def get_footer_links(self):
+        """{'twitter': href, 'facebook': href, 'linkedin': href} read from the footer in one call"""
+        records = self.get_records('footer .social li', self.social_fields)
+        return {record['network'].removeprefix('social_'): record['href'] for record in records}
+
     def window_handle(self,driver,main_window):
         for window_handle in driver.window_handles:
             if window_handle != main_window:
@@ -4,9 +4,26 @@ from selenium.webdriver.support.ui import Select
 
 from Locators.alllocators import ProductPageLocators
 from Pages.BasePage import BasePage
+from Utils.models import Product, to_cents
 
 
 class ProductPage(BasePage):
+    # one record per inventory card, read by get_inventory_products in a single round-trip
+    inventory_fields = {
+        'name': ['.inventory_item_name', 'text'],
+        'description': ['.inventory_item_desc', 'text'],
+        'price': ['.inventory_item_price', 'text'],
+        'image': ['.inventory_item_img img', 'src'],
+        'button_id': ['button', 'id'],
+        'item_id': ["a[id$='_title_link']", 'id'],
+    }
+
+    def open(self,item_id=None,cart=()):
+        """Deep-link to the inventory, or to the detail page of item_id (4 is the backpack)"""
+        if item_id is None:
+            return self.deep_link(ProductPageLocators.ProductPageUrl,ProductPageLocators.select_filter_path,cart)
+        return self.deep_link(f"{ProductPageLocators.item_detail_url}{item_id}",ProductPageLocators.back_to_product,cart)
+
     # def product_title(self):
     #     return self.find_element(ProductPageLocators.title_path)
     def get_page_title(self):
@@ -66,7 +83,7 @@ class ProductPage(BasePage):
         print("click on cart button")
 
     def get_cart_count(self):
-        return int(self.get_text_from_element(ProductPageLocators.cart_count_path))
+        return self.get_cart_badge_count()
         #return self.get_count(ProductPageLocators.cart_count_path)
 
     def select_filter_button(self,visible_text):
@@ -74,23 +91,25 @@ class ProductPage(BasePage):
         select = Select(dropdown)
         select.select_by_visible_text(visible_text)
 
+    @staticmethod
+    def _product(record):
+        return Product(name=record['name'],
+                       description=record['description'],
+                       price_cents=to_cents(record['price']) if record['price'] else 0,
+                       image=record['image'],
+                       item_id=record['item_id'].replace('_title_link', ''),
+                       button_id=record['button_id'])
+
+    def get_inventory_products(self):
+        """Every inventory item as a Product, in page order"""
+        return [self._product(record) for record in self.get_records('.inventory_item', self.inventory_fields)]
+
     def get_all_items_names(self):
-        elements=self.find_elements(ProductPageLocators.all_item_name_class_path)
-        items_list=[]
-        for element in elements:
-            items_list.append(element.text)
-        return items_list
+        return [product.name for product in self.get_inventory_products()]
 
     def get_all_items_price(self):
-        elements=self.find_elements(ProductPageLocators.all_item_price_class_path)
-        prices_list=[]
-        for element in elements:
-            price_text = element.text.replace("$", "")
-            try:
-                prices_list.append(float(price_text))
-            except ValueError:
-                prices_list.append(0.0)
-        return prices_list
+        """Prices in cents, in page order"""
+        return [product.price_cents for product in self.get_inventory_products()]
 
     def is_sorted_descending(self,list1) :
         sorted_copy=list1
@@ -107,25 +126,13 @@ class ProductPage(BasePage):
 
 
     def get_product_name(self):
-        elements=self.find_element_by_class_name(ProductPageLocators.inventory_name_class_path)
-        return [element.text for element in elements]
+        return self.get_all_items_names()
     def get_product_price(self):
-        elements=self.find_element_by_class_name(ProductPageLocators.inventory_price_class_path)
-        price=[]
-        for element in elements:
-            price_text=element.text.replace("$", "")
-            price.append(float(price_text))
-        return price
+        return self.get_all_items_price()
     def get_product_details(self,product_name):
-        products=self.find_element_by_class_name(ProductPageLocators.inventory_desc_class_path)
-        for product in products:
-            name_element = product.find_element_by_class_name("inventory_item_name")
-            if name_element == product_name:
-                return {"name":name_element.text,
-                    "description":product.find_element_by_class_name("inventory_item_description").text,
-                    "price":product.find_element_by_class_name("inventory_item_price").text,
-                    "image":product.find_element_by_class_name("inventory_item_image").get_attribute("src")
-                }
+        for product in self.get_inventory_products():
+            if product.name == product_name:
+                return product
         return None
 
     def click_item_by_name(self,item_name):
@@ -138,27 +145,18 @@ class ProductPage(BasePage):
         print(f"clicked on item image:{item_name}")
 
     def get_item_details_from_inventory(self,item_name):
-        item_container=self.find_element((By.XPATH,f"//div[@class='inventory-item-name' and text()='{item_name}']/ancestor::div[@class='inventory-item']"))
-        details = {
-            'name':item_container.find_element_by_class_name("inventory_item_name").text,
-            'description':item_container.find_element_by_class_name("inventory_item_description").text,
-            'price':item_container.find_element_by_class_name("inventory_item_price").text,
-            'image':item_container.find_element_by_class_name("inventory_item_image").get_attribute("src")
-        }
+        details=self.get_product_details(item_name)
+        if details is None:
+            raise Exception(f"Item {item_name} not found in inventory")
         return details
     def get_item_details_from_detail_page(self):
-        details={
-            'name':self.get_text_from_element(ProductPageLocators.inventory_name_class_path),
-            'description':self.get_text_from_element(ProductPageLocators.inventory_desc_class_path),
-            'price':self.get_text_from_element(ProductPageLocators.inventory_price_class_path),
-            'image':self.find_element(ProductPageLocators.inventory_img_class_path).get_attribute("src")
-        }
-        return details
+        return Product(name=self.get_text_from_element(ProductPageLocators.inventory_name_class_path),
+                       description=self.get_text_from_element(ProductPageLocators.inventory_desc_class_path),
+                       price_cents=to_cents(self.get_text_from_element(ProductPageLocators.inventory_price_class_path)),
+                       image=self.find_element(ProductPageLocators.inventory_img_class_path).get_attribute("src"))
     def verify_item_details_match(self,inventory_details,detail_page_details):
-        return (inventory_details['name'] == detail_page_details['name']
-            and inventory_details['description'] == detail_page_details['description']
-            and inventory_details['price'] == detail_page_details['price']
-            and inventory_details['image'] == detail_page_details['image'])
+        # Product equality ignores where the item sat on the page (item id, button id)
+        return inventory_details == detail_page_details
 
     def is_on_item_detail_page(self):
         return "inventory-item" in self.get_current_url()
@@ -175,122 +173,4 @@ class ProductPage(BasePage):
         print("removed item from detail page")
 
     def get_all_item_names_and_images(self):
-        items = []
-        item_containers = self.find_elements((By.CLASS_NAME, 'inventory-item'))
-        for container in item_containers:
-            name = container.find_element_by_class_name("inventory-item-name").text
-            image = container.find_element_by_class_name("inventory-item-image").text
-            # image=container.find_element(By.TAG_NAME,'img')
-            items.append({'name': name, 'image_element': image})
-        return items
-
-    def get_item_details_by_locator(self, title_locator, add_locator):
-        try:
-            # Find the title element using the provided locator
-            title_element = self.find_element(title_locator)
-            item_name = title_element.text.strip()
-            print(f"Retrieved details for item: {item_name}")
-
-            # Find the item container - traverse up to find the inventory_item div
-            item_container = title_element.find_element(By.XPATH, "./ancestor::div[@class='inventory_item']")
-
-            # Extract details using direct element finding (not through BasePage methods)
-            try:
-                name_element = item_container.find_element(By.CLASS_NAME, "inventory_item_name")
-                item_name_text = name_element.text
-            except:
-                item_name_text = item_name  # Use the already retrieved name
-
-            try:
-                desc_element = item_container.find_element(By.CLASS_NAME, "inventory_item_desc")
-                item_description = desc_element.text
-            except Exception as e:
-                print(f"Could not find description element: {e}")
-                item_description = ""
-
-            try:
-                price_element = item_container.find_element(By.CLASS_NAME, "inventory_item_price")
-                item_price = price_element.text
-            except Exception as e:
-                print(f"Could not find price element: {e}")
-                item_price = ""
-
-            try:
-                img_element = item_container.find_element(By.CSS_SELECTOR, ".inventory_item_img img")
-                item_image = img_element.get_attribute("src")
-            except Exception as e:
-                print(f"Could not find image element: {e}")
-                item_image = ""
-
-            details = {
-                'name': item_name_text,
-                'description': item_description,
-                'price': item_price,
-                'image': item_image
-            }
-
-            print(f"Successfully retrieved details: {details}")
-            return details
-
-        except Exception as e:
-            print(f"Error getting item details using title locator: {str(e)}")
-
-            # Fallback: try to get details by finding the add button first
-            try:
-                print("Trying fallback method using add button...")
-                add_element = self.find_element(add_locator)
-                item_container = add_element.find_element(By.XPATH, "./ancestor::div[@class='inventory_item']")
-
-                # Get item name from the container
-                name_element = item_container.find_element(By.CLASS_NAME, "inventory_item_name")
-                item_name_text = name_element.text
-
-                # Get other details
-                desc_element = item_container.find_element(By.CLASS_NAME, "inventory_item_desc")
-                price_element = item_container.find_element(By.CLASS_NAME, "inventory_item_price")
-                img_element = item_container.find_element(By.CSS_SELECTOR, ".inventory_item_img img")
-
-                details = {
-                    'name': item_name_text,
-                    'description': desc_element.text,
-                    'price': price_element.text,
-                    'image': img_element.get_attribute("src")
-                }
-
-                print(f"Fallback method successful: {details}")
-                return details
-
-            except Exception as fallback_error:
-                print(f"Fallback method also failed: {str(fallback_error)}")
-                print("Attempting final fallback with more flexible selectors...")
-
-                # Final fallback with more flexible approach
-                try:
-                    # Try to find any inventory item that contains the title text
-                    all_items = self.driver.find_elements(By.CLASS_NAME, "inventory_item")
-                    for item in all_items:
-                        try:
-                            name_elem = item.find_element(By.CLASS_NAME, "inventory_item_name")
-                            if title_element.text.strip() in name_elem.text:
-                                details = {
-                                    'name': name_elem.text,
-                                    'description': item.find_element(By.CLASS_NAME, "inventory_item_desc").text,
-                                    'price': item.find_element(By.CLASS_NAME, "inventory_item_price").text,
-                                    'image': item.find_element(By.CSS_SELECTOR,
-                                                               ".inventory_item_img img").get_attribute("src")
-                                }
-                                print(f"Final fallback successful: {details}")
-                                return details
-                        except:
-                            continue
-
-                    raise Exception("All fallback methods failed")
-
-                except Exception as final_error:
-                    print(f"All methods failed: {str(final_error)}")
-                    raise e
-
-
-
-
-
+        return [Product(name=product.name, image=product.image) for product in self.get_inventory_products()]
@@ -0,0 +1,132 @@
+import os
+import subprocess
+
+import pytest
+from Utils.affected import ALL, DependencyIndex, extract, git_changes
+
+LOCATORS = '''class CartLocators:
+    cart_item = "//div[@class='cart_item']"
+    checkout_button = "//button[@id='checkout']"
+'''
+PAGE = '''from Locators.locators import CartLocators
+
+
+class CartPage:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def get_cart_items(self):
+        return self.driver.find_elements("xpath", CartLocators.cart_item)
+
+    def click_checkout_button(self):
+        self.driver.find_element("xpath", CartLocators.checkout_button).click()
+'''
+CONFTEST = '''import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow")
+
+
+@pytest.fixture()
+def cart_page(driver):
+    from Pages.CartPage import CartPage
+    return CartPage(driver)
+'''
+TESTS = '''from Pages.CartPage import CartPage
+
+
+def test_cart_items(driver):
+    assert CartPage(driver).get_cart_items()
+
+
+def test_checkout(cart_page):
+    cart_page.click_checkout_button()
+'''
+FILES = {".gitignore": "/artifacts/\n", "Locators/locators.py": LOCATORS, "Pages/CartPage.py": PAGE,
+         "conftest.py": CONFTEST, "Tests/test_cart.py": TESTS}
+
+
+def _git(root, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=root, capture_output=True, text=True, check=True)
+
+
+@pytest.fixture()
+def project(tmp_path):
+    """Tiny committed project: a locator class, a page using it, a conftest with a hook and a fixture, two tests"""
+    for rel_path, source in FILES.items():
+        os.makedirs(tmp_path / os.path.dirname(rel_path), exist_ok=True)
+        (tmp_path / rel_path).write_text(source)
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "project")
+    return tmp_path
+
+
+def _affected(root):
+    index = DependencyIndex(str(root), str(root / "artifacts" / "dependency_index.json")).build()
+    return index.affected(git_changes("HEAD", str(root)))
+
+
+def test_extract_symbols_and_refs():
+    print("Test Extract Records Symbols, Line Spans And References")
+    facts = extract(PAGE, "Pages/CartPage.py")
+    assert facts["module"] == "Pages.CartPage",f"Got module {facts['module']}"
+    assert facts["imports"]["CartLocators"] == "Locators.locators:CartLocators",f"Got imports {facts['imports']}"
+    method = facts["symbols"]["CartPage.get_cart_items"]
+    assert method["kind"] == "method",f"Got kind {method['kind']}"
+    assert method["lines"] == [8, 9],f"Got lines {method['lines']}"
+    assert ["attr", "CartLocators", "cart_item"] in method["refs"],f"Got refs {method['refs']}"
+    hooks = extract(CONFTEST, "conftest.py")["symbols"]
+    assert hooks["pytest_configure"]["kind"] == "hook",f"Got {hooks['pytest_configure']}"
+    assert hooks["cart_page"]["kind"] == "fixture",f"Got {hooks['cart_page']}"
+
+
+def test_resolve_ref_follows_imports(project):
+    print("Test Locator And Fixture References Resolve To Their Definitions")
+    index = DependencyIndex(str(project), None).build()
+    assert index._resolve_ref("Pages.CartPage", ["attr", "CartLocators", "cart_item"]) == \
+        ["Locators.locators:CartLocators.cart_item"]
+    assert index._resolve_ref("Tests.test_cart", ["fixture", "cart_page"]) == ["conftest:cart_page"]
+    # an untyped receiver matches every method with that name
+    assert index._resolve_ref("conftest", ["method", "click_checkout_button"]) == \
+        ["Pages.CartPage:CartPage.click_checkout_button"]
+
+
+def test_locator_change_selects_its_tests(project):
+    print("Test Changing One Locator Selects Only The Tests Reaching It")
+    path = project / "Locators" / "locators.py"
+    path.write_text(path.read_text().replace("@id='checkout'", "@data-test='checkout'"))
+    assert git_changes("HEAD", str(project)) == {"Locators/locators.py": [3]}
+    tests, changed = _affected(project)
+    assert changed == {"Locators.locators:CartLocators.checkout_button"},f"Got changed {changed}"
+    assert tests == ["Tests/test_cart.py::test_checkout"],f"Got tests {tests}"
+
+
+def test_deleted_file_selects_everything(project):
+    print("Test Deleting A Module Selects The Whole Suite")
+    os.remove(project / "Pages" / "CartPage.py")
+    assert git_changes("HEAD", str(project)) == {"Pages/CartPage.py": None}
+    tests, changed = _affected(project)
+    assert changed == ALL,f"Got changed {changed}"
+    assert tests == ["Tests/test_cart.py::test_cart_items", "Tests/test_cart.py::test_checkout"],f"Got tests {tests}"
+
+
+def test_hook_change_selects_everything(project):
+    print("Test Changing A conftest Hook Selects The Whole Suite")
+    path = project / "conftest.py"
+    path.write_text(path.read_text().replace('"slow"', '"slow: long running"'))
+    tests, changed = _affected(project)
+    assert changed == ALL,f"Got changed {changed}"
+    assert len(tests) == 2,f"Got tests {tests}"
+
+
+def test_unreadable_cache_is_rebuilt(project):
+    print("Test A Half-Written Dependency Index Is Treated As Empty")
+    cache = project / "artifacts" / "dependency_index.json"
+    os.makedirs(cache.parent)
+    cache.write_text('{"version": 1, "files": {"conftest.py": {"mt')
+    index = DependencyIndex(str(project), str(cache)).build()
+    assert sorted(index.reparsed) == sorted(path for path in FILES if path.endswith(".py")),f"Got re-parsed {index.reparsed}"
+    assert DependencyIndex(str(project), str(cache)).build().reparsed == [],"The rewritten cache was not reused"
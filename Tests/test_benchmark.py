@@ -0,0 +1,40 @@
+import json
+
+from Utils.benchmark import compare, load_baseline, percentile
+
+
+def _result(p50, round_trips):
+    return {"p50": p50, "round_trips": round_trips}
+
+
+def test_percentile_nearest_rank():
+    print("Test Percentiles Pick The Nearest-Rank Sample")
+    samples = [5, 1, 4, 2, 3, 10, 9, 8, 7, 6]
+    assert percentile(samples, 50) == 5,f"Got p50 {percentile(samples, 50)}"
+    assert percentile(samples, 95) == 10,f"Got p95 {percentile(samples, 95)}"
+    assert percentile(samples, 1) == 1,f"Got p1 {percentile(samples, 1)}"
+    assert percentile([0.3], 99) == 0.3,f"Got p99 of one sample {percentile([0.3], 99)}"
+
+
+def test_compare_flags_slower_p50_and_extra_round_trips():
+    print("Test Compare Reports A Slower p50 And Extra Round-Trips As Regressions")
+    baseline = {"login": _result(0.100, 6), "checkout": _result(0.200, 20)}
+    results = {"login": _result(0.130, 6), "checkout": _result(0.210, 21), "new": _result(1.0, 99)}
+    regressions = compare(results, baseline, 0.25)
+    assert len(regressions) == 2,f"Got {regressions}"
+    assert regressions[0].startswith("login: p50"),f"Got {regressions[0]}"
+    assert regressions[1].startswith("checkout: 21 round-trips"),f"Got {regressions[1]}"
+
+
+def test_compare_within_tolerance_is_clean():
+    print("Test Compare Accepts A p50 Within Tolerance And Fewer Round-Trips")
+    regressions = compare({"login": _result(0.124, 5)}, {"login": _result(0.100, 6)}, 0.25)
+    assert regressions == [],f"Got {regressions}"
+
+
+def test_missing_baseline_is_none(tmp_path):
+    print("Test A Baseline File That Doesn't Exist Yet Loads As None")
+    assert load_baseline(str(tmp_path / "benchmark_baseline.json")) is None
+    path = tmp_path / "saved.json"
+    path.write_text(json.dumps({"results": {"login": _result(0.1, 6)}}), encoding="utf-8")
+    assert load_baseline(str(path)) == {"login": _result(0.1, 6)}
@@ -10,7 +10,7 @@ from Pages.ProductPage import ProductPage
 
 def test_bug1_empty_cart_checkout(driver):
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
     product_page = ProductPage(driver)
     product_page.click_on_cart_button()
     cart_page = CartPage(driver)
@@ -25,7 +25,7 @@ def test_bug1_empty_cart_checkout(driver):
 
 def test_bug2_menu_not_collapsing(driver):
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
     menu_page = OtherPage(driver)
     menu_page.click_menu_button()
     assert menu_page.is_menu_sidebar_displayed(),"Menu sidebar is not displayed"
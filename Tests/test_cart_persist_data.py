@@ -7,7 +7,7 @@ from Pages.ProductPage import ProductPage
 def test_cart_persist_after_refresh(driver):
     print("Test Cart Persist After Refresh")
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
     product_page = ProductPage(driver)
     product_page.add_single_item(ProductPageLocators.add_back_pack_path)
     initial_count=product_page.get_cart_count()
@@ -18,7 +18,7 @@ def test_cart_persist_after_refresh(driver):
 def test_cart_persist_after_logout(driver):
     print("Test Cart Persist After Logout")
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
     product_page = ProductPage(driver)
     product_page.add_single_item(ProductPageLocators.add_back_pack_path)
     initial_count=product_page.get_cart_count()
@@ -1,33 +1,25 @@
 
 import pytest
 
-from Locators.alllocators import LoginPageLocators, CheckoutPageLocators
-from Pages.CartPage import CartPage
+from Locators.alllocators import CheckoutPageLocators, CheckoutOverviewPageLocators
 from Pages.CheckoutPage import CheckoutPage
-from Pages.LoginPage import LoginPage
-from Pages.ProductPage import ProductPage
-from Utils.FileReader import load_csv_data
+from Utils.data_provider import read_rows
 
 @pytest.fixture()
-def checkout_setup(driver):
-    login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
-    product=ProductPage(driver)
-    product.click_on_cart_button()
-    cart=CartPage(driver)
-    cart.click_checkout_button()
+def checkout_setup(driver, journey):
+    journey("checkout-step-one")
     checkout_page = CheckoutPage(driver)
     print("user is in Checkout Page")
     return checkout_page
 
-@pytest.mark.parametrize("firstname,lastname,zip_code,expected", load_csv_data("Data/checkout_data.csv"))
+@pytest.mark.parametrize("firstname,lastname,zip_code,expected", read_rows("checkout_data.csv", as_dict=False))
 def test_checkout_validation(checkout_setup,firstname, lastname,zip_code,expected):
     assert checkout_setup.get_current_url()== CheckoutPageLocators.checkout_page_url
     checkout_setup.enter_checkout_info(firstname,lastname,zip_code)
     print(f"Giving Data :{firstname},{lastname},{zip_code} ")
     if "Success" in expected:
         print(f"Test Passed and directed to url: {checkout_setup.get_current_url()}")
-        assert checkout_setup.get_current_url() == "https://www.saucedemo.com/checkout-step-two.html",f"{checkout_setup.get_current_url()}"
+        assert checkout_setup.get_current_url() == CheckoutOverviewPageLocators.checkout_overview_url,f"{checkout_setup.get_current_url()}"
         print(f"Got title : {checkout_setup.checkout_title()}")
         assert checkout_setup.checkout_title() == "Checkout: Overview",f"Got checkout title: {checkout_setup.checkout_title()}"
     elif "FirstNameNotGiven" in expected:
@@ -60,4 +52,4 @@ def test_error_cancel_button(checkout_setup):
     checkout_page.click_continue_button()
     assert checkout_page.is_displayed(CheckoutPageLocators.error_message_path),f"Got:{checkout_page.is_displayed(CheckoutPageLocators.error_message_path)}"
     checkout_page.click_error_cancel_button()
-    assert not checkout_page.is_displayed(CheckoutPageLocators.error_message_path),f"Got:{checkout_page.is_displayed(CheckoutPageLocators.error_message_path)}"
+    assert checkout_page.wait_absent(CheckoutPageLocators.error_message_path),"Error message still displayed"
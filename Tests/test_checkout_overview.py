@@ -1,41 +1,17 @@
-import pytest
-
 from Locators.alllocators import (
-    LoginPageLocators,
     ProductPageLocators,
-    CartPageLocators,
-    CheckoutPageLocators,
     FinishPageLocators
 )
 
-from Pages.LoginPage import LoginPage
-from Pages.ProductPage import ProductPage
 from Pages.CheckoutOverviewPage import CheckoutOverviewPage
 from Pages.BasePage import BasePage
 
 
-@pytest.mark.usefixtures("driver")
-def test_checkout_overview_with_backpack(driver):
+def test_checkout_overview_with_backpack(driver, journey):
     base = BasePage(driver)
-    driver.get(LoginPageLocators.loginpageUrl)
-
-    # Step 1: Login
-    login = LoginPage(driver)
-    login.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
-
-    # Step 2: Add 1 item (Backpack)
-    product = ProductPage(driver)
-    product.add_single_item(ProductPageLocators.add_back_pack_path)
-    cart_count = product.get_cart_count()
-    assert cart_count == 1, f"Expected 1 item in cart, got {cart_count}"
-    product.click_on_cart_button()
-
-    # Step 3: Go to Checkout Info Page
-    base.click_element(CartPageLocators.checkout_path)
-    base.type_in_element(CheckoutPageLocators.first_name_path, CheckoutPageLocators.valid_first_name)
-    base.type_in_element(CheckoutPageLocators.last_name_path, CheckoutPageLocators.valid_last_name)
-    base.type_in_element(CheckoutPageLocators.Zip_code_path, CheckoutPageLocators.valid_zip_code)
-    base.click_element(CheckoutPageLocators.continue_button_path)
+
+    # Steps 1-3: login, add the backpack, fill checkout info (walked once, then restored from a snapshot)
+    journey("checkout-step-two-backpack")
 
     # Step 4: On Checkout Overview Page
     overview = CheckoutOverviewPage(driver)
@@ -71,27 +47,11 @@ def test_checkout_overview_with_backpack(driver):
     print("Checkout Overview Test Passed!")
 
 
-def test_cancel_checkout_overview(driver):
+def test_cancel_checkout_overview(driver, journey):
     base = BasePage(driver)
-    driver.get(LoginPageLocators.loginpageUrl)
-
-    # Step 1: Login
-    login = LoginPage(driver)
-    login.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
-
-    # Step 2: Add 1 item (Backpack)
-    product = ProductPage(driver)
-    product.add_single_item(ProductPageLocators.add_back_pack_path)
-    cart_count = product.get_cart_count()
-    assert cart_count == 1, f"Expected 1 item in cart, got {cart_count}"
-    product.click_on_cart_button()
-
-    # Step 3: Go to Checkout Info Page
-    base.click_element(CartPageLocators.checkout_path)
-    base.type_in_element(CheckoutPageLocators.first_name_path, CheckoutPageLocators.valid_first_name)
-    base.type_in_element(CheckoutPageLocators.last_name_path, CheckoutPageLocators.valid_last_name)
-    base.type_in_element(CheckoutPageLocators.Zip_code_path, CheckoutPageLocators.valid_zip_code)
-    base.click_element(CheckoutPageLocators.continue_button_path)
+
+    # Steps 1-3: login, add the backpack, fill checkout info (walked once, then restored from a snapshot)
+    journey("checkout-step-two-backpack")
 
     # Step 4: On Checkout Overview Page
     overview = CheckoutOverviewPage(driver)
@@ -99,27 +59,11 @@ def test_cancel_checkout_overview(driver):
     assert "inventory.html" in driver.current_url, "Cancel did not return to products page"
 
 
-def test_finish_checkout_overview(driver):
+def test_finish_checkout_overview(driver, journey):
     base = BasePage(driver)
-    driver.get(LoginPageLocators.loginpageUrl)
-
-    # Step 1: Login
-    login = LoginPage(driver)
-    login.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
-
-    # Step 2: Add 1 item (Backpack)
-    product = ProductPage(driver)
-    product.add_single_item(ProductPageLocators.add_back_pack_path)
-    cart_count = product.get_cart_count()
-    assert cart_count == 1, f"Expected 1 item in cart, got {cart_count}"
-    product.click_on_cart_button()
-
-    # Step 3: Go to Checkout Info Page
-    base.click_element(CartPageLocators.checkout_path)
-    base.type_in_element(CheckoutPageLocators.first_name_path, CheckoutPageLocators.valid_first_name)
-    base.type_in_element(CheckoutPageLocators.last_name_path, CheckoutPageLocators.valid_last_name)
-    base.type_in_element(CheckoutPageLocators.Zip_code_path, CheckoutPageLocators.valid_zip_code)
-    base.click_element(CheckoutPageLocators.continue_button_path)
+
+    # Steps 1-3: login, add the backpack, fill checkout info (walked once, then restored from a snapshot)
+    journey("checkout-step-two-backpack")
 
     # Step 4: On Checkout Overview Page
     overview = CheckoutOverviewPage(driver)
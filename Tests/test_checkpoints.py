@@ -0,0 +1,72 @@
+import pytest
+from selenium.webdriver.support.wait import WebDriverWait
+
+from Pages.BasePage import BasePage
+from Utils.checkpoints import CheckpointRunner
+
+
+class FakeDriver:
+    """Just enough of a WebDriver for checkpoints: a URL, no cookies, empty storage and a cart badge"""
+
+    def __init__(self):
+        self.current_url = "https://www.saucedemo.com/inventory.html"
+        self.badge = ""
+
+    def get(self, url):
+        self.current_url = url
+
+    def get_cookies(self):
+        return []
+
+    def delete_all_cookies(self):
+        pass
+
+    def add_cookie(self, cookie):
+        pass
+
+    def execute_script(self, script, *args):
+        return '{"local": {}, "session": {}}'
+
+    def find_elements(self, by, value):
+        return [type("Badge", (), {"text": self.badge})()] if self.badge else []
+
+
+def _page(driver):
+    page = BasePage(driver)
+    page.wait = WebDriverWait(driver, 0.05, 0.01)
+    return page
+
+
+def test_failed_wait_retries_the_step():
+    print("Test A Step Whose Wait Helper Returned False Is Retried From The Checkpoint")
+    driver = FakeDriver()
+    runner = CheckpointRunner(driver, "test")
+    page = _page(driver)
+    runner.step("open inventory", page.page_changed)
+    attempts = []
+
+    def add_item():
+        attempts.append(driver.current_url)
+        # the badge only updates on the second try, like a slow page the first time round
+        driver.badge = "1" if len(attempts) > 1 else ""
+        assert page.wait_for_cart_badge(1)
+
+    runner.step("add item", add_item)
+    assert len(attempts) == 2,f"Expected one retry, got {len(attempts)} attempt(s)"
+    assert CheckpointRunner.retries.pop()[:2] == ("test", "add item")
+
+
+def test_plain_assert_is_not_retried():
+    print("Test A Failing Assert Without A Failed Wait Fails Straight Away")
+    driver = FakeDriver()
+    runner = CheckpointRunner(driver, "test")
+    runner.step("open inventory", _page(driver).page_changed)
+    attempts = []
+
+    def check():
+        attempts.append(1)
+        assert False,"wrong price"
+
+    with pytest.raises(AssertionError):
+        runner.step("check", check)
+    assert attempts == [1],f"Expected no retry, got {len(attempts)} attempt(s)"
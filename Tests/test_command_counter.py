@@ -0,0 +1,35 @@
+from selenium.webdriver.support.wait import WebDriverWait
+
+from Pages.BasePage import BasePage
+from Utils.command_counter import CommandCounter, command_budget
+
+
+class FakeDriver:
+    """Answers every WebDriver command; the cart badge shows up after a given number of polls"""
+
+    def __init__(self, polls_until_ready):
+        self.polls_until_ready = polls_until_ready
+
+    def execute(self, driver_command, params=None):
+        self.polls_until_ready -= 1
+        return {"value": self.polls_until_ready <= 0}
+
+
+class SlowPage(BasePage):
+    def __init__(self, driver):
+        super().__init__(driver)
+        self.wait = WebDriverWait(driver, 1, 0.01)
+
+    @command_budget(2)
+    def open_cart(self):
+        self.driver.execute("clickElement")
+        self._until("cart", None, lambda driver: driver.execute("getElementText")["value"])
+
+
+def test_wait_polls_are_not_charged_to_budgets():
+    print("Test A Slow Wait Costs Its First Poll Against The Budget, Not Every Poll")
+    driver = FakeDriver(polls_until_ready=5)
+    counter = CommandCounter.of(driver)
+    SlowPage(driver).open_cart()
+    assert counter.counts == {"clickElement": 1, "getElementText": 4},f"Got counts {dict(counter.counts)}"
+    assert counter.budgeted == 2,f"Expected the click and one poll charged, got {counter.budgeted}"
@@ -0,0 +1,25 @@
+from Utils import data_provider
+from Utils.data_provider import read_rows
+from Utils.models import to_cents
+
+
+def test_cache_keeps_each_typing(tmp_path, monkeypatch):
+    print("Test Differently Typed Reads Of One File Are Cached Side By Side")
+    path = tmp_path / "prices.csv"
+    path.write_text("name,price\nBackpack,29.99\n")
+    parsed = []
+    parse_rows = data_provider._parse_rows
+    monkeypatch.setattr(data_provider, "_parse_rows", lambda *args: parsed.append(args) or parse_rows(*args))
+    for _ in range(2):
+        assert read_rows(str(path)) == ({"name": "Backpack", "price": "29.99"},)
+        assert read_rows(str(path), types={"price": to_cents}) == ({"name": "Backpack", "price": 2999},)
+        assert read_rows(str(path), as_dict=False) == (("Backpack", "29.99"),)
+    assert len(parsed) == 3,f"Expected one parse per typing, got {len(parsed)}"
+
+
+def test_rows_are_not_shared(tmp_path):
+    print("Test A Caller Changing A Row Does Not Change It For The Next Caller")
+    path = tmp_path / "login.csv"
+    path.write_text("username,password\nstandard_user,secret_sauce\n")
+    read_rows(str(path))[0]["password"] = "changed"
+    assert read_rows(str(path))[0]["password"] == "secret_sauce","The cached row was modified by an earlier caller"
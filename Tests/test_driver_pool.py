@@ -0,0 +1,23 @@
+from Locators.alllocators import LoginPageLocators, ProductPageLocators
+from Pages.LoginPage import LoginPage
+from Pages.ProductPage import ProductPage
+
+
+def test_reused_browser_is_reset(driver_pool):
+    print("Test Pooled Browser Is Reset Between Tests")
+    driver = driver_pool.acquire()
+    try:
+        LoginPage(driver).fast_login(LoginPageLocators.valid_username)
+        product_page = ProductPage(driver)
+        product_page.add_single_item(ProductPageLocators.add_back_pack_path)
+        assert product_page.get_cart_count() == 1,f"Expected 1 item in the cart counter. Got {product_page.get_cart_count()}"
+    finally:
+        driver_pool.release(driver)
+
+    driver = driver_pool.acquire()
+    try:
+        assert driver.current_url == LoginPageLocators.loginpageUrl,f"Got:{driver.current_url},Expected:{LoginPageLocators.loginpageUrl}"
+        assert driver.get_cookies() == [],f"Cookies were not cleared: {driver.get_cookies()}"
+        assert driver.execute_script("return window.localStorage.length;") == 0,"localStorage (cart) was not cleared"
+    finally:
+        driver_pool.release(driver)
@@ -1,5 +1,3 @@
-import time
-
 import pytest
 from selenium.webdriver.common.by import By
 
@@ -8,61 +6,60 @@ from Pages.BasePage import BasePage
 from Pages.CheckoutOverviewPage import CheckoutOverviewPage
 from Pages.LoginPage import LoginPage
 from Pages.ProductPage import ProductPage
-from Utils.read_checkout_data import read_checkout_data
+from Utils.catalogue import checkout_rows
 
-checkout_test_data = read_checkout_data("Data/checkout_overview_data.csv")
+checkout_test_data = checkout_rows()
 
 @pytest.mark.parametrize("item", checkout_test_data)
-def test_checkout_overview_dynamic(driver, item):
+def test_checkout_overview_dynamic(driver, checkpoints, item):
+    # each step that ends on a new page is checkpointed, so a timeout late in the journey only retries that step
     base = BasePage(driver)
-    driver.get(LoginPageLocators.loginpageUrl)
-
-    LoginPage(driver).login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
-    time.sleep(2)
-    # Add dynamic product
-    product = ProductPage(driver)
-    time.sleep(2)
-    base.click_element((By.ID, item["item_id"]))
-    time.sleep(2)
-    product.click_on_cart_button()
-    time.sleep(2)
+    overview = CheckoutOverviewPage(driver)
 
-    base.click_element(CartPageLocators.checkout_path)
-    time.sleep(2)
-    base.type_in_element(CheckoutPageLocators.first_name_path, CheckoutPageLocators.valid_first_name)
-    time.sleep(0.5)
-    base.type_in_element(CheckoutPageLocators.last_name_path, CheckoutPageLocators.valid_last_name)
-    time.sleep(0.5)
-    base.type_in_element(CheckoutPageLocators.Zip_code_path, CheckoutPageLocators.valid_zip_code)
-    time.sleep(0.5)
-    base.click_element(CheckoutPageLocators.continue_button_path)
-    time.sleep(0.5)
+    def login():
+        driver.get(LoginPageLocators.loginpageUrl)
+        LoginPage(driver).fast_login(LoginPageLocators.valid_username)
+        assert base.wait_for_page_load("inventory.html")
 
-    overview = CheckoutOverviewPage(driver)
-    time.sleep(2)
+    def add_item_and_open_cart():
+        # Add dynamic product
+        base.click_element((By.ID, item["item_id"]))
+        assert base.wait_for_cart_badge(1)
+        ProductPage(driver).click_on_cart_button()
+        assert base.wait_for_page_load("cart.html")
 
-    # Item check
-    item_names = overview.get_item_names()
-    time.sleep(2)
-    item_prices = overview.get_item_prices()
-    time.sleep(2)
-    assert item["item_name"] in item_names
-    time.sleep(2)
-    assert f"${item['price']}" in item_prices
-    time.sleep(2)
+    def checkout_information():
+        base.click_element(CartPageLocators.checkout_path)
+        assert base.wait_for_page_load("checkout-step-one")
+        base.type_in_element(CheckoutPageLocators.first_name_path, CheckoutPageLocators.valid_first_name)
+        base.type_in_element(CheckoutPageLocators.last_name_path, CheckoutPageLocators.valid_last_name)
+        base.type_in_element(CheckoutPageLocators.Zip_code_path, CheckoutPageLocators.valid_zip_code)
+        step_one_url = driver.current_url
+        base.click_element(CheckoutPageLocators.continue_button_path)
+        assert base.wait_for_url_change(step_one_url)
 
-    # Static content
-    assert overview.get_payment_info() == "SauceCard #31337"
-    time.sleep(2)
-    assert overview.get_shipping_info() == "Free Pony Express Delivery!"
-    time.sleep(2)
+    def check_overview():
+        # Item check
+        item_names = overview.get_item_names()
+        item_prices = overview.get_item_prices()
+        assert item["item_name"] in item_names
+        assert item["price"] in item_prices
 
-    # Financials
+        # Static content
+        assert overview.get_payment_info() == "SauceCard #31337"
+        assert overview.get_shipping_info() == "Free Pony Express Delivery!"
 
+        # Financials
+        assert overview.get_item_total() == item["price"]
+        assert overview.get_tax() == item["tax"]
+        assert overview.get_total() == item["total"]
 
-    assert overview.get_item_total() == float(item["price"])
-    assert overview.get_tax() == float(item["tax"])
-    assert overview.get_total() == float(item["total"])
+    def finish():
+        overview.click_finish_button()
+        assert FinishPageLocators.finish_page_url in driver.current_url
 
-    overview.click_finish_button()
-    assert FinishPageLocators.finish_page_url in driver.current_url
+    checkpoints.step("login", login)
+    checkpoints.step("add item and open cart", add_item_and_open_cart)
+    checkpoints.step("checkout information", checkout_information)
+    checkpoints.step("check overview", check_overview)
+    checkpoints.step("finish", finish)
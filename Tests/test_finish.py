@@ -1,26 +1,12 @@
 import pytest
 
-from Locators.alllocators import LoginPageLocators, CheckoutPageLocators, FinishPageLocators
-from Pages.CartPage import CartPage
-from Pages.CheckoutOverviewPage import CheckoutOverviewPage
-from Pages.CheckoutPage import CheckoutPage
+from Locators.alllocators import FinishPageLocators
 from Pages.FinishPage import FinishPage
-from Pages.LoginPage import LoginPage
-from Pages.ProductPage import ProductPage
 
 
 @pytest.fixture()
-def go_to_final_page(driver):
-    login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
-    product_page= ProductPage(driver)
-    product_page.click_on_cart_button()
-    cart_page = CartPage(driver)
-    cart_page.click_checkout_button()
-    checkout_page = CheckoutPage(driver)
-    checkout_page.enter_checkout_info(CheckoutPageLocators.valid_first_name,CheckoutPageLocators.valid_last_name,CheckoutPageLocators.valid_zip_code)
-    checkout_over_page= CheckoutOverviewPage(driver)
-    checkout_over_page.click_finish_button()
+def go_to_final_page(driver, journey):
+    journey("checkout-complete")
     finish_page = FinishPage(driver)
     print("User is in Finish Page")
     return finish_page
@@ -6,13 +6,14 @@ from Pages.CartPage import CartPage
 from Pages.LoginPage import LoginPage
 from Pages.OtherPage import OtherPage
 from Pages.ProductPage import ProductPage
+from Utils.catalogue import load_golden
 
 
-@pytest.mark.parametrize("page_url",["/inventory.html","/cart.html","/checkout-step-one.html","/checkout-step-two.html"])
+@pytest.mark.parametrize("page_url",["inventory.html","cart.html","checkout-step-one.html","checkout-step-two.html"])
 def test_global_elements(driver,page_url):
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username,LoginPageLocators.valid_password)
-    driver.get(f"https://www.saucedemo.com{page_url}")
+    login_page.fast_login(LoginPageLocators.valid_username)
+    driver.get(f"{LoginPageLocators.loginpageUrl}{page_url}")
     other_page = OtherPage(driver)
     assert other_page.is_menu_sidebar_displayed(),"Menu Button Not Displayed"
     assert other_page.is_cart_button_displayed(),"Cart Button Not Displayed"
@@ -24,28 +25,22 @@ def test_global_elements(driver,page_url):
 
 def test_known_verification(driver):
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username,LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
     product_page = ProductPage(driver)
     product_page.add_single_item(ProductPageLocators.add_back_pack_path)
-    expected={
-        'name':'Sauce Labs Backpack',
-        'description': 'carry.allTheThings()',
-        'price':29.99,
-        'image':'backpack.jpg'
-    }
+    expected=load_golden()['Sauce Labs Backpack']
     product_page.click_on_cart_button()
     cart_page = CartPage(driver)
     cart_items = cart_page.get_cart_items()
     assert len(cart_items) == 1, f"Expected 1 item in cart, but found {len(cart_items)}"
     actual_item = cart_items[0]
     print(f"{actual_item}")
-    assert actual_item['name'] == expected[
-        'name'], f"Expected name '{expected['name']}', but got '{actual_item['name']}'"
+    assert actual_item.name == expected.name, f"Expected name '{expected.name}', but got '{actual_item.name}'"
 
-    assert expected['description'] in actual_item[
-        'description'], f"Expected description to contain '{expected['description']}', but got '{actual_item['description']}'"
+    assert actual_item.product.description == expected.description, \
+        f"Expected description '{expected.description}', but got '{actual_item.product.description}'"
 
-    assert actual_item['price'] == f"${expected['price']}", f"Expected price ${expected['price']}, but got {actual_item['price']}"
+    assert actual_item.price_cents == expected.price_cents, f"Expected price {expected.price}, but got {actual_item.product.price}"
 
     # assert expected['image'] in actual_item[
     #     'image'], f"Expected
@@ -1,5 +1,4 @@
 import pytest
-import time
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
@@ -7,25 +6,29 @@ from Locators.alllocators import LoginPageLocators, ProductPageLocators
 from Pages.LoginPage import LoginPage
 from Pages.ProductPage import ProductPage
 from Pages.CartPage import CartPage
+from Utils.catalogue import load_golden
+from Utils.models import format_price
 
 
 def load_item_list():
-    """Load test data with proper mapping to actual locators"""
-    test_data = [
+    """Load test data with proper mapping to actual locators; price (cents) and description come from the golden catalogue"""
+    golden = load_golden()
+    locators = [
         ("Sauce Labs Backpack", ProductPageLocators.add_back_pack_path,
-         ProductPageLocators.title_back_pack_path, ProductPageLocators.img_back_pack_path, 29.99,
-         "carry.allTheThings()"),
+         ProductPageLocators.title_back_pack_path, ProductPageLocators.img_back_pack_path),
         ("Sauce Labs Bike Light", ProductPageLocators.add_bike_light_path,
-         ProductPageLocators.title_bike_light_path, ProductPageLocators.img_bike_light_path, 9.99, "illuminate"),
+         ProductPageLocators.title_bike_light_path, ProductPageLocators.img_bike_light_path),
         ("Sauce Labs Fleece Jacket", ProductPageLocators.add_Jacket_path,
-         ProductPageLocators.title_Jacket_path, ProductPageLocators.img_Jacket_path, 49.99, "fleece"),
+         ProductPageLocators.title_Jacket_path, ProductPageLocators.img_Jacket_path),
         ("Sauce Labs Bolt T-Shirt", ProductPageLocators.add_Tshirt_path,
-         ProductPageLocators.title_Tshirt_path, ProductPageLocators.img_Tshirt_path, 15.99, "bolt"),
+         ProductPageLocators.title_Tshirt_path, ProductPageLocators.img_Tshirt_path),
         ("Sauce Labs Onesie", ProductPageLocators.add_onesie_path,
-         ProductPageLocators.title_onesie_path, ProductPageLocators.img_onesie_path, 7.99, "onesie"),
+         ProductPageLocators.title_onesie_path, ProductPageLocators.img_onesie_path),
         ("Test.allTheThings() T-Shirt (Red)", ProductPageLocators.add_allthings_path,
-         ProductPageLocators.title_allthing_path, ProductPageLocators.img_allthing_path, 15.99, "allTheThings")
+         ProductPageLocators.title_allthing_path, ProductPageLocators.img_allthing_path)
     ]
+    test_data = [(name, add, title, img, golden[name].price_cents, golden[name].description)
+                 for name, add, title, img in locators]
     return test_data
 
 
@@ -33,7 +36,7 @@ def load_item_list():
 def login_to_product_page(driver):
     """Login and navigate to product page with proper wait"""
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
 
     # Wait for inventory page to load
     wait = WebDriverWait(driver, 10)
@@ -48,21 +51,23 @@ def wait_for_page_load(driver, timeout=10):
     try:
         # Wait for inventory items to be present
         wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, "inventory_item")))
-        time.sleep(1)  # Additional small wait for JS to complete
         return True
     except Exception as e:
         print(f"Page load timeout: {e}")
         return False
 
 
+@pytest.mark.read_only
 @pytest.mark.parametrize("item_name,add_locator,title_locator,img_locator,expected_price,expected_desc",
                          load_item_list())
-def test_item_title_navigation(driver, item_name, add_locator, title_locator, img_locator, expected_price,
-                               expected_desc):
+def test_item_title_navigation(read_only_driver, catalogue_diff, item_name, add_locator, title_locator, img_locator,
+                               expected_price, expected_desc):
     """Test clicking item title to navigate to detail page for all items"""
-    # Login
-    login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    # The inventory card was read once for the session and diffed against the golden catalogue
+    assert not catalogue_diff.problems(item_name), catalogue_diff.problems(item_name)
+
+    # Logged in on the inventory by the fixture (a tab of a shared browser with --read-only-tabs)
+    driver = read_only_driver
 
     # Wait for page to load completely
     assert wait_for_page_load(driver), "Inventory page failed to load properly"
@@ -73,48 +78,37 @@ def test_item_title_navigation(driver, item_name, add_locator, title_locator, im
     print(f"Testing item: {item_name}")
     print(f"Current URL: {driver.current_url}")
 
-    # Get item details using the specific locator instead of searching by name
-    try:
-        # Get item details from inventory page using specific locators
-        inventory_details = product_page.get_item_details_by_locator(title_locator, add_locator)
-
-        # Click on the specific item title using the locator
-        title_element = driver.find_element(*title_locator)
-        title_element.click()
-
-        # Wait for navigation to detail page
-        wait = WebDriverWait(driver, 10)
-        wait.until(lambda d: "inventory-item" in d.current_url)
+    # Click on the specific item title using the locator
+    title_element = driver.find_element(*title_locator)
+    title_element.click()
 
-    except Exception as e:
-        print(f"Error during item interaction: {e}")
-        driver.save_screenshot(f"debug_error_{item_name.replace(' ', '_')}.png")
-        raise
+    # Wait for navigation to detail page
+    wait = WebDriverWait(driver, 10)
+    wait.until(lambda d: "inventory-item" in d.current_url)
 
     # Verify navigation and details
     assert product_page.is_on_item_detail_page(), f"Should be on detail page for {item_name}"
     detail_details = product_page.get_item_details_from_detail_page()
-    assert product_page.verify_item_details_match(inventory_details, detail_details), \
-        f"Details should match for {item_name}"
+    assert (detail_details.name, detail_details.description, detail_details.price_cents) == \
+           (item_name, expected_desc, expected_price), f"Detail page of {item_name} shows {detail_details}"
 
 
 @pytest.mark.parametrize("item_name,add_locator,title_locator,img_locator,expected_price,expected_desc",
                          load_item_list())
-def test_item_image_navigation(driver, item_name, add_locator, title_locator, img_locator, expected_price,
-                               expected_desc):
+def test_item_image_navigation(driver, catalogue_diff, item_name, add_locator, title_locator, img_locator,
+                               expected_price, expected_desc):
     """Test clicking item image to navigate to detail page for all items"""
+    assert not catalogue_diff.problems(item_name), catalogue_diff.problems(item_name)
+
     # Login
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
 
     # Wait for page to load
     assert wait_for_page_load(driver), "Inventory page failed to load properly"
 
     product_page = ProductPage(driver)
 
-    # Get details using specific locator and click image
-    inventory_details = product_page.get_item_details_by_locator(title_locator, add_locator)
-
     # Click the specific image
     img_element = driver.find_element(*img_locator)
     img_element.click()
@@ -126,8 +120,8 @@ def test_item_image_navigation(driver, item_name, add_locator, title_locator, im
     # Verify navigation and details
     assert product_page.is_on_item_detail_page(), f"Should be on detail page for {item_name}"
     detail_details = product_page.get_item_details_from_detail_page()
-    assert product_page.verify_item_details_match(inventory_details, detail_details), \
-        f"Details should match for {item_name}"
+    assert (detail_details.name, detail_details.description, detail_details.price_cents) == \
+           (item_name, expected_desc, expected_price), f"Detail page of {item_name} shows {detail_details}"
 
 
 @pytest.mark.parametrize("item_name,add_locator,title_locator,img_locator,expected_price,expected_desc",
@@ -137,7 +131,7 @@ def test_add_remove_from_detail_page(driver, item_name, add_locator, title_locat
     """Test adding and removing items from detail page for all items"""
     # Login and navigate to detail page
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
 
     assert wait_for_page_load(driver), "Inventory page failed to load properly"
 
@@ -156,14 +150,14 @@ def test_add_remove_from_detail_page(driver, item_name, add_locator, title_locat
 
     # Add item from detail page
     product_page.add_item_from_detail_page()
-    time.sleep(1)  # Wait for cart update
+    assert product_page.wait_for_cart_badge(initial_cart_count + 1)
     new_cart_count = product_page.get_cart_count()
     assert new_cart_count == initial_cart_count + 1, \
         f"Cart count should increase by 1 for {item_name}"
 
     # Remove item from detail page
     product_page.remove_item_from_detail_page()
-    time.sleep(1)  # Wait for cart update
+    assert product_page.wait_for_cart_badge(initial_cart_count)
     final_cart_count = product_page.get_cart_count()
     assert final_cart_count == initial_cart_count, \
         f"Cart count should return to initial value for {item_name}"
@@ -176,7 +170,7 @@ def test_item_verification_in_cart(driver, item_name, add_locator, title_locator
     """Test item details verification in cart for all items"""
     # Login and add item
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
 
     assert wait_for_page_load(driver), "Inventory page failed to load properly"
 
@@ -184,7 +178,7 @@ def test_item_verification_in_cart(driver, item_name, add_locator, title_locator
     product_page.add_single_item(add_locator)
 
     # Wait for cart update
-    time.sleep(1)
+    assert product_page.wait_for_cart_badge(1)
 
     product_page.click_on_cart_button()
 
@@ -201,14 +195,14 @@ def test_item_verification_in_cart(driver, item_name, add_locator, title_locator
     # Find the added item in cart
     added_item = None
     for item in cart_items:
-        if item['name'] == item_name:
+        if item.name == item_name:
             added_item = item
             break
 
     assert added_item is not None, f"Item {item_name} should be in cart"
-    assert added_item['price'] == f"${expected_price}", \
-        f"Expected price {expected_price} for {item_name}, got {added_item['price']}"
-    assert expected_desc in added_item['desc'], \
+    assert added_item.price_cents == expected_price, \
+        f"Expected price {format_price(expected_price)} for {item_name}, got {added_item.product.price}"
+    assert expected_desc in added_item.product.description, \
         f"Expected description to contain '{expected_desc}' for {item_name}"
 
 
@@ -219,13 +213,13 @@ def test_cart_item_navigation(driver, item_name, add_locator, title_locator, img
     """Test navigation from cart item to detail page for all items"""
     # Login, add item, and go to cart
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
 
     assert wait_for_page_load(driver), "Inventory page failed to load properly"
 
     product_page = ProductPage(driver)
     product_page.add_single_item(add_locator)
-    time.sleep(1)  # Wait for cart update
+    assert product_page.wait_for_cart_badge(1)
 
     product_page.click_on_cart_button()
 
@@ -238,15 +232,16 @@ def test_cart_item_navigation(driver, item_name, add_locator, title_locator, img
     cart_page.click_item_title_in_cart(item_name)
 
     # Wait for navigation
-    time.sleep(2)
+    assert cart_page.wait_for_page_load("inventory-item")
 
     # Verify navigation
     assert product_page.is_on_item_detail_page(), \
         f"Should navigate to detail page from cart for {item_name}"
 
     # Test back navigation
+    back_button = product_page.find_element(ProductPageLocators.back_to_product)
     product_page.click_back_to_product()
-    time.sleep(1)
+    assert product_page.wait_for_staleness(back_button)
     assert "inventory.html" in product_page.get_current_url(), \
         f"Should navigate back to inventory page for {item_name}"
 
@@ -255,7 +250,7 @@ def test_comprehensive_multi_item_workflow(driver):
     """Test workflow with multiple items from test data"""
     # Login
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
 
     assert wait_for_page_load(driver), "Inventory page failed to load properly"
 
@@ -265,9 +260,9 @@ def test_comprehensive_multi_item_workflow(driver):
     test_data = load_item_list()[:3]  # Limit to first 3 items for comprehensive test
 
     # Add multiple items using their specific locators
-    for item_name, add_locator, title_locator, img_locator, expected_price, expected_desc in test_data:
+    for count, (item_name, add_locator, title_locator, img_locator, expected_price, expected_desc) in enumerate(test_data, 1):
         product_page.add_single_item(add_locator)
-        time.sleep(1)  # Wait between additions
+        assert product_page.wait_for_cart_badge(count)
 
     # Verify cart
     product_page.click_on_cart_button()
@@ -283,13 +278,13 @@ def test_comprehensive_multi_item_workflow(driver):
         f"Cart should have {len(test_data)} items"
 
     # Verify each item in cart
-    cart_item_names = [item['name'] for item in cart_items]
+    cart_item_names = [item.name for item in cart_items]
     for item_name, _, _, _, expected_price, _ in test_data:
         assert item_name in cart_item_names, f"{item_name} should be in cart"
 
     # Remove all items
     cart_page.remove_all_items_from_cart()
-    time.sleep(2)  # Wait for removal
+    assert cart_page.wait_for_cart_badge(0)
     assert cart_page.verify_cart_is_empty(), "Cart should be empty after removing all items"
 
 
@@ -311,8 +306,9 @@ def test_back_to_products_navigation(login_to_product_page):
 
     assert product_page.is_on_item_detail_page(), "Should be on item detail page"
 
+    detail_url = product_page.get_current_url()
     product_page.click_back_to_product()
-    time.sleep(1)
+    assert product_page.wait_for_url_change(detail_url)
     assert "inventory.html" in product_page.get_current_url(), \
         "Should be back on inventory page"
 
@@ -322,7 +318,7 @@ def test_direct_locator_navigation(driver):
     """Test using direct locators instead of searching by name"""
     # Login
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
 
     assert wait_for_page_load(driver), "Inventory page failed to load properly"
 
@@ -344,7 +340,7 @@ def test_direct_locator_navigation(driver):
     back_button = driver.find_element(*ProductPageLocators.back_to_product)
     back_button.click()
 
-    time.sleep(1)
+    assert ProductPage(driver).wait_for_staleness(back_button)
     assert "inventory.html" in driver.current_url, "Should be back on inventory page"
 
     print("Direct locator test passed")
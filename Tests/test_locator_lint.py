@@ -0,0 +1,60 @@
+import os
+import re
+import shutil
+import subprocess
+
+import pytest
+from selenium.webdriver.common.by import By
+from Utils.locator_lint import LOCATORS_PATH, PROJECT_DIR, build_patch, lint, scan, select
+
+pytest.importorskip("lxml")
+pytest.importorskip("cssselect")
+
+
+@pytest.fixture(scope="module")
+def linted():
+    """Locators linted against the committed snapshots in Data/dom_snapshots"""
+    source, locators, snapshots = lint()
+    assert snapshots,"No DOM snapshots in Data/dom_snapshots; run python -m Utils.locator_lint --capture --base-url local"
+    return source, locators, snapshots
+
+
+def test_every_proposal_matches_one_element(linted):
+    print("Test Every Proposed Locator Finds Exactly The Original's Single Element")
+    _, locators, snapshots = linted
+    proposed = [locator for locator in locators if locator.proposal]
+    assert proposed,"The snapshots produced no proposals"
+    for locator in proposed:
+        counts = []
+        for name, document in snapshots.items():
+            found = select(document, *locator.proposal)
+            assert found == select(document, locator.by, locator.value), \
+                f"{locator.label}: {locator.proposal} finds other elements than the original in {name}"
+            counts.append(len(found))
+        assert max(counts) == 1,f"{locator.label}: {locator.proposal} finds {max(counts)} elements in one snapshot"
+
+
+def test_patch_applies(linted, tmp_path):
+    print("Test The Emitted Patch Applies And Rewrites Exactly The Proposed Locators")
+    source, locators, _ = linted
+    patched = tmp_path / os.path.relpath(LOCATORS_PATH, PROJECT_DIR)
+    os.makedirs(patched.parent)
+    shutil.copyfile(LOCATORS_PATH, patched)
+    (tmp_path / "locators.patch").write_text(build_patch(source, locators))
+    subprocess.run(["git", "apply", "locators.patch"], cwd=tmp_path, capture_output=True, text=True, check=True)
+    proposals = {locator.label: locator.proposal or (locator.by, locator.value) for locator in locators}
+    rewritten = {locator.label: (locator.by, locator.value) for locator in scan(str(patched))[1]}
+    assert rewritten == proposals,f"Patched locators differ: {set(rewritten.items()) ^ set(proposals.items())}"
+
+
+def test_proposals_only_use_ids_of_the_real_site(linted):
+    print("Test Every Id A Proposal Relies On Is One The Hand-Written Locators Already Use")
+    source, locators, _ = linted
+    # ids the original locators were written against on www.saucedemo.com; the stand-in must not add its own
+    known = set(re.findall(r'@id\s*=\s*["\']([^"\']+)["\']', source))
+    known |= {locator.value for locator in locators if locator.by == By.ID}
+    for locator in locators:
+        if locator.proposal:
+            by, value = locator.proposal
+            used = {value} if by == By.ID else set(re.findall(r"#([\w-]+)", value))
+            assert used <= known,f"{locator.label}: {locator.proposal} relies on ids {used - known} only the stand-in has"
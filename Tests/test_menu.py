@@ -1,6 +1,6 @@
 import pytest
 
-from Locators.alllocators import LoginPageLocators, ProductPageLocators
+from Locators.alllocators import LoginPageLocators, OtherPageLocators, ProductPageLocators
 from Pages.LoginPage import LoginPage
 from Pages.OtherPage import OtherPage
 from Pages.ProductPage import ProductPage
@@ -9,7 +9,7 @@ from Pages.ProductPage import ProductPage
 @pytest.fixture()
 def open_product_page(driver):
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
     product_page = ProductPage(driver)
     product_page.add_single_item(ProductPageLocators.add_back_pack_path)
     menu =OtherPage(driver)
@@ -25,7 +25,7 @@ def test_menu_cancel(open_product_page):
     menu = open_product_page
     menu.click_menu_button()
     menu.click_menu_cancel()
-    assert menu.is_menu_sidebar_displayed(),"Menu bar is still displayed,Menu cancel button didnt work"
+    assert menu.wait_absent(OtherPageLocators.menu_container_path),"Menu bar is still displayed,Menu cancel button didnt work"
 
 def test_click_all_item(open_product_page):
     menu = open_product_page
@@ -36,8 +36,8 @@ def test_click_all_item(open_product_page):
 def test_about_redirect(open_product_page):
     menu = open_product_page
     menu.click_menu_button()
-    menu.go_to_about()
-    assert "saucelabs.com" in menu.get_current_url(),f"Not directed to about page.Directed to {menu.get_current_url()}"
+    url = menu.follow_external_link(menu.go_to_about)
+    assert "saucelabs.com" in url,f"Not directed to about page.Directed to {url}"
 
 def test_click_reset_item(open_product_page):
     menu = open_product_page
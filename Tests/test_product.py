@@ -4,32 +4,36 @@ from Locators.alllocators import LoginPageLocators, ProductPageLocators
 from Pages.LoginPage import LoginPage
 
 from Pages.ProductPage import ProductPage
+from Utils.catalogue import load_golden
 
 
 @pytest.fixture()
 def login_and_go_to_product_page(driver):
     login_page = LoginPage(driver)
-    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    login_page.fast_login(LoginPageLocators.valid_username)
     product_page = ProductPage(driver)
     print("User is in Product Page")
     return product_page
-@pytest.mark.order(4)
-def test_product_title(login_and_go_to_product_page):
+@pytest.fixture()
+def read_only_product_page(read_only_driver):
+    """Logged-in product page for tests that only read it; with --read-only-tabs each gets a shared-browser tab"""
+    return ProductPage(read_only_driver)
+@pytest.mark.read_only
+def test_product_title(read_only_product_page):
     print("Product Title Test")
-    assert login_and_go_to_product_page.get_page_title() == "Products",f"Product title should be visible after clicking show product button: Got title:{login_and_go_to_product_page.get_page_title().text}"
+    assert read_only_product_page.get_page_title() == "Products",f"Product title should be visible after clicking show product button: Got title:{read_only_product_page.get_page_title()}"
 
-@pytest.mark.order(5)
-def test_product_url(login_and_go_to_product_page):
-    assert login_and_go_to_product_page.get_current_url()==ProductPageLocators.ProductPageUrl,f"Got{login_and_go_to_product_page.get_current_url()} Expected:{ProductPageLocators.ProductPageUrl}"
-@pytest.mark.order(6)
-def test_item_count(login_and_go_to_product_page):
+@pytest.mark.read_only
+def test_product_url(read_only_product_page):
+    assert read_only_product_page.get_current_url()==ProductPageLocators.ProductPageUrl,f"Got{read_only_product_page.get_current_url()} Expected:{ProductPageLocators.ProductPageUrl}"
+@pytest.mark.read_only
+def test_item_count(read_only_product_page):
     print("Item Total Count of items at product Page Test")
-    product_page = login_and_go_to_product_page
+    product_page = read_only_product_page
     assert product_page.get_item_count()==6,f"Total item count should be 6: Got {product_page.get_item_count()}"
     assert product_page.is_displayed(ProductPageLocators.title_path)
     assert product_page.is_displayed(ProductPageLocators.cart_button_path)
     assert product_page.is_displayed(ProductPageLocators.select_filter_path)
-@pytest.mark.order(7)
 def test_add_remove_all_items(login_and_go_to_product_page):
     print("Adding All Items Test")
     product_page = login_and_go_to_product_page
@@ -40,7 +44,6 @@ def test_add_remove_all_items(login_and_go_to_product_page):
     product_page.remove_all_item()
     assert product_page.get_cart_count() == 0, f"Total cart item count should be 0: Got {product_page.get_cart_count()}"
     print("All Items Removed successfully")
-@pytest.mark.order(8)
 def test_add_item_and_remove_item(login_and_go_to_product_page):
     print("Adding single Item ")
     product_page =login_and_go_to_product_page
@@ -59,7 +62,6 @@ def test_add_item_and_remove_item(login_and_go_to_product_page):
     product_page.remove_single_item(ProductPageLocators.remove_Jacket_path)
     assert product_page.get_cart_count() == 0,f"Expected 0 items in the cart counter.Got {product_page.get_cart_count()}"
     print("Item Removed successfully Cart item reset to 0")
-@pytest.mark.order(9)
 def test_sorting(login_and_go_to_product_page):
     print("Sorting Test")
     product_page = login_and_go_to_product_page
@@ -87,7 +89,6 @@ def test_sorting(login_and_go_to_product_page):
     item_name = product_page.get_all_items_names()
     result = product_page.is_sorted_ascending(item_name)
     assert result == True, "Item are not sorted according to Name(A to Z)"
-@pytest.mark.order(10)
 @pytest.mark.parametrize("sort_option,expected_result", [("Name (A to Z)","ascending"),("Name (Z to A)","descending"),
                                                          ("Price (low to high)","ascending"),("Price (high to low)","descending"),])
 def test_sorting_using_parametrize(login_and_go_to_product_page,sort_option,expected_result):
@@ -102,7 +103,6 @@ def test_sorting_using_parametrize(login_and_go_to_product_page,sort_option,expe
     else:
         assert product_page.is_sorted_descending(items)
 
-@pytest.mark.order(11)
 def test_click_to_cart_button(login_and_go_to_product_page):
     print("Test Going to cart Inventory")
     product_page = login_and_go_to_product_page
@@ -111,3 +111,12 @@ def test_click_to_cart_button(login_and_go_to_product_page):
     assert "cart" in product_page.get_current_url(),f"Cart page not found: found url:{product_page.get_current_url()}"
 
 
+
+
+@pytest.mark.parametrize("item_name", list(load_golden()))
+def test_inventory_matches_catalogue(catalogue_diff, item_name):
+    problems = catalogue_diff.problems(item_name)
+    assert not problems, "; ".join(problems)
+
+def test_no_unexpected_inventory_items(catalogue_diff):
+    assert not catalogue_diff.unexpected, f"Items not in the golden catalogue: {catalogue_diff.unexpected}"
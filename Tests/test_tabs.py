@@ -0,0 +1,72 @@
+from Utils.driver_pool import DriverPool
+from Utils.tabs import ReadOnlyTabs
+
+BASE_URL = "https://www.saucedemo.com/"
+
+
+class FakeDriver:
+    """Windows, the URL each one shows, and the calls a DriverPool reset makes"""
+
+    def __init__(self):
+        self.windows = {"main": BASE_URL}
+        self.current_window_handle = "main"
+        self.switch_to = self
+        self.opened = 0
+
+    @property
+    def window_handles(self):
+        return list(self.windows)
+
+    @property
+    def current_url(self):
+        return self.windows[self.current_window_handle]
+
+    def new_window(self, kind):
+        self.opened += 1
+        self.current_window_handle = f"tab{self.opened}"
+        self.windows[self.current_window_handle] = "about:blank"
+
+    def window(self, handle):
+        self.current_window_handle = handle
+
+    def close(self):
+        del self.windows[self.current_window_handle]
+
+    def execute_script(self, script, *args):
+        if args:
+            self.windows[self.current_window_handle] = args[0]
+
+    def get(self, url):
+        self.windows[self.current_window_handle] = url
+
+    def delete_all_cookies(self):
+        pass
+
+
+def _run(tabs, pool, key, upcoming, logins):
+    driver = tabs.take(pool, key, upcoming, logins.append)
+    url = driver.current_url
+    tabs.give_back(pool, key)
+    return url
+
+
+def test_back_to_back_tests_share_tabs():
+    print("Test Read-Only Tests Run Back To Back Get Tabs Opened By The First One")
+    pool, tabs, logins = DriverPool(FakeDriver, BASE_URL), ReadOnlyTabs(), []
+    upcoming = [(f"test_{n}", f"{BASE_URL}inventory.html?{n}") for n in range(3)]
+    urls = [_run(tabs, pool, key, upcoming[index:], logins) for index, (key, _) in enumerate(upcoming)]
+    assert urls == [url for _, url in upcoming],f"Each test should land on its own tab, got {urls}"
+    assert len(logins) == 1,f"Expected one login for the group, got {len(logins)}"
+    driver = pool.acquire(reset=False)
+    assert driver.opened == 3 and driver.window_handles == ["main"],f"Tabs left open: {driver.window_handles}"
+
+
+def test_reset_browser_reopens_tabs():
+    print("Test A Browser Reset Between Read-Only Tests Makes The Next One Open Its Tabs Again")
+    pool, tabs, logins = DriverPool(FakeDriver, BASE_URL), ReadOnlyTabs(), []
+    upcoming = [("test_a", f"{BASE_URL}inventory.html"), ("test_b", f"{BASE_URL}cart.html")]
+    _run(tabs, pool, "test_a", upcoming, logins)
+    # another test takes the browser in between; the pool's reset closes the pre-opened tab
+    pool.release(pool.acquire())
+    assert _run(tabs, pool, "test_b", upcoming[1:], logins) == f"{BASE_URL}cart.html"
+    assert len(logins) == 2,f"Expected a second login after the reset, got {len(logins)}"
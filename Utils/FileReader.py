@@ -1,14 +1,4 @@
-import csv
+from Utils.data_provider import read_rows
 def load_csv_data(file_path):
-    rows=[]
-    try:
-        with open(file_path, 'r') as datafile:
-            reader = csv.reader(datafile)
-            next(reader)
-            for row in reader:
-                rows.append(tuple(row))
-        return rows
-    except FileNotFoundError:
-        raise Exception(f"File not found:{file_path}")
-    except Exception as e:
-        raise Exception(f"Error reading file:{e}")
\ No newline at end of file
+    """Rows as tuples (header skipped); kept for older tests, see Utils.data_provider"""
+    return list(read_rows(file_path, as_dict=False))
@@ -0,0 +1,383 @@
+"""Select the tests a git diff can affect, from a static test -> fixture -> page method -> locator graph.
+
+    python -m Utils.affected [--base HEAD] [-v]       node ids of the affected tests, one per line
+    pytest --affected-by origin/main                  run only those tests
+
+Every .py file is parsed once and its facts (symbols, line spans, references) are cached in
+artifacts/dependency_index.json; later runs only re-parse files whose mtime or size changed.
+Receivers the parser cannot type (fixture values, driver) match every method with that name, and any
+change it cannot pin to a symbol (a hook, module-level code, a deleted module) selects the whole suite.
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import deque
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+INDEX_PATH = os.path.join(PROJECT_DIR, "artifacts", "dependency_index.json")
+INDEX_VERSION = 1
+SKIP_DIRS = {"__pycache__", "artifacts", "venv", ".venv", "node_modules"}
+DATA_EXTENSIONS = (".csv", ".json")
+# changes to these never affect a test run
+IGNORED_FILES = re.compile(r"(\.md|\.txt|\.jsonl|\.gitignore|\.patch)$")
+HUNK = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+ALL = "*"
+
+
+def module_name(rel_path):
+    """'Pages/CartPage.py' -> 'Pages.CartPage'"""
+    return rel_path[:-3].replace("/", ".").removesuffix(".__init__")
+
+
+def _is_fixture(decorator):
+    target = decorator.func if isinstance(decorator, ast.Call) else decorator
+    return isinstance(target, ast.Attribute) and target.attr == "fixture"
+
+
+def _span(node):
+    start = min([node.lineno] + [decorator.lineno for decorator in getattr(node, "decorator_list", [])])
+    return [start, node.end_lineno]
+
+
+def _local_types(function):
+    """{variable: class name} for `x = SomeClass(...)` and `x = SomeClass(...).open(...)` assignments"""
+    types = {}
+    for node in ast.walk(function):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            value = node.value
+            if isinstance(value, ast.Call) and isinstance(value.func, ast.Attribute):
+                value = value.func.value
+            if isinstance(value, ast.Call) and isinstance(value.func, ast.Name):
+                types[node.targets[0].id] = value.func.id
+    return types
+
+
+def _references(node, owner=None):
+    """Raw references of a def/class/assignment, in terms of the names visible in its module"""
+    local_types = _local_types(node) if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) else {}
+    refs = []
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load):
+            refs.append(["name", child.id])
+        elif isinstance(child, ast.Attribute):
+            value = child.value
+            if isinstance(value, ast.Name) and value.id in ("self", "cls") and owner:
+                refs.append(["attr", owner, child.attr])
+            elif isinstance(value, ast.Name):
+                refs.append(["attr", local_types.get(value.id, value.id), child.attr])
+            elif isinstance(value, ast.Call) and isinstance(value.func, ast.Name):
+                refs.append(["attr", value.func.id, child.attr])
+            else:
+                refs.append(["method", child.attr])
+        elif isinstance(child, ast.Constant) and isinstance(child.value, str) \
+                and child.value.endswith(DATA_EXTENSIONS) and "\n" not in child.value:
+            refs.append(["data", os.path.basename(child.value)])
+    return [list(ref) for ref in dict.fromkeys(map(tuple, refs))]
+
+
+def _function_symbol(node, kind, owner=None):
+    refs = _references(node, owner)
+    if kind in ("test", "fixture"):
+        refs += [["fixture", arg.arg] for arg in node.args.args]
+    return {"kind": kind, "lines": _span(node), "refs": refs}
+
+
+def extract(source, rel_path):
+    """Facts about one module: imports, symbols with line spans and raw references, unowned statements"""
+    tree = ast.parse(source)
+    is_test_file = os.path.basename(rel_path).startswith("test_")
+    imports = {}
+    symbols = {}
+    other = []
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom):
+            for alias in node.names:
+                imports[alias.asname or alias.name] = f"{node.module or ''}:{alias.name}"
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                imports[alias.asname or alias.name.split(".")[0]] = f"{alias.name}:"
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if any(_is_fixture(decorator) for decorator in node.decorator_list):
+                kind = "fixture"
+            elif node.name.startswith("test") and is_test_file:
+                kind = "test"
+            elif node.name.startswith("pytest_"):
+                kind = "hook"
+            else:
+                kind = "function"
+            symbols[node.name] = _function_symbol(node, kind)
+        elif isinstance(node, ast.ClassDef):
+            header_refs = [ref for expression in node.bases + node.decorator_list for ref in _references(expression)]
+            symbols[node.name] = {"kind": "class", "lines": _span(node), "refs": header_refs,
+                                  "bases": [ast.unparse(base) for base in node.bases]}
+            for member in node.body:
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    kind = "test" if member.name.startswith("test") and is_test_file else "method"
+                    symbols[f"{node.name}.{member.name}"] = _function_symbol(member, kind, node.name)
+                elif isinstance(member, (ast.Assign, ast.AnnAssign)):
+                    targets = member.targets if isinstance(member, ast.Assign) else [member.target]
+                    for target in targets:
+                        if isinstance(target, ast.Name):
+                            symbols[f"{node.name}.{target.id}"] = {"kind": "attr", "lines": _span(member),
+                                                                   "refs": _references(member.value, node.name)
+                                                                   if member.value else []}
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    symbols[target.id] = {"kind": "constant", "lines": _span(node),
+                                          "refs": _references(node.value) if node.value else []}
+        elif not (isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant)) \
+                and not (isinstance(node, ast.If) and "__main__" in ast.unparse(node.test)):
+            # module-level code that isn't a definition or the script entry point: owned by everything
+            other.append(_span(node))
+    return {"module": module_name(rel_path), "test_file": is_test_file, "imports": imports,
+            "symbols": symbols, "other": other}
+
+
+def _python_files(root):
+    for directory, subdirs, files in os.walk(root):
+        subdirs[:] = sorted(name for name in subdirs if name not in SKIP_DIRS and not name.startswith("."))
+        for name in sorted(files):
+            if name.endswith(".py"):
+                yield os.path.relpath(os.path.join(directory, name), root).replace(os.sep, "/")
+
+
+class DependencyIndex:
+    """Per-file facts (cached, re-parsed only when a file changes) linked into a symbol graph"""
+
+    def __init__(self, root=PROJECT_DIR, cache_path=INDEX_PATH):
+        self.root = root
+        self.cache_path = cache_path
+        self.files = {}
+        self.reparsed = []
+
+    def build(self):
+        cached = self._load_cache()
+        for rel_path in _python_files(self.root):
+            stat = os.stat(os.path.join(self.root, rel_path))
+            entry = cached.get(rel_path)
+            if entry is None or entry["mtime"] != stat.st_mtime or entry["size"] != stat.st_size:
+                with open(os.path.join(self.root, rel_path), encoding="utf-8") as source_file:
+                    try:
+                        facts = extract(source_file.read(), rel_path)
+                    except SyntaxError as e:
+                        print(f"Skipping {rel_path}, it does not parse: {e}", file=sys.stderr)
+                        continue
+                entry = {"mtime": stat.st_mtime, "size": stat.st_size, "facts": facts}
+                self.reparsed.append(rel_path)
+            self.files[rel_path] = entry
+        if self.cache_path and (self.reparsed or set(cached) != set(self.files)):
+            self._save_cache()
+        self._link()
+        return self
+
+    def _load_cache(self):
+        """Cached per-file facts; a missing, stale-version or unreadable cache is an empty one"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable dependency index {self.cache_path}: {e}", file=sys.stderr)
+            return {}
+        return data["files"] if isinstance(data, dict) and data.get("version") == INDEX_VERSION else {}
+
+    def _save_cache(self):
+        # written next to the cache and swapped in, so a concurrent reader never sees a half-written file
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        temporary = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as cache_file:
+            json.dump({"version": INDEX_VERSION, "files": self.files}, cache_file)
+        os.replace(temporary, self.cache_path)
+
+    def _link(self):
+        self.modules = {entry["facts"]["module"]: (path, entry["facts"]) for path, entry in self.files.items()}
+        self.methods = {}
+        for module, (_, facts) in self.modules.items():
+            for name, symbol in facts["symbols"].items():
+                if symbol["kind"] in ("method", "attr"):
+                    self.methods.setdefault(name.split(".", 1)[1], []).append(f"{module}:{name}")
+        self.edges = {}
+        for module, (_, facts) in self.modules.items():
+            for name, symbol in facts["symbols"].items():
+                targets = set()
+                for ref in symbol["refs"]:
+                    targets.update(self._resolve_ref(module, ref))
+                if symbol["kind"] == "class":
+                    targets.update(self._class_id(module, base) for base in symbol["bases"])
+                    for hook in ("__init__", "__init_subclass__"):
+                        if f"{name}.{hook}" in facts["symbols"]:
+                            targets.add(f"{module}:{name}.{hook}")
+                targets.discard(None)
+                self.edges[f"{module}:{name}"] = targets
+
+    def _lookup(self, module, name, depth=0):
+        """Symbol id a name refers to inside module, following imports (and re-exports) of indexed modules"""
+        facts = self.modules.get(module, (None, None))[1]
+        if facts is None or depth > 5:
+            return None
+        if name in facts["symbols"]:
+            return f"{module}:{name}"
+        target = facts["imports"].get(name)
+        if target is None:
+            return None
+        target_module, _, target_name = target.partition(":")
+        return self._lookup(target_module, target_name, depth + 1) if target_name else None
+
+    def _class_id(self, module, name):
+        symbol_id = self._lookup(module, name)
+        return symbol_id if symbol_id and self._symbol(symbol_id)["kind"] == "class" else None
+
+    def _symbol(self, symbol_id):
+        module, _, name = symbol_id.partition(":")
+        return self.modules[module][1]["symbols"][name]
+
+    def _member(self, class_id, attr, depth=0):
+        """The symbol that attr resolves to on a class, walking its bases"""
+        module, _, name = class_id.partition(":")
+        symbols = self.modules[module][1]["symbols"]
+        if f"{name}.{attr}" in symbols:
+            return f"{module}:{name}.{attr}"
+        for base in symbols[name]["bases"]:
+            base_id = self._class_id(module, base)
+            if base_id and depth < 10:
+                found = self._member(base_id, attr, depth + 1)
+                if found:
+                    return found
+        return None
+
+    def _resolve_ref(self, module, ref):
+        kind = ref[0]
+        if kind == "name":
+            return [self._lookup(module, ref[1])]
+        if kind == "data":
+            return [f"data:{ref[1]}"]
+        if kind == "fixture":
+            local = self.modules[module][1]["symbols"].get(ref[1])
+            if local and local["kind"] == "fixture":
+                return [f"{module}:{ref[1]}"]
+            shared = self.modules.get("conftest", (None, {"symbols": {}}))[1]["symbols"].get(ref[1])
+            return [f"conftest:{ref[1]}"] if shared and shared["kind"] == "fixture" else []
+        if kind == "attr":
+            target = self._lookup(module, ref[1])
+            if target and self._symbol(target)["kind"] == "class":
+                return [self._member(target, ref[2]) or target]
+            # an instance (step_timer), a parameter or a fixture value: any method with that name
+            return [target] + self.methods.get(ref[2], [])
+        return self.methods.get(ref[1], [])
+
+    def tests(self):
+        """{pytest node id: symbol id} of every test function"""
+        found = {}
+        for module, (path, facts) in self.modules.items():
+            if facts["test_file"]:
+                for name, symbol in facts["symbols"].items():
+                    if symbol["kind"] == "test":
+                        found[f"{path}::{name.replace('.', '::')}"] = f"{module}:{name}"
+        return found
+
+    def reachable(self, symbol_id):
+        seen = {symbol_id}
+        queue = deque([symbol_id])
+        while queue:
+            for target in self.edges.get(queue.popleft(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return seen
+
+    def symbols_at(self, rel_path, lines):
+        """Symbols owning the changed lines of one file; ALL when a line is module-level code or a hook"""
+        facts = self.files[rel_path]["facts"]
+        changed = set()
+        for line in lines:
+            owners = [(symbol["lines"][1] - symbol["lines"][0], name) for name, symbol in facts["symbols"].items()
+                      if symbol["lines"][0] <= line <= symbol["lines"][1]]
+            if owners:
+                name = min(owners)[1]
+                if facts["symbols"][name]["kind"] == "hook":
+                    return ALL
+                changed.add(f"{facts['module']}:{name}")
+            elif any(start <= line <= end for start, end in facts["other"]):
+                return ALL
+        return changed
+
+    def changed_symbols(self, changes):
+        """Symbol ids (or ALL) touched by {path: [new-side line numbers] or None for deleted}"""
+        changed = set()
+        for rel_path, lines in changes.items():
+            if rel_path.startswith("Data/"):
+                changed.add(f"data:{os.path.basename(rel_path)}")
+            elif rel_path in self.files and lines is not None:
+                symbols = self.symbols_at(rel_path, lines)
+                if symbols == ALL:
+                    return ALL
+                changed |= symbols
+            elif not IGNORED_FILES.search(rel_path):
+                # deleted modules, the local site's HTML/JS, config files: can't tell who depends on them
+                return ALL
+        return changed
+
+    def affected(self, changes):
+        """Sorted node ids of the tests that can reach anything in changes, and the changed symbols"""
+        changed = self.changed_symbols(changes)
+        tests = self.tests()
+        if changed == ALL:
+            return sorted(tests), ALL
+        return sorted(node_id for node_id, symbol_id in tests.items() if self.reachable(symbol_id) & changed), changed
+
+
+def git_changes(base="HEAD", root=PROJECT_DIR):
+    """{path: [changed line numbers in the working tree] or None when deleted} since base, untracked files included"""
+    diff = subprocess.run(["git", "diff", "--unified=0", "--no-color", "--no-ext-diff", "--no-renames", base, "--"],
+                          cwd=root, capture_output=True, text=True, check=True).stdout
+    changes = {}
+    old_path = path = None
+    for line in diff.splitlines():
+        if line.startswith("--- "):
+            old_path = line[6:] if line.startswith("--- a/") else None
+        elif line.startswith("+++ "):
+            path = line[6:] if line.startswith("+++ b/") else None
+            if path is None:
+                changes[old_path] = None
+            else:
+                changes.setdefault(path, [])
+        elif path and (match := HUNK.match(line)):
+            start, count = int(match.group(1)), int(match.group(2) or 1)
+            # a pure deletion (count 0) sits between start and start + 1
+            changes[path].extend(range(start, start + count) if count else (start, start + 1))
+    untracked = subprocess.run(["git", "ls-files", "--others", "--exclude-standard"],
+                               cwd=root, capture_output=True, text=True, check=True).stdout
+    for path in untracked.splitlines():
+        if path.endswith(".py"):
+            with open(os.path.join(root, path), encoding="utf-8") as new_file:
+                changes[path] = list(range(1, sum(1 for _ in new_file) + 2))
+        else:
+            changes[path] = []
+    return changes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base", default="HEAD", help="git revision to diff the working tree against")
+    parser.add_argument("-v", "--verbose", action="store_true", help="also print the changed symbols to stderr")
+    args = parser.parse_args(argv)
+
+    index = DependencyIndex().build()
+    tests, changed = index.affected(git_changes(args.base))
+    if args.verbose:
+        print(f"re-parsed {len(index.reparsed)} of {len(index.files)} file(s)", file=sys.stderr)
+        print("changed: " + ("everything" if changed == ALL else ", ".join(sorted(changed)) or "nothing"),
+              file=sys.stderr)
+    for node_id in tests:
+        print(node_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import base64
+import gzip
+import hashlib
+import json
+import os
+import queue
+import re
+import threading
+import time
+
+from selenium.common import WebDriverException
+
+# URL, title and the serialized DOM in one round-trip (page_source and current_url would be two more)
+CAPTURE_SCRIPT = """
+return {url: window.location.href, title: document.title,
+        dom: '<!DOCTYPE html>\\n' + document.documentElement.outerHTML};
+"""
+
+
+def capture_failure(driver):
+    """Everything worth keeping about a failed page, in three WebDriver calls; no encoding or disk work here"""
+    page = driver.execute_script(CAPTURE_SCRIPT)
+    page["cookies"] = driver.get_cookies()
+    page["screenshot"] = driver.get_screenshot_as_base64()
+    return page
+
+
+class ArtifactWriter:
+    """Writes failure artifacts on a background thread so a failing test's teardown never waits on disk.
+
+    Screenshots and DOM dumps are stored once under objects/<sha256>, so the same page failing in several
+    tests costs one file; tests/<test>.json records the URL, cookies and which objects belong to it."""
+
+    def __init__(self, root):
+        self.root = root
+        self.objects = os.path.join(root, "objects")
+        self.tests = os.path.join(root, "tests")
+        self._queue = queue.Queue()
+        self._thread = None
+        self.written = 0
+        self.deduplicated = 0
+
+    def submit(self, test_id, capture):
+        if self._thread is None:
+            os.makedirs(self.objects, exist_ok=True)
+            os.makedirs(self.tests, exist_ok=True)
+            self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+            self._thread.start()
+        self._queue.put((test_id, capture, time.time()))
+
+    def close(self):
+        """Wait for the queued artifacts to be on disk"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                self._write(*job)
+            except (OSError, ValueError) as e:
+                print(f"Could not write failure artifacts for {job[0]}: {e}")
+
+    def _write(self, test_id, capture, captured_at):
+        manifest = {
+            "test": test_id,
+            "captured_at": captured_at,
+            "url": capture["url"],
+            "title": capture["title"],
+            "cookies": capture["cookies"],
+            "screenshot": self._store(base64.b64decode(capture["screenshot"]), ".png"),
+            "dom": self._store(capture["dom"].encode("utf-8"), ".html.gz", compress=True),
+        }
+        name = re.sub(r"[^\w.-]+", "_", test_id).strip("_")
+        with open(os.path.join(self.tests, f"{name}.json"), "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+
+    def _store(self, content, extension, compress=False):
+        """Path (relative to root) of the object holding content, written only if it isn't there yet"""
+        digest = hashlib.sha256(content).hexdigest()
+        relative = os.path.join("objects", digest[:2], digest + extension)
+        path = os.path.join(self.root, relative)
+        if os.path.exists(path):
+            self.deduplicated += 1
+            return relative
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{threading.get_ident()}.tmp"
+        with open(temporary, "wb") as object_file:
+            # mtime=0 keeps the gzip bytes a pure function of the content
+            object_file.write(gzip.compress(content, mtime=0) if compress else content)
+        os.replace(temporary, path)
+        self.written += 1
+        return relative
+
+
+def save_failure(writer, test_id, driver):
+    """Capture the page and queue it for writing; a dead browser only costs a printed warning"""
+    try:
+        capture = capture_failure(driver)
+    except WebDriverException as e:
+        print(f"Could not capture failure artifacts for {test_id}: {e}")
+        return
+    writer.submit(test_id, capture)
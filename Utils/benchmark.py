@@ -0,0 +1,193 @@
+"""Benchmark page-object primitives and journeys against the bundled offline site.
+
+    python -m Utils.benchmark [-n 30] [--warmup 3] [--output artifacts/benchmark.json]
+    python -m Utils.benchmark --baseline Data/benchmark_baseline.json           fail on regressions
+    python -m Utils.benchmark --save-baseline Data/benchmark_baseline.json      record a new baseline
+
+A benchmark regresses when its p50 grows by more than --tolerance (default 25%) over the baseline,
+or when it needs more WebDriver round-trips than the baseline did.
+
+No baseline is committed: timings depend on the machine and browser, so record one where the
+comparison will run. A --baseline path that doesn't exist yet is reported and skipped, not failed.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from Locators.alllocators import CheckoutPageLocators, LoginPageLocators, ProductPageLocators, set_base_url
+from Pages.BasePage import BasePage
+from Pages.CartPage import CartPage
+from Pages.CheckoutOverviewPage import CheckoutOverviewPage
+from Pages.CheckoutPage import CheckoutPage
+from Pages.LoginPage import LoginPage
+from Pages.ProductPage import ProductPage
+from Utils.browser_profiles import PROFILES
+from Utils.command_counter import CommandCounter
+from Utils.local_site.server import LocalSauceDemo
+from Utils.workers import WorkerDirs
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Benchmark:
+    """setup(driver) runs untimed before every repeat, run(driver) is what gets timed"""
+
+    def __init__(self, name, setup, run):
+        self.name = name
+        self.setup = setup
+        self.run = run
+
+
+def percentile(samples, percent):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def _clean_login_page(driver):
+    driver.get(LoginPageLocators.loginpageUrl)
+    driver.delete_all_cookies()
+    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    driver.get(LoginPageLocators.loginpageUrl)
+
+
+def _inventory(driver, cart=()):
+    ProductPage(driver).open(cart=cart)
+
+
+def _login(driver):
+    login_page = LoginPage(driver)
+    login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+    if not login_page.is_login_successful():
+        raise Exception("Benchmark login failed")
+
+
+def _checkout(driver):
+    product_page = ProductPage(driver)
+    product_page.add_single_item(ProductPageLocators.add_back_pack_path)
+    product_page.click_on_cart_button()
+    CartPage(driver).click_checkout_button()
+    CheckoutPage(driver).enter_checkout_info(CheckoutPageLocators.valid_first_name,
+                                             CheckoutPageLocators.valid_last_name,
+                                             CheckoutPageLocators.valid_zip_code)
+    overview = CheckoutOverviewPage(driver)
+    overview.click_finish_button()
+    if not overview.wait_for_page_load("checkout-complete"):
+        raise Exception("Benchmark checkout did not finish")
+
+
+BENCHMARKS = [
+    Benchmark("find_element", _clean_login_page,
+              lambda driver: BasePage(driver).find_element(LoginPageLocators.username_field)),
+    Benchmark("type_in_element", _clean_login_page,
+              lambda driver: BasePage(driver).type_in_element(LoginPageLocators.username_field,
+                                                              LoginPageLocators.valid_username)),
+    Benchmark("click_element", _inventory,
+              lambda driver: BasePage(driver).click_element(ProductPageLocators.add_back_pack_path)),
+    Benchmark("get_all_items_names", _inventory, lambda driver: ProductPage(driver).get_all_items_names()),
+    Benchmark("get_cart_items", lambda driver: CartPage(driver).open(cart=[4, 5]),
+              lambda driver: CartPage(driver).get_cart_items()),
+    Benchmark("login_journey", _clean_login_page, _login),
+    Benchmark("checkout_journey", _inventory, _checkout),
+]
+
+
+def run_benchmark(driver, counter, benchmark, repeats, warmup):
+    seconds = []
+    round_trips = []
+    for iteration in range(warmup + repeats):
+        benchmark.setup(driver)
+        counter.reset()
+        start = time.perf_counter()
+        benchmark.run(driver)
+        elapsed = time.perf_counter() - start
+        if iteration >= warmup:
+            seconds.append(elapsed)
+            round_trips.append(counter.total)
+    return {
+        "repeats": repeats,
+        "p50": percentile(seconds, 50),
+        "p95": percentile(seconds, 95),
+        "p99": percentile(seconds, 99),
+        "mean": sum(seconds) / len(seconds),
+        "round_trips": percentile(round_trips, 50),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Readable regressions of results against a baseline of the same shape"""
+    regressions = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result["p50"] > before["p50"] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {result['p50'] * 1000:.1f}ms vs baseline {before['p50'] * 1000:.1f}ms")
+        if result["round_trips"] > before["round_trips"]:
+            regressions.append(f"{name}: {result['round_trips']} round-trips vs baseline {before['round_trips']}")
+    return regressions
+
+
+def load_baseline(path):
+    """The results of a baseline file, or None when there is none at path yet"""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as baseline_file:
+        return json.load(baseline_file)["results"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", "--repeats", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--browser-profile", default="headless-firefox", choices=sorted(PROFILES))
+    parser.add_argument("--only", nargs="*", help="benchmark names to run (default: all)")
+    parser.add_argument("--output", default=os.path.join("artifacts", "benchmark.json"))
+    parser.add_argument("--baseline", help="compare against this results file and exit 1 on regressions "
+                                           "(skipped if it doesn't exist yet)")
+    parser.add_argument("--save-baseline", help="also write the results here as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p50 growth over the baseline")
+    args = parser.parse_args(argv)
+
+    site = LocalSauceDemo().start()
+    set_base_url(site.url)
+    worker_dirs = WorkerDirs(os.path.join(PROJECT_DIR, "artifacts"), "benchmark")
+    driver = PROFILES[args.browser_profile].launch(worker_dirs)
+    # round-trips are reported and compared against the baseline instead of failing mid-run
+    CommandCounter.budget_mode = "off"
+    counter = CommandCounter.of(driver)
+    results = {}
+    try:
+        for benchmark in BENCHMARKS:
+            if args.only and benchmark.name not in args.only:
+                continue
+            results[benchmark.name] = result = run_benchmark(driver, counter, benchmark, args.repeats, args.warmup)
+            print(f"{benchmark.name:20} p50 {result['p50'] * 1000:8.1f}ms  p95 {result['p95'] * 1000:8.1f}ms  "
+                  f"p99 {result['p99'] * 1000:8.1f}ms  {result['round_trips']:4d} round-trips")
+    finally:
+        driver.quit()
+        worker_dirs.remove_profiles()
+        site.stop()
+
+    report = {"profile": args.browser_profile, "repeats": args.repeats, "warmup": args.warmup, "results": results}
+    for path in filter(None, (args.output, args.save_baseline)):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    if args.baseline and baseline is None:
+        print(f"No baseline at {args.baseline}; nothing to compare (record one with --save-baseline)")
+    elif baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+from selenium import webdriver
+
+# prefs that stop Firefox phoning home or loading add-ons during a test run
+FIREFOX_LEAN_PREFS = {
+    "toolkit.telemetry.enabled": False,
+    "toolkit.telemetry.unified": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "app.update.enabled": False,
+    "app.normandy.enabled": False,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.homepage_override.mstone": "ignore",
+    "extensions.enabledScopes": 0,
+    "extensions.autoDisableScopes": 15,
+    "extensions.update.enabled": False,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "network.prefetch-next": False,
+}
+
+CHROMIUM_LEAN_ARGS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
+
+class BrowserProfile:
+    """How to start one browser: engine, headless, viewport, images and page load strategy"""
+
+    def __init__(self, name, browser="firefox", headless=False, window_size=None, images=True, lean=False,
+                 page_load_strategy="normal"):
+        self.name = name
+        self.browser = browser
+        self.headless = headless
+        # None keeps the old behaviour of maximizing the window
+        self.window_size = window_size
+        self.images = images
+        self.lean = lean
+        self.page_load_strategy = page_load_strategy
+
+    def launch(self, worker_dirs):
+        if self.browser == "firefox":
+            driver = webdriver.Firefox(options=self.firefox_options(worker_dirs))
+        elif self.browser == "chromium":
+            driver = webdriver.Chrome(options=self.chromium_options(worker_dirs))
+        else:
+            raise Exception(f"Unknown browser {self.browser} in profile {self.name}")
+        if self.window_size is None:
+            driver.maximize_window()
+        return driver
+
+    def firefox_options(self, worker_dirs):
+        options = webdriver.FirefoxOptions()
+        options.page_load_strategy = self.page_load_strategy
+        options.add_argument("-profile")
+        options.add_argument(worker_dirs.new_profile())
+        options.set_preference("browser.download.folderList", 2)
+        options.set_preference("browser.download.dir", worker_dirs.downloads)
+        if self.headless:
+            options.add_argument("-headless")
+        if self.window_size is not None:
+            options.add_argument(f"--width={self.window_size[0]}")
+            options.add_argument(f"--height={self.window_size[1]}")
+        if not self.images:
+            options.set_preference("permissions.default.image", 2)
+        if self.lean:
+            for name, value in FIREFOX_LEAN_PREFS.items():
+                options.set_preference(name, value)
+        return options
+
+    def chromium_options(self, worker_dirs):
+        options = webdriver.ChromeOptions()
+        options.page_load_strategy = self.page_load_strategy
+        options.add_argument(f"--user-data-dir={worker_dirs.new_profile()}")
+        options.add_experimental_option("prefs", {"download.default_directory": worker_dirs.downloads})
+        if self.headless:
+            options.add_argument("--headless=new")
+        if self.window_size is not None:
+            options.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
+        if not self.images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+        if self.lean:
+            for argument in CHROMIUM_LEAN_ARGS:
+                options.add_argument(argument)
+        return options
+
+
+VIEWPORT = (1280, 800)
+
+PROFILES = {profile.name: profile for profile in (
+    BrowserProfile("headed-firefox"),
+    BrowserProfile("headless-firefox", headless=True, window_size=VIEWPORT),
+    BrowserProfile("headless-chromium", browser="chromium", headless=True, window_size=VIEWPORT),
+    BrowserProfile("lean-firefox", headless=True, window_size=VIEWPORT, images=False, lean=True,
+                   page_load_strategy="eager"),
+    BrowserProfile("lean-chromium", browser="chromium", headless=True, window_size=VIEWPORT, images=False,
+                   lean=True, page_load_strategy="eager"),
+)}
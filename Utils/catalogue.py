@@ -0,0 +1,94 @@
+import json
+import os
+from functools import lru_cache
+
+from Utils.data_provider import data_path
+from Utils.models import Product, to_cents
+
+GOLDEN_FILE = "catalogue.json"
+
+
+def add_button_id(name):
+    """'Sauce Labs Backpack' -> 'add-to-cart-sauce-labs-backpack', the id saucedemo derives from the name"""
+    return "add-to-cart-" + name.lower().replace(" ", "-")
+
+
+def image_stem(src):
+    """'/static/media/sauce-backpack-1200x1500.0a0b85a3.jpg' -> 'sauce-backpack-1200x1500' (build hash dropped)"""
+    return os.path.basename(src).split(".", 1)[0]
+
+
+@lru_cache(maxsize=None)
+def _golden_entries(file_name):
+    with open(data_path(file_name), encoding="utf-8") as catalogue_file:
+        return json.load(catalogue_file)
+
+
+@lru_cache(maxsize=None)
+def load_golden(file_name=GOLDEN_FILE):
+    """{name: Product} of the expected catalogue in Data/catalogue.json, read once per process"""
+    entries = _golden_entries(file_name)
+    return {entry["name"]: Product(name=entry["name"],
+                                   description=entry["desc"],
+                                   price_cents=to_cents(entry["price"]),
+                                   image=entry["image"],
+                                   item_id=f"item_{entry['id']}",
+                                   button_id=add_button_id(entry["name"]))
+            for entry in entries}
+
+
+def checkout_rows(file_name=GOLDEN_FILE):
+    """Expected one-item checkout overview for every golden item: name, add-to-cart button id and
+    price, tax and total in cents. Tax and total are written out in the catalogue rather than computed,
+    so the overview is checked against known figures and not against a copy of the site's arithmetic."""
+    return [{"item_name": entry["name"], "item_id": add_button_id(entry["name"]), "price": to_cents(entry["price"]),
+             "tax": to_cents(entry["tax"]), "total": to_cents(entry["total"])}
+            for entry in _golden_entries(file_name)]
+
+
+class CatalogueDiff:
+    """What a captured inventory got wrong compared with the golden catalogue"""
+
+    def __init__(self):
+        self.missing = []
+        self.unexpected = []
+        # name -> [(field, expected, actual)]
+        self.mismatches = {}
+
+    @property
+    def ok(self):
+        return not (self.missing or self.unexpected or self.mismatches)
+
+    def problems(self, name=None):
+        """Readable problems for one item, or for the whole catalogue when name is None"""
+        names = [name] if name is not None else list(self.mismatches) + self.missing + self.unexpected
+        problems = []
+        for item in dict.fromkeys(names):
+            if item in self.missing:
+                problems.append(f"{item} is missing from the inventory")
+            if item in self.unexpected:
+                problems.append(f"{item} is in the inventory but not in the golden catalogue")
+            for field, expected, actual in self.mismatches.get(item, []):
+                problems.append(f"{item} {field}: expected {expected!r}, got {actual!r}")
+        return problems
+
+
+def diff_catalogue(golden, captured):
+    """Compare captured Products with the golden {name: Product} in a single pass"""
+    diff = CatalogueDiff()
+    seen = set()
+    for product in captured:
+        expected = golden.get(product.name)
+        if expected is None:
+            diff.unexpected.append(product.name)
+            continue
+        seen.add(product.name)
+        for field, wanted, got in (("description", expected.description, product.description),
+                                   ("price", expected.price, product.price),
+                                   ("image", image_stem(expected.image), image_stem(product.image)),
+                                   ("item id", expected.item_id, product.item_id),
+                                   ("button id", expected.button_id, product.button_id)):
+            if wanted != got:
+                diff.mismatches.setdefault(product.name, []).append((field, wanted, got))
+    diff.missing = [name for name in golden if name not in seen]
+    return diff
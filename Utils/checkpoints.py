@@ -0,0 +1,84 @@
+import time
+
+from selenium.common import StaleElementReferenceException, TimeoutException
+
+from Utils.journey import JourneyStore
+
+RETRYABLE = (TimeoutException, StaleElementReferenceException)
+
+
+def is_retryable(error):
+    """Timeouts and stale elements, also when a page object re-raised them as a plain Exception"""
+    while error is not None:
+        if isinstance(error, RETRYABLE):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class CheckpointRunner:
+    """Runs a test as named steps and checkpoints cookies, storage and URL after every step that moved to
+    another page (page objects report transitions). A retryable failure restores the last checkpoint,
+    replays the steps completed since then and runs the failed step again, instead of rerunning the test.
+    Besides timeouts and stale elements, any failure of a step in which a page-object wait gave up is
+    retryable: wait_for_* helpers return False on a timeout and the step's assert is what fails."""
+
+    max_retries = 1
+    # (test, step, seconds saved against a full rerun) of every partial retry, for the summary
+    retries = []
+
+    def __init__(self, driver, test_id=None):
+        self.driver = driver
+        self.test_id = test_id
+        # (name, action) of the completed steps, in order
+        self.steps = []
+        self.elapsed = 0.0
+        # (JourneySnapshot, number of steps done when it was taken)
+        self.checkpoint = None
+        self._moved = False
+        self._wait_failed = False
+        driver.checkpoints = self
+
+    def page_changed(self):
+        self._moved = True
+
+    def wait_failed(self):
+        self._wait_failed = True
+
+    def step(self, name, action):
+        """Run action() as one step and return what it returns"""
+        attempts = 0
+        while True:
+            start = time.perf_counter()
+            self._wait_failed = False
+            try:
+                result = action()
+            except Exception as e:
+                retryable = self._wait_failed or is_retryable(e)
+                if attempts >= self.max_retries or self.checkpoint is None or not retryable:
+                    raise
+                attempts += 1
+                self._restore(name, e)
+                continue
+            self.elapsed += time.perf_counter() - start
+            self.steps.append((name, action))
+            if self._moved:
+                self._moved = False
+                self.checkpoint = (JourneyStore.capture(self.driver), len(self.steps))
+            return result
+
+    def _restore(self, name, error):
+        snapshot, done = self.checkpoint
+        print(f"Step {name} failed ({error}); restoring the checkpoint at {snapshot.url} and retrying")
+        start = time.perf_counter()
+        JourneyStore.apply(self.driver, snapshot)
+        for _, action in self.steps[done:]:
+            action()
+        self._moved = False
+        partial = time.perf_counter() - start
+        # a full rerun would repeat every completed step; this retry only paid for the restore and the replay
+        CheckpointRunner.retries.append((self.test_id, name, self.elapsed - partial))
+
+    def detach(self):
+        if getattr(self.driver, "checkpoints", None) is self:
+            del self.driver.checkpoints
@@ -0,0 +1,114 @@
+import functools
+import json
+import warnings
+from collections import Counter
+
+
+class CommandBudgetWarning(UserWarning):
+    """A test or page method went over its command budget while budgets only warn"""
+
+
+class CommandCounter:
+    """Counts the WebDriver commands (HTTP round-trips to the driver) a browser sends, by command name.
+    Every command, including ones issued through WebElements, goes through driver.execute.
+    Commands a wait sends while re-polling its condition are counted too, but not charged to budgets:
+    a wait costs what its first poll costs, however slow the page is."""
+
+    # "fail" raises when a budget is exceeded, "warn" emits a CommandBudgetWarning, "off" skips the checks
+    budget_mode = "fail"
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.counts = Counter()
+        # commands sent by the second and later polls of a wait
+        self.repolled = 0
+        self._repolling = False
+        self._execute = driver.execute
+        driver.execute = self._counting_execute
+
+    def _counting_execute(self, driver_command, params=None):
+        self.counts[driver_command] += 1
+        if self._repolling:
+            self.repolled += 1
+        return self._execute(driver_command, params)
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    @property
+    def budgeted(self):
+        """Commands charged to budgets: the total without the re-polls of waits"""
+        return self.total - self.repolled
+
+    def reset(self):
+        self.counts = Counter()
+        self.repolled = 0
+
+    def first_poll_only(self, condition):
+        """condition for WebDriverWait.until whose repeated polls are not charged to budgets"""
+        polls = 0
+
+        def counted(driver):
+            nonlocal polls
+            polls += 1
+            self._repolling = polls > 1
+            try:
+                return condition(driver)
+            finally:
+                self._repolling = False
+        return counted
+
+    def detach(self):
+        self.driver.execute = self._execute
+
+    @classmethod
+    def of(cls, driver):
+        """The counter already attached to driver, attaching one first if there is none"""
+        counter = getattr(driver, "command_counter", None)
+        if counter is None:
+            counter = driver.command_counter = cls(driver)
+        return counter
+
+    @classmethod
+    def check(cls, what, used, budget, mode=None):
+        """Fail or warn when used > budget, following mode or the session-wide budget_mode"""
+        mode = mode or cls.budget_mode
+        if mode == "off" or used <= budget:
+            return
+        message = f"{what} sent {used} WebDriver commands, budget is {budget}"
+        if mode == "warn":
+            warnings.warn(CommandBudgetWarning(message), stacklevel=3)
+        else:
+            raise Exception(message)
+
+
+def command_budget(limit, mode=None):
+    """Page-object method decorator: the call may send at most limit WebDriver commands.
+    Only checked when a CommandCounter is attached to the page's driver (the driver fixture attaches one)."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(page, *args, **kwargs):
+            counter = getattr(page.driver, "command_counter", None)
+            if counter is None:
+                return method(page, *args, **kwargs)
+            before = counter.budgeted
+            result = method(page, *args, **kwargs)
+            CommandCounter.check(f"{type(page).__name__}.{method.__name__}", counter.budgeted - before, limit, mode)
+            return result
+        wrapper.command_budget = limit
+        return wrapper
+    return decorator
+
+
+def charge_first_poll(driver, condition):
+    """condition, wrapped so only its first poll counts against budgets when driver has a CommandCounter"""
+    counter = getattr(driver, "command_counter", None)
+    return condition if counter is None else counter.first_poll_only(condition)
+
+
+def write_histograms(histograms, path):
+    """{test id: {command: count}} as JSON, chattiest test first"""
+    ordered = sorted(histograms.items(), key=lambda item: sum(item[1].values()), reverse=True)
+    with open(path, "w", encoding="utf-8") as histogram_file:
+        json.dump({test: dict(Counter(counts).most_common()) for test, counts in ordered}, histogram_file, indent=2)
@@ -0,0 +1,56 @@
+import csv
+import os
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(PROJECT_DIR, "Data")
+
+# (absolute path, as_dict, frozenset of types) -> (mtime_ns, rows); filled by read_rows, one parse per file per process
+_cache = {}
+
+
+def data_path(file_name):
+    """Absolute path of a data file given as 'login_data.csv', 'Data/login_data.csv' or an absolute path"""
+    if os.path.isabs(file_name):
+        return file_name
+    in_project = os.path.join(PROJECT_DIR, file_name)
+    return in_project if os.path.exists(in_project) else os.path.join(DATA_DIR, file_name)
+
+
+def read_rows(file_name, types=None, as_dict=True):
+    """All rows of a CSV (header skipped) as dicts or tuples, with columns cast by types {column: callable}.
+    Parsed once per process and per (types, as_dict); the cached rows are reused until the file's mtime
+    changes. Every caller gets its own dicts, so a test changing a row doesn't change it for the others."""
+    path = data_path(file_name)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise Exception(f"File not found:{path}")
+    key = (path, as_dict, frozenset((types or {}).items()))
+    cached = _cache.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = _cache[key] = (mtime, tuple(_parse_rows(path, types, as_dict)))
+    rows = cached[1]
+    return tuple(dict(row) for row in rows) if as_dict else rows
+
+
+def _parse_rows(path, types, as_dict):
+    try:
+        with open(path, newline='', encoding="utf-8") as datafile:
+            reader = csv.reader(datafile)
+            header = next(reader)
+            for line_number, row in enumerate(reader, 2):
+                yield _typed(header, row, types, as_dict, path, line_number)
+    except FileNotFoundError:
+        raise Exception(f"File not found:{path}")
+
+
+def _typed(header, row, types, as_dict, path, line_number):
+    values = list(row)
+    if types:
+        for index, column in enumerate(header):
+            if column in types and index < len(values) and values[index] != '':
+                try:
+                    values[index] = types[column](values[index])
+                except ValueError as e:
+                    raise Exception(f"Bad {column} value in {path} line {line_number}: {e}")
+    return dict(zip(header, values)) if as_dict else tuple(values)
@@ -0,0 +1,117 @@
+import queue
+import threading
+import time
+
+from selenium.common import WebDriverException
+
+
+class DriverPool:
+    """Keeps one warm browser alive for the process and hands it to one test at a time.
+    A pytest process runs its tests one after another, so a second browser would only sit idle;
+    parallel runs get a browser per xdist worker instead."""
+
+    # seconds acquire() waits for a checked-out browser before giving up
+    acquire_timeout = 60
+
+    def __init__(self, launcher, base_url):
+        self.launcher = launcher
+        self.base_url = base_url
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+        # seconds each browser launch took, for comparing launch profiles
+        self.startup_times = []
+
+    def acquire(self, reset=True):
+        """Get a browser sitting on a clean login page; reset=False hands it back exactly as it was released"""
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            driver = None
+            with self._lock:
+                if not self._drivers:
+                    driver = self._launch()
+            if driver is None:
+                try:
+                    driver = self._idle.get(timeout=self.acquire_timeout)
+                except queue.Empty:
+                    raise Exception(f"Driver pool exhausted: browser not released within {self.acquire_timeout}s")
+        if not reset:
+            return driver
+        try:
+            self.reset(driver)
+        except WebDriverException as e:
+            print(f"Resetting browser failed, relaunching: {e}")
+            driver = self._relaunch(driver)
+        return driver
+
+    def release(self, driver):
+        self._idle.put(driver)
+
+    def reset(self, driver):
+        """Close extra windows and clear cookies, localStorage (saucedemo cart) and sessionStorage"""
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        if not driver.current_url.startswith(self.base_url):
+            driver.get(self.base_url)
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.get(self.base_url)
+
+    def close_all(self):
+        with self._lock:
+            for driver in self._drivers:
+                self._quit(driver)
+            self._drivers.clear()
+
+    def _launch(self):
+        start = time.perf_counter()
+        driver = self.launcher()
+        self.startup_times.append(time.perf_counter() - start)
+        self._drivers.append(driver)
+        return driver
+
+    def _relaunch(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._quit(driver)
+            driver = self._launch()
+        driver.get(self.base_url)
+        return driver
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            print(f"Failed to quit browser: {e}")
+
+
+class DriverPools:
+    """One DriverPool per browser profile, each started the first time a test asks for that profile"""
+
+    def __init__(self, launcher_for, base_url):
+        # launcher_for(profile_name) -> a zero-argument function that starts that browser
+        self.launcher_for = launcher_for
+        self.base_url = base_url
+        self.pools = {}
+        self._lock = threading.Lock()
+
+    def get(self, profile_name):
+        with self._lock:
+            pool = self.pools.get(profile_name)
+            if pool is None:
+                pool = self.pools[profile_name] = DriverPool(self.launcher_for(profile_name), self.base_url)
+            return pool
+
+    def close_all(self):
+        for pool in self.pools.values():
+            pool.close_all()
+
+    def startup_times(self):
+        """{profile name: [launch seconds]} for every pool that started a browser"""
+        return {name: pool.startup_times for name, pool in self.pools.items() if pool.startup_times}
@@ -0,0 +1,124 @@
+from urllib.parse import urlsplit
+
+from Locators.alllocators import CheckoutPageLocators, LoginPageLocators, ProductPageLocators
+from Pages.CartPage import CartPage
+from Pages.CheckoutOverviewPage import CheckoutOverviewPage
+from Pages.CheckoutPage import CheckoutPage
+from Pages.FinishPage import FinishPage
+from Pages.LoginPage import LoginPage
+from Pages.ProductPage import ProductPage
+
+READ_STORAGE_SCRIPT = """
+return JSON.stringify({local: Object.assign({}, window.localStorage),
+                       session: Object.assign({}, window.sessionStorage)});
+"""
+
+WRITE_STORAGE_SCRIPT = """
+var storage = JSON.parse(arguments[0]);
+window.localStorage.clear();
+window.sessionStorage.clear();
+Object.keys(storage.local).forEach(function (key) { window.localStorage.setItem(key, storage.local[key]); });
+Object.keys(storage.session).forEach(function (key) { window.sessionStorage.setItem(key, storage.session[key]); });
+"""
+
+
+class Journey:
+    """A named app state and the UI steps that reach it from a clean login page"""
+
+    def __init__(self, name, steps, deep_link=None):
+        self.name = name
+        self.steps = steps
+        # used instead of steps/snapshots with --navigation deep-link
+        self.deep_link = deep_link
+
+
+class JourneySnapshot:
+    """Cookies, local/session storage and URL captured once a journey has been walked"""
+
+    def __init__(self, cookies, storage, url):
+        self.cookies = cookies
+        self.storage = storage
+        self.url = url
+
+
+class JourneyStore:
+    """Walks each journey once per process and restores it for later tests with a single navigation"""
+
+    def __init__(self):
+        self.snapshots = {}
+
+    def restore(self, driver, journey):
+        snapshot = self.snapshots.get(journey.name)
+        if snapshot is not None:
+            self.apply(driver, snapshot)
+            if driver.current_url == snapshot.url:
+                return
+            # the site sent us elsewhere (expired session, changed flow): walk it again
+            print(f"Journey {journey.name} snapshot landed on {driver.current_url}, rebuilding it")
+            driver.delete_all_cookies()
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            driver.get(LoginPageLocators.loginpageUrl)
+        journey.steps(driver)
+        self.snapshots[journey.name] = self.capture(driver)
+
+    @staticmethod
+    def capture(driver):
+        cookies = []
+        for cookie in driver.get_cookies():
+            # the real session cookie lives 10 minutes; a session cookie outlives the test run
+            cookie.pop("expiry", None)
+            cookies.append(cookie)
+        return JourneySnapshot(cookies, driver.execute_script(READ_STORAGE_SCRIPT), driver.current_url)
+
+    @staticmethod
+    def apply(driver, snapshot):
+        target = urlsplit(snapshot.url)
+        current = urlsplit(driver.current_url)
+        if (current.scheme, current.netloc) != (target.scheme, target.netloc):
+            driver.get(f"{target.scheme}://{target.netloc}/")
+        driver.delete_all_cookies()
+        for cookie in snapshot.cookies:
+            driver.add_cookie(cookie)
+        driver.execute_script(WRITE_STORAGE_SCRIPT, snapshot.storage)
+        driver.get(snapshot.url)
+
+
+def _checkout_step_one(driver):
+    LoginPage(driver).fast_login(LoginPageLocators.valid_username)
+    ProductPage(driver).click_on_cart_button()
+    CartPage(driver).click_checkout_button()
+    if not CheckoutPage(driver).wait_for_page_load("checkout-step-one"):
+        raise Exception("Journey could not reach checkout-step-one")
+
+
+def _checkout_step_two(driver, add_locators=()):
+    LoginPage(driver).fast_login(LoginPageLocators.valid_username)
+    product = ProductPage(driver)
+    for locator in add_locators:
+        product.add_single_item(locator)
+    if product.get_cart_count() != len(add_locators):
+        raise Exception(f"Expected {len(add_locators)} item(s) in cart, got {product.get_cart_count()}")
+    product.click_on_cart_button()
+    CartPage(driver).click_checkout_button()
+    checkout = CheckoutPage(driver)
+    checkout.enter_checkout_info(CheckoutPageLocators.valid_first_name, CheckoutPageLocators.valid_last_name,
+                                 CheckoutPageLocators.valid_zip_code)
+    if not checkout.wait_for_page_load("checkout-step-two"):
+        raise Exception("Journey could not reach checkout-step-two")
+
+
+def _checkout_complete(driver):
+    _checkout_step_two(driver)
+    overview = CheckoutOverviewPage(driver)
+    overview.click_finish_button()
+    if not overview.wait_for_page_load("checkout-complete"):
+        raise Exception("Journey could not reach checkout-complete")
+
+
+JOURNEYS = {journey.name: journey for journey in (
+    Journey("checkout-step-one", _checkout_step_one, lambda driver: CheckoutPage(driver).open()),
+    Journey("checkout-step-two-backpack",
+            lambda driver: _checkout_step_two(driver, [ProductPageLocators.add_back_pack_path]),
+            lambda driver: CheckoutOverviewPage(driver).open(cart=[4])),
+    Journey("checkout-complete", _checkout_complete, lambda driver: FinishPage(driver).open()),
+)}
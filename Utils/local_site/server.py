@@ -0,0 +1,104 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+SITE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(SITE_DIR, "static")
+# the golden catalogue the tests verify against is also what the stand-in sells
+CATALOGUE_PATH = os.path.join(os.path.dirname(os.path.dirname(SITE_DIR)), "Data", "catalogue.json")
+
+# every route the real site serves is rendered client-side by app.js from the same shell
+PAGES = ("/", "/index.html", "/inventory.html", "/inventory-item.html", "/cart.html",
+         "/checkout-step-one.html", "/checkout-step-two.html", "/checkout-complete.html")
+
+SHELL = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Swag Labs</title>
+<link rel="stylesheet" href="/style.css">
+</head>
+<body>
+<div id="root"></div>
+<script>window.CATALOGUE = {catalogue};</script>
+<script src="/app.js"></script>
+</body>
+</html>
+"""
+
+IMAGE = """<svg xmlns="http://www.w3.org/2000/svg" width="240" height="300" viewBox="0 0 240 300">
+<rect width="240" height="300" fill="#e8e8e8"/>
+<text x="120" y="150" font-family="Arial" font-size="14" text-anchor="middle" fill="#555">{name}</text>
+</svg>
+"""
+
+
+def load_catalogue(path=CATALOGUE_PATH):
+    with open(path, encoding="utf-8") as catalogue_file:
+        return json.load(catalogue_file)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path in PAGES:
+            self._send(200, "text/html; charset=utf-8", self.server.shell)
+        elif path in self.server.static:
+            self._send(200, *self.server.static[path])
+        elif path.startswith("/static/media/"):
+            name = path.rsplit("/", 1)[1]
+            self._send(200, "image/svg+xml", IMAGE.format(name=name).encode("utf-8"))
+        else:
+            self._send(404, "text/plain", b"Not Found")
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSauceDemo:
+    """Offline stand-in for www.saucedemo.com served from a thread inside the test process"""
+
+    def __init__(self, host="127.0.0.1", port=0, catalogue_path=CATALOGUE_PATH):
+        self.host = host
+        self.port = port
+        self.catalogue = load_catalogue(catalogue_path)
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        self.server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self.server.daemon_threads = True
+        self.server.shell = SHELL.format(catalogue=json.dumps(self.catalogue)).encode("utf-8")
+        self.server.static = {
+            "/app.js": ("application/javascript; charset=utf-8", self._read_static("app.js")),
+            "/style.css": ("text/css; charset=utf-8", self._read_static("style.css")),
+        }
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, name="local-saucedemo", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    @staticmethod
+    def _read_static(name):
+        with open(os.path.join(STATIC_DIR, name), "rb") as static_file:
+            return static_file.read()
@@ -0,0 +1,463 @@
+// Offline stand-in for www.saucedemo.com. Every page load renders from window.CATALOGUE,
+// the session-username cookie and the "cart-contents" localStorage entry, like the real site.
+(function () {
+    "use strict";
+
+    var CATALOGUE = window.CATALOGUE;
+    var USERS = ["standard_user", "locked_out_user", "problem_user", "performance_glitch_user",
+        "error_user", "visual_user"];
+    var PASSWORD = "secret_sauce";
+    var SESSION_COOKIE = "session-username";
+    var CART_KEY = "cart-contents";
+    var LOGIN_ERROR_KEY = "login-error";
+    var SORTERS = {
+        az: function (a, b) { return a.name < b.name ? -1 : a.name > b.name ? 1 : 0; },
+        za: function (a, b) { return a.name < b.name ? 1 : a.name > b.name ? -1 : 0; },
+        lohi: function (a, b) { return cents(a) - cents(b); },
+        hilo: function (a, b) { return cents(b) - cents(a); }
+    };
+
+    var page = location.pathname.replace(/^.*\//, "") || "index.html";
+    var sortOrder = "az";
+    var root = document.getElementById("root");
+
+    // ---- state -----------------------------------------------------------------------------
+
+    function getCookie(name) {
+        var parts = document.cookie ? document.cookie.split("; ") : [];
+        for (var i = 0; i < parts.length; i++) {
+            var eq = parts[i].indexOf("=");
+            if (parts[i].substring(0, eq) === name) {
+                return decodeURIComponent(parts[i].substring(eq + 1));
+            }
+        }
+        return null;
+    }
+
+    function setSession(username) {
+        document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/; max-age=600";
+    }
+
+    function clearSession() {
+        document.cookie = SESSION_COOKIE + "=; path=/; max-age=0";
+    }
+
+    function getCart() {
+        try {
+            return JSON.parse(localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            localStorage.removeItem(CART_KEY);
+        }
+    }
+
+    function addToCart(id) {
+        var cart = getCart();
+        if (cart.indexOf(id) === -1) {
+            cart.push(id);
+            setCart(cart);
+        }
+    }
+
+    function removeFromCart(id) {
+        setCart(getCart().filter(function (cartId) { return cartId !== id; }));
+    }
+
+    // ---- helpers ---------------------------------------------------------------------------
+
+    function esc(text) {
+        return String(text).replace(/&/g, "&amp;").replace(/</g, "&lt;").replace(/>/g, "&gt;")
+            .replace(/"/g, "&quot;");
+    }
+
+    function cents(product) {
+        return Math.round(parseFloat(product.price) * 100);
+    }
+
+    function money(amount) {
+        return "$" + (amount / 100).toFixed(2);
+    }
+
+    function slug(product) {
+        return product.name.toLowerCase().replace(/ /g, "-");
+    }
+
+    function findProduct(id) {
+        for (var i = 0; i < CATALOGUE.length; i++) {
+            if (CATALOGUE[i].id === id) {
+                return CATALOGUE[i];
+            }
+        }
+        return null;
+    }
+
+    function cartProducts() {
+        return getCart().map(findProduct).filter(function (product) { return product !== null; });
+    }
+
+    function imageSrc(product) {
+        return "/static/media/" + product.image;
+    }
+
+    function go(target) {
+        location.href = target;
+    }
+
+    function cartButton(product, prefix) {
+        var inCart = getCart().indexOf(product.id) !== -1;
+        var id = (inCart ? "remove" : "add-to-cart") + (prefix === undefined ? "-" + slug(product) : prefix);
+        return '<button class="btn ' + (inCart ? "btn_secondary" : "btn_primary") + ' btn_small btn_inventory" ' +
+            'data-item="' + product.id + '" id="' + esc(id) + '" name="' + esc(id) + '">' +
+            (inCart ? "Remove" : "Add to cart") + "</button>";
+    }
+
+    function errorHtml(message) {
+        return '<h3 data-test="error"><button class="error-button" type="button">' +
+            '<svg viewBox="0 0 10 10" width="10" height="10"><path d="M1 1L9 9M9 1L1 9"/></svg></button>' +
+            esc(message) + "</h3>";
+    }
+
+    // ---- page shells -----------------------------------------------------------------------
+
+    function headerHtml(secondary) {
+        var count = getCart().length;
+        return '<div id="header_container" class="header_container">' +
+            '<div class="primary_header">' +
+            '<div id="menu_button_container"><div>' +
+            '<div class="bm-burger-button"><button id="react-burger-menu-btn" type="button">Open Menu</button></div>' +
+            '<div class="bm-menu-wrap" aria-hidden="true" hidden=""><div class="bm-menu"><nav class="bm-item-list">' +
+            '<a id="inventory_sidebar_link" class="bm-item menu-item" href="inventory.html">All Items</a>' +
+            '<a id="about_sidebar_link" class="bm-item menu-item" href="https://saucelabs.com/">About</a>' +
+            '<a id="logout_sidebar_link" class="bm-item menu-item" href="#">Logout</a>' +
+            '<a id="reset_sidebar_link" class="bm-item menu-item" href="#">Reset App State</a>' +
+            "</nav></div>" +
+            '<div class="bm-cross-button"><button id="react-burger-cross-btn" type="button">Close Menu</button></div>' +
+            "</div>" +
+            '<div class="bm-overlay"></div>' +
+            "</div></div>" +
+            '<div class="header_label"><div class="app_logo">Swag Labs</div></div>' +
+            '<div id="shopping_cart_container" class="shopping_cart_container">' +
+            '<a class="shopping_cart_link" href="cart.html">' +
+            (count ? '<span class="shopping_cart_badge">' + count + "</span>" : "") +
+            "</a></div>" +
+            "</div>" +
+            '<div class="header_secondary_container">' + secondary + "</div>" +
+            "</div>";
+    }
+
+    function footerHtml() {
+        return '<footer class="footer"><ul class="social">' +
+            '<li class="social_twitter"><a href="https://twitter.com/saucelabs" target="_blank" rel="noreferrer">Twitter</a></li>' +
+            '<li class="social_facebook"><a href="https://www.facebook.com/saucelabs" target="_blank" rel="noreferrer">Facebook</a></li>' +
+            '<li class="social_linkedin"><a href="https://www.linkedin.com/company/sauce-labs/" target="_blank" rel="noreferrer">LinkedIn</a></li>' +
+            "</ul>" +
+            '<div class="footer_copy">© ' + new Date().getFullYear() +
+            " Sauce Labs. All Rights Reserved. Terms of Service | Privacy Policy</div>" +
+            "</footer>";
+    }
+
+    function shell(secondary, content) {
+        root.innerHTML = '<div id="page_wrapper" class="page_wrapper">' +
+            '<div id="contents_wrapper">' + headerHtml(secondary) + content + "</div>" +
+            footerHtml() +
+            "</div>";
+    }
+
+    function title(text) {
+        return '<span class="title" data-test="title">' + esc(text) + "</span>";
+    }
+
+    function cartItemHtml(product, withButton) {
+        return '<div class="cart_item">' +
+            '<div class="cart_quantity">1</div>' +
+            '<div class="cart_item_label">' +
+            '<a href="inventory-item.html?id=' + product.id + '" id="item_' + product.id + '_title_link">' +
+            '<div class="inventory_item_name">' + esc(product.name) + "</div></a>" +
+            '<div class="inventory_item_desc">' + esc(product.desc) + "</div>" +
+            '<div class="item_pricebar"><div class="inventory_item_price">' + money(cents(product)) + "</div>" +
+            (withButton ? cartButton(product) : "") +
+            "</div></div></div>";
+    }
+
+    // ---- pages -----------------------------------------------------------------------------
+
+    function renderLogin() {
+        var error = sessionStorage.getItem(LOGIN_ERROR_KEY);
+        sessionStorage.removeItem(LOGIN_ERROR_KEY);
+        root.innerHTML = '<div class="login_container">' +
+            '<div class="login_logo">Swag Labs</div>' +
+            '<div class="login_wrapper"><div class="login_wrapper-inner">' +
+            '<div id="login_button_container" class="form_column">' +
+            '<div class="login-box"><form>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Username" type="text" ' +
+            'data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none" value=""></div>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Password" type="password" ' +
+            'data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none" value=""></div>' +
+            '<div class="error-message-container">' + (error ? errorHtml(error) : "") + "</div>" +
+            '<input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" ' +
+            'name="login-button" value="Login">' +
+            "</form></div></div>" +
+            "</div></div>" +
+            "</div>";
+        root.querySelector("form").addEventListener("submit", function (event) {
+            event.preventDefault();
+            var username = document.getElementById("user-name").value;
+            var password = document.getElementById("password").value;
+            var message = null;
+            if (!username) {
+                message = "Epic sadface: Username is required";
+            } else if (!password) {
+                message = "Epic sadface: Password is required";
+            } else if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+                message = "Epic sadface: Username and password do not match any user in this service";
+            } else if (username === "locked_out_user") {
+                message = "Epic sadface: Sorry, this user has been locked out.";
+            }
+            if (message) {
+                root.querySelector(".error-message-container").innerHTML = errorHtml(message);
+                return;
+            }
+            setSession(username);
+            go("inventory.html");
+        });
+    }
+
+    function inventoryListHtml() {
+        return CATALOGUE.slice().sort(SORTERS[sortOrder]).map(function (product) {
+            return '<div class="inventory_item">' +
+                '<div class="inventory_item_img">' +
+                '<a href="inventory-item.html?id=' + product.id + '" id="item_' + product.id + '_img_link">' +
+                '<img alt="' + esc(product.name) + '" class="inventory_item_img" src="' + imageSrc(product) + '"></a>' +
+                "</div>" +
+                '<div class="inventory_item_description">' +
+                '<div class="inventory_item_label">' +
+                '<a href="inventory-item.html?id=' + product.id + '" id="item_' + product.id + '_title_link">' +
+                '<div class="inventory_item_name">' + esc(product.name) + "</div></a>" +
+                '<div class="inventory_item_desc">' + esc(product.desc) + "</div>" +
+                "</div>" +
+                '<div class="pricebar"><div class="inventory_item_price">' + money(cents(product)) + "</div>" +
+                cartButton(product) + "</div>" +
+                "</div>" +
+                "</div>";
+        }).join("");
+    }
+
+    function renderInventory() {
+        var options = [["az", "Name (A to Z)"], ["za", "Name (Z to A)"], ["lohi", "Price (low to high)"],
+            ["hilo", "Price (high to low)"]].map(function (option) {
+            return '<option value="' + option[0] + '"' + (option[0] === sortOrder ? " selected" : "") + ">" +
+                esc(option[1]) + "</option>";
+        }).join("");
+        shell(title("Products") +
+            '<div class="right_component"><span class="select_container">' +
+            '<select class="product_sort_container" data-test="product-sort-container">' + options + "</select>" +
+            "</span></div>",
+            '<div id="inventory_container" class="inventory_container"><div>' +
+            '<div class="inventory_list">' + inventoryListHtml() + "</div>" +
+            "</div></div>");
+        root.querySelector(".product_sort_container").addEventListener("change", function (event) {
+            sortOrder = event.target.value;
+            root.querySelector(".inventory_list").innerHTML = inventoryListHtml();
+        });
+    }
+
+    function renderItem() {
+        var product = findProduct(parseInt(new URLSearchParams(location.search).get("id"), 10));
+        var content;
+        if (product === null) {
+            content = '<div class="inventory_details_name large_size">ITEM NOT FOUND</div>';
+        } else {
+            content = '<div class="inventory_details_container">' +
+                '<div class="inventory_details_img_container">' +
+                '<img alt="' + esc(product.name) + '" class="inventory_details_img inventory_item_img" src="' +
+                imageSrc(product) + '"></div>' +
+                '<div class="inventory_details_desc_container">' +
+                '<div class="inventory_details_name large_size inventory_item_name">' + esc(product.name) + "</div>" +
+                '<div class="inventory_details_desc large_size inventory_item_desc">' + esc(product.desc) + "</div>" +
+                '<div class="inventory_details_price inventory_item_price">' + money(cents(product)) + "</div>" +
+                cartButton(product, "") +
+                "</div></div>";
+        }
+        shell('<div class="left_component"><button class="btn btn_secondary back btn_large inventory_details_back_button" ' +
+            'id="back-to-products" name="back-to-products">Back to products</button></div>',
+            '<div id="inventory_item_container" class="inventory_item_container">' +
+            '<div class="inventory_details">' + content + "</div></div>");
+    }
+
+    function renderCart() {
+        shell(title("Your Cart"),
+            '<div id="cart_contents_container" class="cart_contents_container"><div>' +
+            '<div class="cart_list"><div class="cart_quantity_label">QTY</div><div class="cart_desc_label">Description</div>' +
+            cartProducts().map(function (product) { return cartItemHtml(product, true); }).join("") +
+            "</div>" +
+            '<div class="cart_footer">' +
+            '<button class="btn btn_secondary back btn_medium" id="continue-shopping" name="continue-shopping">Continue Shopping</button>' +
+            '<button class="btn btn_action btn_medium checkout_button" id="checkout" name="checkout">Checkout</button>' +
+            "</div></div></div>");
+    }
+
+    function renderCheckoutInfo() {
+        shell(title("Checkout: Your Information"),
+            '<div id="checkout_info_container" class="checkout_info_container"><div class="checkout_info_wrapper">' +
+            '<form><div class="checkout_info">' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="First Name" type="text" ' +
+            'data-test="firstName" id="first-name" name="firstName" value=""></div>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Last Name" type="text" ' +
+            'data-test="lastName" id="last-name" name="lastName" value=""></div>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Zip/Postal Code" type="text" ' +
+            'data-test="postalCode" id="postal-code" name="postalCode" value=""></div>' +
+            '<div class="error-message-container"></div>' +
+            "</div>" +
+            '<div class="checkout_buttons">' +
+            '<button class="btn btn_secondary back btn_medium cart_cancel_link" id="cancel" name="cancel" type="button">Cancel</button>' +
+            '<input type="submit" class="submit-button btn btn_primary cart_button btn_action" id="continue" name="continue" value="Continue">' +
+            "</div></form></div></div>");
+        root.querySelector("form").addEventListener("submit", function (event) {
+            event.preventDefault();
+            var message = null;
+            if (!document.getElementById("first-name").value) {
+                message = "Error: First Name is required";
+            } else if (!document.getElementById("last-name").value) {
+                message = "Error: Last Name is required";
+            } else if (!document.getElementById("postal-code").value) {
+                message = "Error: Postal Code is required";
+            }
+            if (message) {
+                root.querySelector(".error-message-container").innerHTML = errorHtml(message);
+                return;
+            }
+            go("checkout-step-two.html");
+        });
+    }
+
+    function renderCheckoutOverview() {
+        var products = cartProducts();
+        var subtotal = products.reduce(function (sum, product) { return sum + cents(product); }, 0);
+        var tax = Math.round(subtotal * 8 / 100);
+        shell(title("Checkout: Overview"),
+            '<div id="checkout_summary_container" class="checkout_summary_container"><div>' +
+            '<div class="cart_list"><div class="cart_quantity_label">QTY</div><div class="cart_desc_label">Description</div>' +
+            products.map(function (product) { return cartItemHtml(product, false); }).join("") +
+            "</div>" +
+            '<div class="summary_info">' +
+            '<div class="summary_info_label">Payment Information:</div>' +
+            '<div class="summary_value_label">SauceCard #31337</div>' +
+            '<div class="summary_info_label">Shipping Information:</div>' +
+            '<div class="summary_value_label">Free Pony Express Delivery!</div>' +
+            '<div class="summary_info_label">Price Total</div>' +
+            '<div class="summary_subtotal_label">Item total: ' + money(subtotal) + "</div>" +
+            '<div class="summary_tax_label">Tax: ' + money(tax) + "</div>" +
+            '<div class="summary_info_label summary_total_label">Total: ' + money(subtotal + tax) + "</div>" +
+            '<div class="cart_footer">' +
+            '<button class="btn btn_secondary back btn_medium cart_cancel_link" id="cancel" name="cancel">Cancel</button>' +
+            '<button class="btn btn_action btn_medium cart_button" id="finish" name="finish">Finish</button>' +
+            "</div></div></div></div>");
+    }
+
+    function renderComplete() {
+        shell(title("Checkout: Complete!"),
+            '<div id="checkout_complete_container" class="checkout_complete_container">' +
+            '<h2 class="complete-header">Thank you for your order!</h2>' +
+            '<div class="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>' +
+            '<button class="btn btn_primary btn_small" id="back-to-products" name="back-to-products">Back Home</button>' +
+            "</div>");
+    }
+
+    var PAGES = {
+        "index.html": renderLogin,
+        "inventory.html": renderInventory,
+        "inventory-item.html": renderItem,
+        "cart.html": renderCart,
+        "checkout-step-one.html": renderCheckoutInfo,
+        "checkout-step-two.html": renderCheckoutOverview,
+        "checkout-complete.html": renderComplete
+    };
+
+    function render() {
+        (PAGES[page] || renderLogin)();
+    }
+
+    // ---- interactions ----------------------------------------------------------------------
+
+    function setMenuOpen(open) {
+        var wrap = root.querySelector(".bm-menu-wrap");
+        if (wrap) {
+            wrap.classList.toggle("bm-menu-open", open);
+            wrap.hidden = !open;
+            wrap.setAttribute("aria-hidden", open ? "false" : "true");
+        }
+    }
+
+    function toggleCartButton(button) {
+        var id = parseInt(button.getAttribute("data-item"), 10);
+        if (getCart().indexOf(id) === -1) {
+            addToCart(id);
+        } else {
+            removeFromCart(id);
+        }
+        if (page === "cart.html") {
+            renderCart();
+            return;
+        }
+        var product = findProduct(id);
+        var prefix = page === "inventory-item.html" ? "" : undefined;
+        button.outerHTML = cartButton(product, prefix);
+        var link = root.querySelector(".shopping_cart_link");
+        var count = getCart().length;
+        link.innerHTML = count ? '<span class="shopping_cart_badge">' + count + "</span>" : "";
+    }
+
+    var BUTTON_TARGETS = {
+        "continue-shopping": "inventory.html",
+        "checkout": "checkout-step-one.html",
+        "back-to-products": "inventory.html"
+    };
+
+    document.addEventListener("click", function (event) {
+        var target = event.target.closest("button, a");
+        if (!target) {
+            return;
+        }
+        var id = target.id;
+        if (id === "react-burger-menu-btn") {
+            setMenuOpen(true);
+        } else if (id === "react-burger-cross-btn") {
+            setMenuOpen(false);
+        } else if (id === "logout_sidebar_link") {
+            event.preventDefault();
+            clearSession();
+            go("./");
+        } else if (id === "reset_sidebar_link") {
+            event.preventDefault();
+            setCart([]);
+            render();
+            setMenuOpen(true);
+        } else if (target.classList.contains("error-button")) {
+            target.closest(".error-message-container").innerHTML = "";
+        } else if (target.hasAttribute("data-item")) {
+            toggleCartButton(target);
+        } else if (id === "cancel") {
+            go(page === "checkout-step-two.html" ? "inventory.html" : "cart.html");
+        } else if (id === "finish") {
+            setCart([]);
+            go("checkout-complete.html");
+        } else if (BUTTON_TARGETS.hasOwnProperty(id)) {
+            go(BUTTON_TARGETS[id]);
+        }
+    });
+
+    if (page !== "index.html" && PAGES.hasOwnProperty(page) && !getCookie(SESSION_COOKIE)) {
+        sessionStorage.setItem(LOGIN_ERROR_KEY,
+            "Epic sadface: You can only access '/" + page + "' when you are logged in.");
+        location.replace("./");
+        return;
+    }
+    render();
+}());
@@ -0,0 +1,285 @@
+"""Scan Locators/alllocators.py for slow or brittle locators and propose ID/CSS rewrites.
+
+    python -m Utils.locator_lint --capture [--base-url local]   save DOM snapshots of every page state
+    python -m Utils.locator_lint [--patch locators.patch]       classify, validate against the snapshots, emit a patch
+
+Proposals are only kept when they select exactly the same elements as the original locator in every
+saved snapshot, and at least one snapshot contains a match. Validation needs lxml and cssselect.
+Data/dom_snapshots holds the page states of the local stand-in, whose markup mirrors www.saucedemo.com
+(no ids or attributes of its own); re-capture them when either changes.
+"""
+import argparse
+import ast
+import difflib
+import os
+import re
+import sys
+
+from selenium.webdriver.common.by import By
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOCATORS_PATH = os.path.join(PROJECT_DIR, "Locators", "alllocators.py")
+SNAPSHOT_DIR = os.path.join(PROJECT_DIR, "Data", "dom_snapshots")
+
+BY_NAMES = {"ID": By.ID, "NAME": By.NAME, "CLASS_NAME": By.CLASS_NAME, "CSS_SELECTOR": By.CSS_SELECTOR,
+            "XPATH": By.XPATH, "TAG_NAME": By.TAG_NAME, "LINK_TEXT": By.LINK_TEXT,
+            "PARTIAL_LINK_TEXT": By.PARTIAL_LINK_TEXT}
+BY_ATTRIBUTES = {value: name for name, value in BY_NAMES.items()}
+
+ID_ONLY_XPATH = re.compile(r'^//\*\[@id=(["\'])([^"\']+)\1\]$')
+
+
+class Locator:
+    """One (By, value) tuple assigned in a locator class, with where it sits in the source"""
+
+    def __init__(self, owner, name, by, value, node):
+        self.owner = owner
+        self.name = name
+        self.by = by
+        self.value = value
+        self.node = node
+        self.cost, self.brittleness = classify(by, value)
+        self.proposal = None
+
+    @property
+    def label(self):
+        return f"{self.owner}.{self.name}"
+
+
+def scan(path=LOCATORS_PATH):
+    """Every (By.X, 'value') class attribute in the locators module"""
+    with open(path, encoding="utf-8") as source_file:
+        source = source_file.read()
+    locators = []
+    for owner in ast.parse(source).body:
+        if not isinstance(owner, ast.ClassDef):
+            continue
+        for statement in owner.body:
+            if not (isinstance(statement, ast.Assign) and isinstance(statement.value, ast.Tuple)):
+                continue
+            by_node, value_node = (statement.value.elts + [None, None])[:2]
+            if (isinstance(by_node, ast.Attribute) and by_node.attr in BY_NAMES
+                    and isinstance(value_node, ast.Constant) and isinstance(value_node.value, str)):
+                for target in statement.targets:
+                    locators.append(Locator(owner.name, target.id, BY_NAMES[by_node.attr], value_node.value,
+                                            statement.value))
+    return source, locators
+
+
+def classify(by, value):
+    """(cost, brittleness): cost is fast/medium/slow, brittleness is stable/positional/text-bound"""
+    if by in (By.ID, By.NAME, By.CLASS_NAME):
+        return "fast", "stable"
+    if by == By.CSS_SELECTOR:
+        positional = ":nth-" in value
+        return ("medium" if positional or " " in value.strip() else "fast"), ("positional" if positional else "stable")
+    if by == By.XPATH:
+        compact = re.sub(r"\s+", "", value)
+        if ID_ONLY_XPATH.match(compact):
+            return "medium", "stable"
+        if "text()" in compact or "contains(" in compact:
+            return "slow", "text-bound"
+        steps = [step for step in compact.split("/") if step]
+        if re.search(r"\[\d+\]", compact) or len(steps) > 2:
+            return "slow", "positional"
+        return "medium", "stable"
+    return "medium", "stable"
+
+
+def load_snapshots(directory=SNAPSHOT_DIR):
+    """{page state name: parsed lxml document} for every .html file in the snapshot folder"""
+    try:
+        from lxml import html
+    except ImportError:
+        raise Exception("lxml (and cssselect) are needed to validate locators against DOM snapshots")
+    snapshots = {}
+    if os.path.isdir(directory):
+        for file_name in sorted(os.listdir(directory)):
+            if file_name.endswith(".html"):
+                with open(os.path.join(directory, file_name), encoding="utf-8") as snapshot_file:
+                    snapshots[file_name[:-5]] = html.fromstring(snapshot_file.read())
+    return snapshots
+
+
+def select(document, by, value):
+    """Elements the locator finds in a parsed snapshot, as a set, or None if lxml can't evaluate it"""
+    try:
+        if by == By.XPATH:
+            return {element for element in document.xpath(re.sub(r"\s+", " ", value)) if hasattr(element, "tag")}
+        if by == By.ID:
+            value = f'[id="{value}"]'
+        elif by == By.CLASS_NAME:
+            value = f".{value}"
+        elif by == By.NAME:
+            value = f'[name="{value}"]'
+        elif by == By.TAG_NAME:
+            pass
+        elif by != By.CSS_SELECTOR:
+            return None
+        return set(document.cssselect(value))
+    except Exception:
+        return None
+
+
+def candidates(element):
+    """Cheaper locators for one snapshot element, most stable first"""
+    if element.get("id"):
+        yield By.ID, element.get("id")
+    if element.get("data-test"):
+        yield By.CSS_SELECTOR, f'[data-test="{element.get("data-test")}"]'
+    classes = element.get("class", "").split()
+    for class_name in classes:
+        yield By.CSS_SELECTOR, f".{class_name}"
+    parent = element.getparent()
+    if parent is not None:
+        for class_name in parent.get("class", "").split():
+            yield By.CSS_SELECTOR, f".{class_name} > {element.tag}"
+    ancestor = next((parent for parent in element.iterancestors() if parent.get("id")), None)
+    if ancestor is not None:
+        for class_name in classes:
+            yield By.CSS_SELECTOR, f"#{ancestor.get('id')} .{class_name}"
+        yield By.CSS_SELECTOR, f"#{ancestor.get('id')} {element.tag}"
+
+
+def propose(locator, snapshots):
+    """First candidate that selects the same elements as the original in every snapshot, or None"""
+    matches = {name: select(document, locator.by, locator.value) for name, document in snapshots.items()}
+    if any(found is None for found in matches.values()):
+        return None
+    seen = [found for found in matches.values() if found]
+    if not seen:
+        return None
+    for by, value in candidates(next(iter(seen[0]))):
+        if (by, value) == (locator.by, locator.value):
+            return None
+        if all(select(document, by, value) == matches[name] for name, document in snapshots.items()):
+            return by, value
+    return None
+
+
+def render(by, value):
+    return f"(By.{BY_ATTRIBUTES[by]}, {value!r})"
+
+
+def build_patch(source, locators, path=LOCATORS_PATH):
+    """Unified diff (git apply-able) replacing each locator tuple that has a validated proposal"""
+    lines = source.splitlines(keepends=True)
+    for locator in sorted((loc for loc in locators if loc.proposal), key=lambda loc: loc.node.col_offset, reverse=True):
+        node = locator.node
+        if node.lineno != node.end_lineno:
+            continue
+        line = lines[node.lineno - 1]
+        start = len(line.encode("utf-8")[:node.col_offset].decode("utf-8"))
+        end = len(line.encode("utf-8")[:node.end_col_offset].decode("utf-8"))
+        lines[node.lineno - 1] = line[:start] + render(*locator.proposal) + line[end:]
+    relative = os.path.relpath(path, PROJECT_DIR).replace(os.sep, "/")
+    return "".join(difflib.unified_diff(source.splitlines(keepends=True), lines,
+                                        f"a/{relative}", f"b/{relative}"))
+
+
+def lint(snapshot_dir=SNAPSHOT_DIR, path=LOCATORS_PATH):
+    source, locators = scan(path)
+    snapshots = load_snapshots(snapshot_dir)
+    for locator in locators:
+        if snapshots and (locator.cost != "fast" or locator.brittleness != "stable"):
+            locator.proposal = propose(locator, snapshots)
+    return source, locators, snapshots
+
+
+def capture(base_url, snapshot_dir=SNAPSHOT_DIR, profile_name="headless-firefox"):
+    """Walk every page state the locators target with a real browser and save its DOM"""
+    from Locators.alllocators import (CheckoutPageLocators, LoginPageLocators, OtherPageLocators,
+                                      ProductPageLocators, set_base_url)
+    from Pages.CartPage import CartPage
+    from Pages.CheckoutOverviewPage import CheckoutOverviewPage
+    from Pages.CheckoutPage import CheckoutPage
+    from Pages.LoginPage import LoginPage
+    from Utils.browser_profiles import PROFILES
+    from Utils.local_site.server import LocalSauceDemo
+    from Utils.workers import WorkerDirs
+
+    site = LocalSauceDemo().start() if base_url == "local" else None
+    set_base_url(site.url if site else base_url)
+    worker_dirs = WorkerDirs(os.path.join(PROJECT_DIR, "artifacts"), "locator-lint")
+    driver = PROFILES[profile_name].launch(worker_dirs)
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    def save(name):
+        with open(os.path.join(snapshot_dir, f"{name}.html"), "w", encoding="utf-8") as snapshot_file:
+            snapshot_file.write(driver.execute_script("return document.documentElement.outerHTML;"))
+        print(f"saved {name}")
+
+    try:
+        login_page = LoginPage(driver)
+        driver.get(LoginPageLocators.loginpageUrl)
+        save("login")
+        login_page.click_element(LoginPageLocators.login_button)
+        login_page.find_element(LoginPageLocators.error_field_path)
+        save("login-error")
+        login_page.login(LoginPageLocators.valid_username, LoginPageLocators.valid_password)
+        login_page.wait_for_page_load("inventory")
+        save("inventory")
+        login_page.click_element(OtherPageLocators.menu_button_path)
+        login_page.find_element(OtherPageLocators.logout_path)
+        save("inventory-menu")
+        login_page.click_element(OtherPageLocators.menu_close_path)
+        login_page.click_element(ProductPageLocators.add_back_pack_path)
+        driver.get(ProductPageLocators.ProductPageUrl.replace("inventory.html", "inventory-item.html?id=4"))
+        login_page.find_element(ProductPageLocators.back_to_product)
+        save("inventory-item")
+        login_page.click_element(ProductPageLocators.cart_button_path)
+        login_page.wait_for_page_load("cart")
+        save("cart")
+        CartPage(driver).click_checkout_button()
+        checkout_page = CheckoutPage(driver)
+        checkout_page.wait_for_page_load("checkout-step-one")
+        save("checkout-step-one")
+        checkout_page.click_continue_button()
+        checkout_page.find_element(CheckoutPageLocators.error_message_path)
+        save("checkout-step-one-error")
+        checkout_page.enter_checkout_info(CheckoutPageLocators.valid_first_name, CheckoutPageLocators.valid_last_name,
+                                          CheckoutPageLocators.valid_zip_code)
+        checkout_page.wait_for_page_load("checkout-step-two")
+        save("checkout-step-two")
+        CheckoutOverviewPage(driver).click_finish_button()
+        checkout_page.wait_for_page_load("checkout-complete")
+        save("checkout-complete")
+    finally:
+        driver.quit()
+        worker_dirs.remove_profiles()
+        if site:
+            site.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--snapshots", default=SNAPSHOT_DIR, help="folder of saved DOM snapshots (*.html)")
+    parser.add_argument("--patch", help="write the validated rewrites to this file instead of stdout")
+    parser.add_argument("--capture", action="store_true", help="save fresh DOM snapshots with a browser first")
+    parser.add_argument("--base-url", default="https://www.saucedemo.com/",
+                        help="site to capture from; 'local' uses the bundled offline stand-in")
+    args = parser.parse_args(argv)
+
+    if args.capture:
+        capture(args.base_url, args.snapshots)
+    source, locators, snapshots = lint(args.snapshots)
+    print(f"{len(locators)} locators, {len(snapshots)} DOM snapshot(s)")
+    for locator in locators:
+        if locator.cost == "fast" and locator.brittleness == "stable":
+            continue
+        if locator.proposal:
+            advice = f"-> {render(*locator.proposal)}"
+        else:
+            advice = "(no validated replacement)" if snapshots else "(capture snapshots to get a proposal)"
+        print(f"{locator.cost:6} {locator.brittleness:10} {locator.label}: {render(locator.by, locator.value)} {advice}")
+    patch = build_patch(source, locators)
+    if args.patch:
+        with open(args.patch, "w", encoding="utf-8") as patch_file:
+            patch_file.write(patch)
+        print(f"wrote {sum(1 for locator in locators if locator.proposal)} rewrite(s) to {args.patch}")
+    elif patch:
+        sys.stdout.write(patch)
+
+
+if __name__ == "__main__":
+    main()
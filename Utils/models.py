@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+
+
+def to_cents(price):
+    """Integer cents from '$29.99', 'Item total: $29.99', '29.99', 29.99 or Decimal"""
+    if isinstance(price, str):
+        price = price.rsplit("$", 1)[-1].strip()
+    try:
+        return int((Decimal(str(price)) * 100).to_integral_value())
+    except InvalidOperation:
+        raise ValueError(f"Not a price: {price!r}")
+
+
+def format_price(cents):
+    """'$29.99' as the site shows it"""
+    return f"${cents // 100}.{cents % 100:02d}"
+
+
+@dataclass(frozen=True, slots=True)
+class Product:
+    """One catalogue item as a page shows it; equal when name, description, price and image match"""
+    name: str
+    description: str = ""
+    price_cents: int = 0
+    image: str = ""
+    # where it sat on the page (item_4, add-to-cart-... / remove-...), not part of equality
+    item_id: str = field(default="", compare=False)
+    button_id: str = field(default="", compare=False)
+
+    @property
+    def price(self):
+        return format_price(self.price_cents)
+
+
+@dataclass(frozen=True, slots=True)
+class CartLine:
+    """One row of the cart or the checkout overview"""
+    product: Product
+    quantity: int = 1
+
+    @property
+    def name(self):
+        return self.product.name
+
+    @property
+    def price_cents(self):
+        return self.product.price_cents
@@ -1,23 +1,27 @@
-from Locators.alllocators import ProductPageLocators
+from Pages.BasePage import BasePage
+from Utils.models import Product, to_cents
 
 
 class ProductVerifier:
     @staticmethod
-    def verify_product_details(actual:dict,expected:dict,page_name:str):
-        assert actual['name'] == expected['name'],f"{page_name} name mismatch: {actual['name']} != {expected['name']}"
-        assert actual['price']==expected['price'],f"{page_name} price mismatch: {actual['price']}!= {expected['price']}"
-        if 'desc' in expected:
-            assert actual['desc'] ==expected['desc'],f"{page_name} desc mismatch: {actual['desc']}!= {expected['desc']}"
-        if 'image' in expected:
-            assert actual['image'] ==expected['image'],f"{page_name} image mismatch: {actual['image']}!= {expected['image']}"
+    def verify_product_details(actual:Product,expected:Product,page_name:str):
+        assert actual.name == expected.name,f"{page_name} name mismatch: {actual.name} != {expected.name}"
+        assert actual.price_cents==expected.price_cents,f"{page_name} price mismatch: {actual.price}!= {expected.price}"
+        if expected.description:
+            assert actual.description ==expected.description,f"{page_name} desc mismatch: {actual.description}!= {expected.description}"
+        if expected.image:
+            assert actual.image ==expected.image,f"{page_name} image mismatch: {actual.image}!= {expected.image}"
     @staticmethod
-    def get_product_dictionary(element,include_desc=True,include_image=True):
-        details={
-            'name':element.find_element(ProductPageLocators.inventory_name_class_path).text,
-            'price':float(element.find_element(ProductPageLocators.inventory_price_class_path).text.replace('$',''))
-        }
+    def get_product(element,include_desc=True,include_image=True):
+        """Product read from one product card element; description/image left empty when not asked for"""
+        fields={'name':['.inventory_item_name','text'],'price':['.inventory_item_price','text']}
         if include_desc:
-            details['desc']=element.find_element(ProductPageLocators.inventory_desc_class_path).text
+            fields['description']=['.inventory_item_desc','text']
         if include_image:
-            details['image']=element.find_element(ProductPageLocators.inventory_img_class_path).get_attribute('src')
-        return details
+            fields['image']=['.inventory_item_img img','src']
+        # element.parent is the driver; one get_records call reads every field of this product card
+        details=BasePage(element.parent).get_records(None,fields,root=element)[0]
+        return Product(name=details['name'],
+                       description=details.get('description',''),
+                       price_cents=to_cents(details['price']),
+                       image=details.get('image',''))
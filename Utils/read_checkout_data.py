@@ -1,12 +1,4 @@
-import csv
+from Utils.data_provider import read_rows
 def read_checkout_data(file_path):
-    try:
-        with open(file_path,newline='') as csvfile:
-            reader=csv.DictReader(csvfile)
-            data = list(reader)
-            #data=list(csv.reader(csvfile))
-            return data
-    except FileNotFoundError:
-        raise Exception(f"File not found:{file_path}")
-    except Exception as e:
-        raise Exception(f"Error reading file:{e}")
\ No newline at end of file
+    """Rows as dicts keyed by the header; kept for older tests, see Utils.data_provider"""
+    return list(read_rows(file_path))
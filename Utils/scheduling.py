@@ -0,0 +1,66 @@
+import json
+import os
+import statistics
+
+# seconds assumed for a test nothing is known about: roughly one browser test with a login
+DEFAULT_ESTIMATE = 5.0
+# weight of the latest run when merging it into the stored duration
+SMOOTHING = 0.5
+
+
+class DurationStore:
+    """Per-test durations (setup + call + teardown seconds) kept between runs in a local JSON file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.durations = {}
+        self.current = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as durations_file:
+                self.durations = json.load(durations_file)
+
+    def record(self, nodeid, seconds):
+        self.current[nodeid] = self.current.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        for nodeid, seconds in self.current.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = seconds if previous is None else \
+                SMOOTHING * seconds + (1 - SMOOTHING) * previous
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as durations_file:
+            json.dump(dict(sorted(self.durations.items())), durations_file, indent=2)
+
+    def estimate(self, nodeid):
+        """Stored duration, else the median of the same test's other parameters, of its module, of every
+        known test, else DEFAULT_ESTIMATE"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        function = nodeid.split("[")[0]
+        module = nodeid.split("::")[0]
+        for prefix in (function + "[", module + "::", ""):
+            known = [seconds for known_id, seconds in self.durations.items() if known_id.startswith(prefix)]
+            if known:
+                return statistics.median(known)
+        return DEFAULT_ESTIMATE
+
+
+def make_duration_scheduler(config, log, store):
+    """xdist scheduler handing out work longest-first: every time a worker runs low it gets the longest unit
+    left, so the long tests start early and the short ones fill the tail (LPT list scheduling).
+    xdist_group tests stay together as one unit whose cost is the sum of its tests."""
+    from xdist.scheduler import LoadGroupScheduling
+
+    class DurationScheduling(LoadGroupScheduling):
+        sorted_workqueue = False
+
+        def _assign_work_unit(self, node):
+            if not self.sorted_workqueue:
+                units = sorted(self.workqueue.items(),
+                               key=lambda unit: -sum(store.estimate(nodeid) for nodeid in unit[1]))
+                self.workqueue.clear()
+                self.workqueue.update(units)
+                self.sorted_workqueue = True
+            super()._assign_work_unit(node)
+
+    return DurationScheduling(config, log)
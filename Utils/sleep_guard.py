@@ -0,0 +1,29 @@
+import ast
+
+
+def find_sleep_calls(source):
+    """Line numbers of time.sleep(...) calls, including `from time import sleep` aliases"""
+    tree = ast.parse(source)
+    time_names = {"time"}
+    sleep_names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name == "time":
+                    time_names.add(alias.asname or alias.name)
+        elif isinstance(node, ast.ImportFrom) and node.module == "time":
+            for alias in node.names:
+                if alias.name == "sleep":
+                    sleep_names.add(alias.asname or alias.name)
+
+    lines = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if (isinstance(func, ast.Attribute) and func.attr == "sleep"
+                and isinstance(func.value, ast.Name) and func.value.id in time_names):
+            lines.append(node.lineno)
+        elif isinstance(func, ast.Name) and func.id in sleep_names:
+            lines.append(node.lineno)
+    return sorted(lines)
@@ -0,0 +1,83 @@
+import functools
+import inspect
+import json
+import os
+import time
+
+
+class StepTimer:
+    """Times page-object calls per test; methods are only wrapped once enable() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self.test_id = None
+        self.steps = []
+        self._origin = time.perf_counter()
+        self._depth = 0
+
+    def enable(self, base_class):
+        """Wrap the public methods of base_class and every subclass defined so far (later ones wrap themselves)"""
+        self.enabled = True
+        self._origin = time.perf_counter()
+        classes = [base_class]
+        while classes:
+            cls = classes.pop()
+            self.instrument(cls)
+            classes.extend(cls.__subclasses__())
+
+    def instrument(self, cls):
+        for name, method in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(method) or getattr(method, "timed", False):
+                continue
+            setattr(cls, name, self._timed(f"{cls.__name__}.{name}", method))
+
+    def _timed(self, step, method):
+        @functools.wraps(method)
+        def wrapper(page, *args, **kwargs):
+            start = time.perf_counter()
+            self._depth += 1
+            failed = True
+            try:
+                result = method(page, *args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self._depth -= 1
+                self.steps.append({
+                    "test": self.test_id,
+                    "step": step,
+                    "locator": self._locator(args),
+                    "start": round(start - self._origin, 6),
+                    "seconds": round(time.perf_counter() - start, 6),
+                    "depth": self._depth,
+                    "failed": failed,
+                })
+        wrapper.timed = True
+        return wrapper
+
+    @staticmethod
+    def _locator(args):
+        # BasePage methods take a (By, value) tuple first; page-object methods mostly take none
+        if args and isinstance(args[0], tuple) and len(args[0]) == 2:
+            return f"{args[0][0]}={args[0][1]}"
+        return None
+
+    def slowest(self, count):
+        """(step, locator, calls, total seconds, max seconds), slowest total first"""
+        totals = {}
+        for record in self.steps:
+            key = (record["step"], record["locator"])
+            calls, total, longest = totals.get(key, (0, 0.0, 0.0))
+            totals[key] = (calls + 1, total + record["seconds"], max(longest, record["seconds"]))
+        ranked = sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+        return [(step, locator, *numbers) for (step, locator), numbers in ranked[:count]]
+
+    def write(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as timeline_file:
+            json.dump({"steps": self.steps}, timeline_file, indent=1)
+
+
+step_timer = StepTimer()
@@ -0,0 +1,66 @@
+OPEN_URL_SCRIPT = "window.location.href = arguments[0];"
+
+
+class TabSet:
+    """Pages loading side by side in tabs of one browser, then used one tab at a time.
+    Tabs share the browser's cookies and storage, so they are all logged in if the first one was."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.main_window = driver.current_window_handle
+        # key -> window handle, in the order the tabs were opened
+        self.handles = {}
+
+    def open(self, pages):
+        """pages: {key: url}. Navigation is started from script so it doesn't block, and every tab loads at once."""
+        for key, url in pages.items():
+            self.driver.switch_to.new_window("tab")
+            self.handles[key] = self.driver.current_window_handle
+            self.driver.execute_script(OPEN_URL_SCRIPT, url)
+        self.driver.switch_to.window(self.main_window)
+        return self
+
+    def is_open(self, key):
+        return key in self.handles and self.handles[key] in self.driver.window_handles
+
+    def focus(self, key):
+        self.driver.switch_to.window(self.handles[key])
+
+    def close_tab(self, key):
+        self.driver.switch_to.window(self.handles.pop(key))
+        self.driver.close()
+        self.driver.switch_to.window(self.main_window)
+
+
+class ReadOnlyTabs:
+    """--read-only-tabs: read-only tests that run back to back share one logged-in browser from the pool.
+    The first of them opens a tab per test, so the later pages load while the earlier tests run; each
+    test then takes its own tab and closes it. If anything reset the browser in between (another test,
+    a session fixture), the missing tabs are simply opened again."""
+
+    max_tabs = 8
+
+    def __init__(self):
+        self.tabs = None
+
+    def take(self, pool, key, upcoming, login):
+        """Browser focused on key's tab. upcoming is [(key, url)] for this test and the read-only tests
+        queued right after it; they get tabs when key has none yet. login(driver) logs the browser in."""
+        reuse = self.tabs is not None and key in self.tabs.handles
+        driver = pool.acquire(reset=not reuse)
+        if reuse and (self.tabs.driver is not driver or not self.tabs.is_open(key)):
+            pool.release(driver)
+            driver = pool.acquire()
+            reuse = False
+        if not reuse:
+            login(driver)
+            self.tabs = TabSet(driver).open(dict(upcoming[:self.max_tabs]))
+        self.tabs.focus(key)
+        return driver
+
+    def give_back(self, pool, key):
+        driver = self.tabs.driver
+        try:
+            self.tabs.close_tab(key)
+        finally:
+            pool.release(driver)
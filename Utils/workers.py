@@ -0,0 +1,27 @@
+import os
+import shutil
+import tempfile
+
+
+def get_worker_id():
+    """pytest-xdist worker name (gw0, gw1, ...) or 'master' when running serially"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+class WorkerDirs:
+    """Per-worker folders so parallel browsers never share a profile or downloads; failure screenshots
+    are written by Utils/artifacts.py under <root>/failures"""
+
+    def __init__(self, root, worker_id):
+        self.worker_id = worker_id
+        self.root = os.path.join(root, worker_id)
+        self.profiles = os.path.join(self.root, "profiles")
+        self.downloads = os.path.join(self.root, "downloads")
+        for path in (self.profiles, self.downloads):
+            os.makedirs(path, exist_ok=True)
+
+    def new_profile(self):
+        return tempfile.mkdtemp(prefix="profile-", dir=self.profiles)
+
+    def remove_profiles(self):
+        shutil.rmtree(self.profiles, ignore_errors=True)
@@ -1,14 +1,465 @@
+import os
+
 import pytest
-from selenium import webdriver
+
+from Locators.alllocators import LoginPageLocators, set_base_url
+from Pages.BasePage import BasePage
+from Pages.LoginPage import LoginPage
+from Pages.ProductPage import ProductPage
+from Utils.browser_profiles import PROFILES
+from Utils.affected import DependencyIndex, git_changes
+from Utils.artifacts import ArtifactWriter, save_failure
+from Utils.catalogue import diff_catalogue, load_golden
+from Utils.checkpoints import CheckpointRunner
+from Utils.command_counter import CommandCounter, write_histograms
+from Utils.driver_pool import DriverPools
+from Utils.journey import JOURNEYS, JourneyStore
+from Utils.local_site.server import LocalSauceDemo
+from Utils.scheduling import DurationStore, make_duration_scheduler
+from Utils.sleep_guard import find_sleep_calls
+from Utils.step_timer import step_timer
+from Utils.tabs import ReadOnlyTabs
+from Utils.workers import WorkerDirs, get_worker_id
+
+
+def pytest_addoption(parser):
+    parser.addoption("--base-url", action="store", default=LoginPageLocators.loginpageUrl,
+                     help="Site under test; 'local' serves the bundled offline stand-in from the test process")
+    parser.addoption("--browser-profile", action="store", default="headed-firefox", choices=sorted(PROFILES),
+                     help="Browser launch profile (engine, headless, viewport, images, page load strategy)")
+    parser.addoption("--browsers", action="store", default=None, metavar="PROFILE,PROFILE",
+                     help="Browser matrix: run every driver test once per listed profile, e.g. "
+                          "headless-firefox,headless-chromium; use -n 2 or more to run the browsers side by side")
+    parser.addoption("--ui-login", action="store_true", default=False,
+                     help="Make LoginPage.fast_login drive the login form instead of replaying the session cookie")
+    parser.addoption("--artifacts-dir", action="store", default="artifacts",
+                     help="Root folder for per-worker browser profiles, downloads and failure artifacts")
+    parser.addoption("--schedule", action="store", default="duration", choices=("duration", "xdist"),
+                     help="With -n: duration hands the longest tests out first using timings from earlier runs; "
+                          "xdist keeps xdist's own load distribution")
+    parser.addoption("--durations-file", action="store", default=None, metavar="PATH",
+                     help="Where per-test durations are kept between runs (default <artifacts-dir>/test_durations.json)")
+    parser.addoption("--navigation", action="store", default="ui", choices=("ui", "deep-link"),
+                     help="How fixtures reach cart/checkout/detail pages: click through the app or open() by URL")
+    parser.addoption("--external-links", action="store", default="intercept", choices=("intercept", "follow"),
+                     help="intercept: record where footer/About links go without leaving the browser (works offline); "
+                          "follow: really open the third-party sites")
+    parser.addoption("--step-timings", action="store", default=None, metavar="PATH",
+                     help="Time every BasePage and page-object call and write the JSON timeline to PATH")
+    parser.addoption("--slowest-steps", action="store", type=int, default=10,
+                     help="How many of the slowest steps/locators to list when --step-timings is on")
+    parser.addoption("--affected-by", action="store", default=None, metavar="REF",
+                     help="Only run tests whose fixtures, page methods or locators changed since git REF "
+                          "(working tree included); see Utils/affected.py")
+    parser.addoption("--step-retries", action="store", type=int, default=1,
+                     help="How often a checkpointed step that timed out or hit a stale element is retried from "
+                          "the last checkpoint (0 turns the retries off)")
+    parser.addoption("--command-budgets", action="store", default="fail", choices=("fail", "warn", "off"),
+                     help="What to do when a test or page method sends more WebDriver commands than its budget")
+    parser.addoption("--command-counts", action="store", default=None, metavar="PATH",
+                     help="Write the per-test WebDriver command histogram as JSON to PATH")
+    parser.addoption("--chattiest-tests", action="store", type=int, default=5,
+                     help="How many tests with the most WebDriver commands to list in the summary")
+    parser.addoption("--read-only-tabs", action="store_true", default=False,
+                     help="Run back-to-back @pytest.mark.read_only tests in tabs of one logged-in browser, "
+                          "the later tabs loading while the earlier tests run")
+
+
+def pytest_configure(config):
+    LoginPage.use_fast_login = not config.getoption("--ui-login")
+    BasePage.deep_link_navigation = config.getoption("--navigation") == "deep-link"
+    BasePage.intercept_external_links = config.getoption("--external-links") == "intercept"
+    # page methods stay unwrapped unless asked for, so a normal run pays nothing for the timer
+    if config.getoption("--step-timings"):
+        step_timer.enable(BasePage)
+        BasePage.record_wait_timings = True
+    unknown = [name for name in browser_matrix(config) if name not in PROFILES]
+    if unknown:
+        raise pytest.UsageError(f"--browsers: unknown profile(s) {', '.join(unknown)}; "
+                                f"choose from {', '.join(sorted(PROFILES))}")
+    CommandCounter.budget_mode = config.getoption("--command-budgets")
+    CheckpointRunner.max_retries = config.getoption("--step-retries")
+    config.addinivalue_line("markers", "command_budget(limit, mode=None): the test may send at most limit "
+                                       "WebDriver commands; mode overrides --command-budgets")
+    config.addinivalue_line("markers", "read_only(page='inventory.html'): the test only reads pages as the standard "
+                                       "user, starting from page; with --read-only-tabs it runs in a shared tab")
+    # with -n, keep tests marked @pytest.mark.xdist_group("name") on one worker; ungrouped tests are spread as usual
+    if getattr(config.option, "dist", "no") == "load":
+        config.option.dist = "loadgroup"
+    # durations are recorded by the process that sees every report: the xdist controller, or the only process
+    global duration_store
+    if get_worker_id() == "master":
+        path = config.getoption("--durations-file") or \
+            os.path.join(config.getoption("--artifacts-dir"), "test_durations.json")
+        duration_store = DurationStore(str(config.rootpath / path))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if config.getoption("--schedule") == "duration" and config.option.dist == "loadgroup":
+        return make_duration_scheduler(config, log, duration_store)
+    return None
+
+
+def pytest_runtest_logreport(report):
+    if duration_store is not None:
+        duration_store.record(report.nodeid, report.duration)
+
+
+def browser_matrix(config):
+    """Profile names given with --browsers, or [] when not running a matrix"""
+    value = config.getoption("--browsers")
+    return [name.strip() for name in value.split(",") if name.strip()] if value else []
+
+
+def primary_profile(config):
+    """Profile used by tests outside the matrix (driver_pool, catalogue_diff): first --browsers entry or --browser-profile"""
+    return (browser_matrix(config) or [config.getoption("--browser-profile")])[0]
+
+
+def pytest_generate_tests(metafunc):
+    matrix = browser_matrix(metafunc.config)
+    if matrix and "browser_profile" in metafunc.fixturenames:
+        metafunc.parametrize("browser_profile", matrix, indirect=True)
+
+
+def affected_tests(config):
+    """Test ids selected by --affected-by. The index is built once, by the controller under xdist, and handed to
+    the workers, so they don't all rebuild (and rewrite) artifacts/dependency_index.json at the same moment."""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None and "affected_tests" in workerinput:
+        return set(workerinput["affected_tests"])
+    if affected_tests_key not in config.stash:
+        index = DependencyIndex().build()
+        config.stash[affected_tests_key] = set(index.affected(git_changes(config.getoption("--affected-by")))[0])
+    return config.stash[affected_tests_key]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    if node.config.getoption("--affected-by"):
+        node.workerinput["affected_tests"] = sorted(affected_tests(node.config))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--affected-by"):
+        selected = affected_tests(config)
+        deselected = [item for item in items if item.nodeid.split("[")[0] not in selected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item.nodeid.split("[")[0] in selected]
+    if config.getoption("--read-only-tabs"):
+        group_read_only(items)
+
+
+def group_read_only(items):
+    """Move each module's read_only tests next to the first of them and keep them on one xdist worker,
+    so they run back to back and can share the tabs the first one opens"""
+    modules = {}
+    for item in items:
+        if item.get_closest_marker("read_only"):
+            modules.setdefault(item.nodeid.split("::")[0], []).append(item)
+    grouped = []
+    for item in items:
+        if not item.get_closest_marker("read_only"):
+            grouped.append(item)
+            continue
+        module = item.nodeid.split("::")[0]
+        if module in modules:
+            for read_only_item in modules.pop(module):
+                read_only_item.add_marker(pytest.mark.xdist_group(f"read-only-tabs:{module}"))
+                grouped.append(read_only_item)
+    items[:] = grouped
+
+
+def read_only_url(item, base_url):
+    marker = item.get_closest_marker("read_only")
+    return base_url + (marker.args[0] if marker and marker.args else "inventory.html")
+
+
+def upcoming_read_only(request, base_url):
+    """[(test id, url)] of this test and the read_only tests queued right after it for the same browser"""
+    def profile(item):
+        callspec = getattr(item, "callspec", None)
+        return callspec.params.get("browser_profile") if callspec else None
+
+    items = request.session.items
+    upcoming = []
+    for item in items[items.index(request.node):]:
+        if not item.get_closest_marker("read_only") or profile(item) != profile(request.node):
+            break
+        upcoming.append((item.nodeid, read_only_url(item, base_url)))
+    return upcoming
+
+
+def pytest_collect_file(file_path, parent):
+    # fixed sleeps were most of the suite's runtime; use the BasePage wait_for_* primitives instead
+    tests_dir = parent.config.rootpath / "Tests"
+    if file_path.suffix == ".py" and file_path.is_relative_to(tests_dir):
+        lines = find_sleep_calls(file_path.read_text())
+        if lines:
+            pytest.fail(f"time.sleep is not allowed in {file_path.relative_to(parent.config.rootpath)} "
+                        f"(line {', '.join(map(str, lines))}); wait for a condition with BasePage instead",
+                        pytrace=False)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    step_timer.test_id = item.nodeid
+
+def _worker_path(config, path):
+    """path under rootdir, suffixed with the xdist worker (timeline.gw0.json) so workers don't overwrite each other"""
+    worker_id = get_worker_id()
+    if worker_id != "master":
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{worker_id}{ext}"
+    return str(config.rootpath / path)
+
+# after pytest's own sessionfinish, so the session fixtures (pools, artifact writer) have been torn down
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    # an xdist worker sends what it saw to the controller, which prints the terminal summary
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["summary"] = worker_summary(session.config)
+    path = session.config.getoption("--step-timings")
+    if path:
+        step_timer.write(_worker_path(session.config, path))
+    path = session.config.getoption("--command-counts")
+    if path and command_histograms:
+        write_histograms(command_histograms, _worker_path(session.config, path))
+    if duration_store is not None and duration_store.current:
+        duration_store.save()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    report = (yield).get_result()
+    # capture before the driver fixture hands the browser back to the pool; the writing happens in the background
+    if report.failed and report.when in ("setup", "call"):
+        driver = item.funcargs.get("driver") or item.funcargs.get("read_only_driver")
+        writer = item.funcargs.get("artifact_writer")
+        if driver is not None and writer is not None:
+            save_failure(writer, item.nodeid, driver)
+
+startup_times_key = pytest.StashKey()
+affected_tests_key = pytest.StashKey()
+artifact_stats_key = pytest.StashKey()
+# test id -> {WebDriver command: count}, filled in by the driver fixture
+command_histograms = {}
+# per-test durations across runs; None on xdist workers
+duration_store = None
+
+
+def worker_summary(config):
+    """Everything the terminal summary reports that this process collected, as plain data for the xdist channel"""
+    return {
+        "startup_times": config.stash.get(startup_times_key, {}),
+        "artifacts": config.stash.get(artifact_stats_key, None),
+        "command_histograms": command_histograms,
+        "steps": step_timer.steps,
+        "wait_timings": BasePage.wait_timings,
+        "checkpoint_retries": CheckpointRunner.retries,
+    }
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge a finished xdist worker's summary data into the controller's"""
+    summary = getattr(node, "workeroutput", {}).get("summary")
+    if not summary:
+        return
+    startup_times = node.config.stash.setdefault(startup_times_key, {})
+    for profile, times in summary["startup_times"].items():
+        startup_times.setdefault(profile, []).extend(times)
+    if summary["artifacts"]:
+        artifacts = node.config.stash.setdefault(artifact_stats_key, {"roots": [], "written": 0, "deduplicated": 0})
+        artifacts["roots"] += summary["artifacts"]["roots"]
+        artifacts["written"] += summary["artifacts"]["written"]
+        artifacts["deduplicated"] += summary["artifacts"]["deduplicated"]
+    command_histograms.update(summary["command_histograms"])
+    step_timer.steps.extend(summary["steps"])
+    BasePage.wait_timings.extend(summary["wait_timings"])
+    CheckpointRunner.retries.extend(summary["checkpoint_retries"])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if step_timer.steps:
+        terminalreporter.write_sep("-", "slowest steps")
+        for step, locator, calls, total, longest in step_timer.slowest(config.getoption("--slowest-steps")):
+            terminalreporter.write_line(f"{total:8.2f}s total {longest:6.2f}s max {calls:4d}x  {step}"
+                                        + (f"  [{locator}]" if locator else ""))
+    if config.getoption("--step-timings") and BasePage.wait_timings:
+        terminalreporter.write_sep("-", "element waits")
+        for kind in dict.fromkeys(wait[0] for wait in BasePage.wait_timings):
+            waits = [wait for wait in BasePage.wait_timings if wait[0] == kind]
+            slowest = max(waits, key=lambda wait: wait[2])
+            terminalreporter.write_line(f"{kind}: {len(waits)} call(s), {sum(w[2] for w in waits):.2f}s total, "
+                                        f"{sum(not w[3] for w in waits)} timed out, "
+                                        f"slowest {slowest[2]:.2f}s on {slowest[1]}")
+    if command_histograms:
+        terminalreporter.write_sep("-", "chattiest tests (WebDriver commands)")
+        chattiest = sorted(command_histograms.items(), key=lambda item: sum(item[1].values()), reverse=True)
+        for test, counts in chattiest[:config.getoption("--chattiest-tests")]:
+            top = ", ".join(f"{command} {count}" for command, count in
+                            sorted(counts.items(), key=lambda item: item[1], reverse=True)[:4])
+            terminalreporter.write_line(f"{sum(counts.values()):6d}  {test}  ({top})")
+    if CheckpointRunner.retries:
+        terminalreporter.write_sep("-", "checkpoint retries")
+        for test, step, saved in CheckpointRunner.retries:
+            terminalreporter.write_line(f"{saved:6.2f}s saved  {test} step '{step}'")
+        terminalreporter.write_line(f"{len(CheckpointRunner.retries)} step(s) retried from a checkpoint, "
+                                    f"{sum(saved for _, _, saved in CheckpointRunner.retries):.2f}s saved "
+                                    f"compared with rerunning the whole test")
+    artifacts = config.stash.get(artifact_stats_key, None)
+    if artifacts and artifacts["written"] + artifacts["deduplicated"]:
+        terminalreporter.write_sep("-", "failure artifacts")
+        terminalreporter.write_line(f"{', '.join(artifacts['roots'])}: {artifacts['written']} file(s) written, "
+                                    f"{artifacts['deduplicated']} identical screenshot/DOM dump(s) reused")
+    startup_times = config.stash.get(startup_times_key, {})
+    if startup_times:
+        terminalreporter.write_sep("-", "browser startup")
+        for profile, times in startup_times.items():
+            terminalreporter.write_line(f"{profile}: {len(times)} launch(es), "
+                                        f"avg {sum(times) / len(times):.2f}s, max {max(times):.2f}s")
+
+
+@pytest.fixture(scope="session")
+def worker_dirs(request):
+    root = request.config.rootpath / request.config.getoption("--artifacts-dir")
+    dirs = WorkerDirs(str(root), get_worker_id())
+    yield dirs
+    dirs.remove_profiles()
+
+
+@pytest.fixture(scope="session")
+def artifact_writer(request, worker_dirs):
+    """Background writer for screenshot, DOM, URL and cookies of failed tests (worker folder /failures)"""
+    writer = ArtifactWriter(os.path.join(worker_dirs.root, "failures"))
+    yield writer
+    writer.close()
+    request.config.stash[artifact_stats_key] = {"roots": [writer.root], "written": writer.written,
+                                                "deduplicated": writer.deduplicated}
+
+
+@pytest.fixture(scope="session")
+def base_url(request):
+    url = request.config.getoption("--base-url")
+    if url != "local":
+        set_base_url(url)
+        yield LoginPageLocators.loginpageUrl
+        return
+    site = LocalSauceDemo().start()
+    set_base_url(site.url)
+    yield site.url
+    site.stop()
+
+
+@pytest.fixture(scope="session")
+def driver_pools(request, base_url, worker_dirs):
+    """A warm pool per browser profile; with --browsers each matrix browser gets its own"""
+    pools = DriverPools(lambda name: lambda: PROFILES[name].launch(worker_dirs), base_url)
+    yield pools
+    pools.close_all()
+    request.config.stash[startup_times_key] = pools.startup_times()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, driver_pools):
+    return driver_pools.get(primary_profile(request.config))
+
+
+@pytest.fixture()
+def browser_profile(request):
+    """Name of the profile the test's driver comes from; parametrized over --browsers in a matrix run"""
+    return getattr(request, "param", primary_profile(request.config))
+
+
+def start_counting(driver):
+    # count from here so the pool's reset between tests is not charged to the test
+    counter = CommandCounter.of(driver)
+    counter.reset()
+    return counter
+
+
+def stop_counting(request, counter):
+    command_histograms[request.node.nodeid] = dict(counter.counts)
+    return counter.budgeted
+
+
+def check_command_budget(request, used):
+    marker = request.node.get_closest_marker("command_budget")
+    if marker:
+        CommandCounter.check(request.node.nodeid, used, *marker.args, **marker.kwargs)
+
+
+@pytest.fixture()
+def driver(request, driver_pools, browser_profile, artifact_writer):
+    driver_pool = driver_pools.get(browser_profile)
+    driver = driver_pool.acquire()
+    counter = start_counting(driver)
+    yield driver
+    used = stop_counting(request, counter)
+    driver_pool.release(driver)
+    check_command_budget(request, used)
+
+
+@pytest.fixture(scope="session")
+def read_only_tabs():
+    return ReadOnlyTabs()
 
 
 @pytest.fixture()
-def driver():
-    base_url = "https://www.saucedemo.com/"
-    driver=webdriver.Firefox()
-    #driver = webdriver.ChromiumEdge()
-    driver.maximize_window()
-    driver.get(base_url)
+def read_only_driver(request, driver_pools, browser_profile, base_url, artifact_writer, read_only_tabs):
+    """Logged-in browser on the page of the test's read_only mark. The test's own `driver` unless
+    --read-only-tabs, where back-to-back read_only tests share one browser and each gets its own tab."""
+    url = read_only_url(request.node, base_url)
+    if not request.config.getoption("--read-only-tabs"):
+        driver = request.getfixturevalue("driver")
+        LoginPage(driver).fast_login(LoginPageLocators.valid_username)
+        if driver.current_url != url:
+            driver.get(url)
+        yield driver
+        return
+    driver_pool = driver_pools.get(browser_profile)
+    driver = read_only_tabs.take(driver_pool, request.node.nodeid, upcoming_read_only(request, base_url),
+                                 lambda driver: LoginPage(driver).fast_login(LoginPageLocators.valid_username))
+    BasePage(driver).wait_for_page_load(url)
+    counter = start_counting(driver)
     yield driver
-    driver.quit()
+    used = stop_counting(request, counter)
+    read_only_tabs.give_back(driver_pool, request.node.nodeid)
+    check_command_budget(request, used)
+
+@pytest.fixture(scope="session")
+def catalogue_diff(driver_pool):
+    """Inventory read once per session (one batched read) and diffed against Data/catalogue.json.
+    Borrows a browser from the pool; being session-scoped it is set up before a test's `driver`, so the two mix."""
+    driver = driver_pool.acquire()
+    try:
+        LoginPage(driver).fast_login(LoginPageLocators.valid_username)
+        captured = ProductPage(driver).get_inventory_products()
+    finally:
+        driver_pool.release(driver)
+    return diff_catalogue(load_golden(), captured)
 
+@pytest.fixture()
+def checkpoints(request, driver):
+    """CheckpointRunner for writing the test as checkpoints.step(name, action) calls that retry from the last page"""
+    runner = CheckpointRunner(driver, request.node.nodeid)
+    yield runner
+    runner.detach()
+
+@pytest.fixture(scope="session")
+def journey_store():
+    return JourneyStore()
+
+@pytest.fixture()
+def journey(driver, journey_store):
+    """journey("checkout-complete") puts the browser in that state: UI steps the first time, snapshot after"""
+    def restore(name):
+        if BasePage.deep_link_navigation and JOURNEYS[name].deep_link:
+            JOURNEYS[name].deep_link(driver)
+        else:
+            journey_store.restore(driver, JOURNEYS[name])
+        return driver
+    return restore